@@ -2,7 +2,8 @@
 
 
 from .base import (BaseFaultPredictor,
-                   H1ST_MODELS_DIR_PATH, H1ST_BATCH_OUTPUT_DIR_PATH)
+                   H1ST_MODELS_DIR_PATH, H1ST_BATCH_OUTPUT_DIR_PATH,
+                   H1ST_PREDICTION_STORE_DIR_PATH)
 from .oracle.teacher.base import BaseFaultPredTeacher
 from .oracle.student.timeseries_dl import (TimeSeriesDLFaultPredStudentModeler,
                                            TimeSeriesDLFaultPredStudent)
@@ -15,4 +16,5 @@ __all__ = (
     'TimeSeriesDLFaultPredStudentModeler', 'TimeSeriesDLFaultPredStudent',
     'FaultPredOracleModeler', 'FaultPredOracle',
     'H1ST_MODELS_DIR_PATH', 'H1ST_BATCH_OUTPUT_DIR_PATH',
+    'H1ST_PREDICTION_STORE_DIR_PATH',
 )
@@ -3,18 +3,21 @@
 
 from __future__ import annotations
 
-from functools import cached_property
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property, partial
+from hashlib import sha1
+import inspect
 from logging import getLogger, Logger, DEBUG
 import os
 from pathlib import Path
 from random import random
 import time
-from typing import Literal, Optional, Union
-from typing import Dict, List   # Py3.9+: use built-ins
+from typing import Any, Iterator, Literal, Optional, Union
+from typing import Dict, List, Set   # Py3.9+: use built-ins
 from uuid import uuid4
 
 from dotenv.main import load_dotenv
-from pandas import DataFrame, Series
+from pandas import DataFrame, Series, concat
 
 from aito.util.data_proc import ParquetDataset
 from aito.util.log import STDOUT_HANDLER
@@ -23,9 +26,12 @@ from aito.util import s3
 from aito.pmfp.data_mgmt import (EquipmentParquetDataSet,
                                  EQUIPMENT_INSTANCE_ID_COL, DATE_COL)
 
+from .prediction_store import PredictionStore
+
 
 __all__ = (
     'H1ST_MODELS_DIR_PATH', 'H1ST_BATCH_OUTPUT_DIR_PATH',
+    'H1ST_PREDICTION_STORE_DIR_PATH',
 
     'BaseFaultPredictor',
 )
@@ -56,6 +62,56 @@ H1ST_BATCH_OUTPUT_DIR_PATH: Union[str, Path] = (
     else (LOCAL_HOME_DIR_PATH / BATCH_OUTPUT_DIR_NAME)
 )
 
+PREDICTION_STORE_DIR_NAME: str = 'prediction-store'
+H1ST_PREDICTION_STORE_DIR_PATH: Union[str, Path] = (
+    f'{H1ST_BATCH_OUTPUT_DIR_PATH}/{PREDICTION_STORE_DIR_NAME}'
+    if S3_BUCKET
+    else (H1ST_BATCH_OUTPUT_DIR_PATH / PREDICTION_STORE_DIR_NAME)
+)
+# local mirror of prediction store (same as store itself if not on S3)
+LOCAL_PREDICTION_STORE_DIR_PATH: Path = \
+    LOCAL_HOME_DIR_PATH / BATCH_OUTPUT_DIR_NAME / PREDICTION_STORE_DIR_NAME
+
+
+# batch-prediction kwargs not affecting prediction values
+# (hence not part of prediction store keys)
+_NON_PREDICTION_KWARGS: frozenset = frozenset(('n_workers',
+                                               'n_groups_per_task'))
+
+
+# model attributes not affecting prediction values,
+# or keyed separately (e.g., tunable decision thresholds)
+# (hence not part of model params hashes)
+_NON_PREDICTION_ATTRS: frozenset = frozenset(('version',
+                                              'has_explicit_version',
+                                              'decision_threshold'))
+
+# simple-valued model attributes included in model params hashes
+_PARAM_TYPES: tuple = bool, int, float, str
+
+
+# default number of (equipment instance ID, date) groups
+# per task dispatched to worker processes
+_N_GROUPS_PER_TASK: int = 64
+
+
+# model & prediction kwargs held by each process-pool worker
+# (set once per worker process by _init_predict_worker)
+_WORKER_MODEL: Optional[BaseFaultPredictor] = None
+_WORKER_PREDICT_KWARGS: Dict[str, Any] = {}
+
+
+def _init_predict_worker(model: BaseFaultPredictor,
+                         predict_kwargs: Dict[str, Any]):
+    global _WORKER_MODEL, _WORKER_PREDICT_KWARGS   # pylint: disable=global-statement  # noqa: E501
+    _WORKER_MODEL, _WORKER_PREDICT_KWARGS = model, predict_kwargs
+
+
+def _predict_many_in_worker(df_for_many_equipment_unit_days: DataFrame, /) \
+        -> Series:
+    return _WORKER_MODEL.predict_many(df_for_many_equipment_unit_days,
+                                      **_WORKER_PREDICT_KWARGS)
+
 
 class BaseFaultPredictor:
     # pylint: disable=too-many-ancestors
@@ -71,6 +127,10 @@ class BaseFaultPredictor:
         self.unique_type_group: str = unique_type_group
         self.version: str = version if version else str(uuid4())
 
+        # only explicitly-versioned models' predictions can be stored,
+        # as randomly-versioned ones can never be looked up again
+        self.has_explicit_version: bool = bool(version)
+
     def __repr__(self) -> str:
         """Return string repr."""
         return f'{self.unique_type_group} {type(self).__name__} "{self.version}"'  # noqa: E501
@@ -130,31 +190,176 @@ class BaseFaultPredictor:
         """
         return random()
 
+    def predict_many(self,
+                     df_for_many_equipment_unit_days: DataFrame, /,
+                     **predict_kwargs) -> Series:
+        """Predict faults for many equipment units & dates at once.
+
+        Return 1 prediction per (equipment instance ID, date) group.
+        By default, ``predict`` is applied group by group;
+        subclasses may override this with vectorized logic.
+        """
+        return (df_for_many_equipment_unit_days
+                .groupby(by=[EQUIPMENT_INSTANCE_ID_COL, DATE_COL],
+                         axis='index',
+                         level=None,
+                         as_index=True,   # group labels as index
+                         sort=False,   # better performance
+                         # when `apply`ing: add group keys to index?
+                         group_keys=False,
+                         # squeeze=False,   # deprecated
+                         observed=False,
+                         dropna=True)
+                .apply(func=self.predict, **predict_kwargs))
+
+    def predict_many_detailed(self,
+                              df_for_many_equipment_unit_days: DataFrame, /,
+                              **predict_kwargs) -> DataFrame:
+        """Predict faults for many equipment units & dates in detail.
+
+        Return 1 row per (equipment instance ID, date) group,
+        with final predictions in column "FAULT";
+        subclasses may add component predictions & probabilities.
+        """
+        return self.predict_many(df_for_many_equipment_unit_days,
+                                 **predict_kwargs).to_frame(name='FAULT')
+
+    def iter_batch_predict_detailed(self,
+                                    parquet_ds: ParquetDataset, /,
+                                    **predict_kwargs) -> Iterator[DataFrame]:
+        """Stream detailed predictions file by file.
+
+        Only 1 file's data & predictions are held in memory at a time.
+        """
+        return parquet_ds.map(partial(self.predict_many_detailed,
+                                      **predict_kwargs)).iterBatches(verbose=False)  # noqa: E501
+
     def batch_predict(self,
                       parquet_ds: ParquetDataset, /,
+                      *, n_workers: Optional[int] = None,
+                      n_groups_per_task: int = _N_GROUPS_PER_TASK,
                       **predict_kwargs) -> Series:
-        """Batch predict."""
-        return parquet_ds.map(
-            lambda df: (df.groupby(by=[EQUIPMENT_INSTANCE_ID_COL, DATE_COL],
-                                   axis='index',
-                                   level=None,
-                                   as_index=True,   # group labels as index
-                                   sort=False,   # better performance
-                                   # when `apply`ing: add group keys to index?
-                                   group_keys=False,
-                                   # squeeze=False,   # deprecated
-                                   observed=False,
-                                   dropna=True)
-                        .apply(func=self.predict, **predict_kwargs))).collect()
+        """Batch predict.
+
+        If ``n_workers`` is given, (equipment instance ID, date) groups
+        are dispatched in chunks of ``n_groups_per_task`` groups
+        to a pool of that many worker processes (e.g., for CPU-heavy
+        rule-based ``predict`` logic), with results in the same order.
+        """
+        if not n_workers:
+            return parquet_ds.map(partial(self.predict_many,
+                                          **predict_kwargs)).collect()
+
+        preds: List[Series] = []
+
+        with ProcessPoolExecutor(max_workers=n_workers,
+                                 initializer=_init_predict_worker,
+                                 initargs=(self, predict_kwargs)) as executor:
+            # files are read 1 at a time, in the same order as for `.collect()`
+            for df in parquet_ds.iterBatches(verbose=False):
+                # consecutive chunks of groups in order of first appearance
+                group_chunk_ids: Series = (
+                    df.groupby(by=[EQUIPMENT_INSTANCE_ID_COL, DATE_COL],
+                               axis='index',
+                               level=None,
+                               as_index=True,
+                               sort=False,
+                               group_keys=False,
+                               observed=False,
+                               dropna=True)
+                    .ngroup() // n_groups_per_task)
+
+                preds.extend(executor.map(
+                    _predict_many_in_worker,
+                    (chunk_df
+                     for _, chunk_df in df.groupby(by=group_chunk_ids,
+                                                   axis='index',
+                                                   level=None,
+                                                   as_index=True,
+                                                   sort=True,
+                                                   group_keys=False,
+                                                   observed=False,
+                                                   dropna=True))))
+
+        return (concat(preds, axis='index', copy=False)
+                if preds
+                else Series(dtype=object, name=None))
+
+    @property
+    def params_hash(self) -> str:
+        """Hash model code (e.g., rules) & simple-valued params.
+
+        (so that stored predictions are not reused after a model's
+        rules or params change without a version change)
+        """
+        h = sha1()
+
+        for cls in type(self).__mro__[:-1]:   # excl. `object`
+            try:
+                h.update(inspect.getsource(cls).encode())
+            except (OSError, TypeError):   # e.g., interactively-defined
+                h.update(f'{cls.__module__}.{cls.__qualname__}'.encode())
+
+        for k, v in sorted(vars(self).items()):
+            if k in _NON_PREDICTION_ATTRS:
+                continue
+
+            if isinstance(v, BaseFaultPredictor):   # e.g., oracle components
+                h.update(f'{k}={v.params_hash}'.encode())
+
+            elif isinstance(v, _PARAM_TYPES):
+                h.update(f'{k}={v!r}'.encode())
+
+            elif isinstance(v, (list, tuple, set, frozenset)) and \
+                    all(isinstance(i, _PARAM_TYPES) for i in v):
+                # (sets sorted for consistency across processes)
+                h.update(f'{k}={sorted(v, key=repr)!r}'.encode()
+                         if isinstance(v, (set, frozenset))
+                         else f'{k}={list(v)!r}'.encode())
+
+        return h.hexdigest()
+
+    def prediction_store_key(self, **predict_kwargs) -> str:
+        """Key prediction kwargs affecting stored prediction values.
+
+        Keys also include the model's params hash.
+        Subclasses whose predictions also depend on mutable state
+        (e.g., a tunable decision threshold) shall include such state.
+        """
+        return ('--'.join(f'{k}={v}'
+                          for k, v in sorted(predict_kwargs.items())
+                          if k not in _NON_PREDICTION_KWARGS) or 'default') + \
+            f'--params={self.params_hash[:16]}'
+
+    def prediction_store(self, **predict_kwargs) -> PredictionStore:
+        """Get persisted store of this model version's predictions."""
+        rel_path: str = (f'{self.name}/{self.unique_type_group}/'
+                         f'{self.prediction_store_key(**predict_kwargs)}')
+
+        return PredictionStore(
+            url=f'{H1ST_PREDICTION_STORE_DIR_PATH}/{rel_path}',
+            local_dir_path=LOCAL_PREDICTION_STORE_DIR_PATH / rel_path)
 
     def batch_process(self,
                       date: str, to_date: Optional[str] = None,
                       *, equipment_instance_id: Optional[str] = None,
+                      use_prediction_store: bool = False,
                       return_json: bool = False, **predict_kwargs) \
             -> Union[Series,
                      Dict[str, Dict[str, Union[bool, float]]]]:
         # pylint: disable=too-many-locals
-        """(Bulk-)Process data to predict fault per equipment unit per date."""
+        """(Bulk-)Process data to predict fault per equipment unit per date.
+
+        If ``use_prediction_store`` is True (requiring an explicit model
+        version) and ``equipment_instance_id`` is not specified,
+        predictions are persisted per date & data partition version
+        in the model version's prediction store, and dates already there
+        with unchanged data are loaded instead of re-scored.
+        """
+        assert self.has_explicit_version or not use_prediction_store, \
+            ValueError(f'*** {self}: PREDICTION STORE REQUIRES '
+                       'EXPLICIT MODEL VERSION ***')
+
         try:
             parquet_ds: ParquetDataset = (
                 EquipmentParquetDataSet(general_type=self.general_type,
@@ -175,13 +380,54 @@ class BaseFaultPredictor:
                                      verify_integrity=True,
                                      inplace=False)))
 
-        parquet_ds.cacheLocally()
+        preds: List[Series] = []
+
+        if use_prediction_store and not equipment_instance_id:
+            # (dates of unknown data versions are always re-scored)
+            data_versions: Dict[str, Optional[str]] = \
+                parquet_ds.partitionVersions(DATE_COL)
+
+            (store := self.prediction_store(**predict_kwargs)).pull(
+                versions=data_versions)
+
+            stored_dates: Set[str] = store.stored_dates(versions=data_versions)
+            dates_to_score: List[str] = sorted(set(data_versions) - stored_dates)  # noqa: E501
+
+            if stored_dates:
+                self.logger.info(
+                    msg=f'Loading Stored Predictions for {len(stored_dates):,} '  # noqa: E501
+                        f'Dates @ {store.url}...')
+                preds.append(store.load(versions={date: data_versions[date]
+                                                  for date in stored_dates}))
 
-        self.logger.info(
-            msg=(msg := f'Batch-Processing {parquet_ds.__shortRepr__}...'))
-        tic: float = time.time()
+            parquet_ds: Optional[ParquetDataset] = (
+                parquet_ds.filterByPartitionKeys((DATE_COL, tuple(dates_to_score)))  # noqa: E501
+                if dates_to_score
+                else None)
 
-        fault_preds: Series = (self.batch_predict(parquet_ds, **predict_kwargs)  # noqa: E501
+        else:
+            store: Optional[PredictionStore] = None
+
+        if parquet_ds is not None:
+            parquet_ds.cacheLocally()
+
+            self.logger.info(
+                msg=(msg := f'Batch-Processing {parquet_ds.__shortRepr__}...'))  # noqa: E501
+            tic: float = time.time()
+
+            preds.append(new_preds := self.batch_predict(parquet_ds,
+                                                         **predict_kwargs))
+
+            toc: float = time.time()
+            self.logger.info(msg=f'{msg} done!  <{toc-tic:.1f}s>')
+
+            if store:
+                store.save(preds=new_preds,
+                           versions={date: version
+                                     for date in dates_to_score
+                                     if (version := data_versions[date])})
+
+        fault_preds: Series = (concat(preds, axis='index', copy=False)
                                # sort index to make output order consistent
                                .sort_index(axis='index',
                                            level=None,
@@ -193,9 +439,6 @@ class BaseFaultPredictor:
                                            ignore_index=False,
                                            key=None))
 
-        toc: float = time.time()
-        self.logger.info(msg=f'{msg} done!  <{toc-tic:.1f}s>')
-
         if return_json:
             d: Dict[str, Dict[str, Union[bool, float]]] = {}
 
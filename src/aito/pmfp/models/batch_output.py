@@ -0,0 +1,188 @@
+"""Date-partitioned Parquet output of batch fault predictions.
+
+(``<dir>/date=<YYYY-MM-DD>/part-<n>.parquet``, written batch by batch)
+"""
+
+
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+import shutil
+from tempfile import mkdtemp
+from typing import Union
+from typing import Dict, List, Set   # Py3.9+: use built-ins
+
+from pandas import DataFrame, Series
+
+from aito.util import s3
+
+from aito.pmfp.data_mgmt import DATE_COL
+
+
+__all__ = ('PartitionedParquetPredictionWriter',)
+
+
+# final & component (e.g., teacher & student) binary prediction columns
+_PRED_COL: str = 'FAULT'
+_COMPONENT_PRED_COL_SUFFIX: str = f'_{_PRED_COL}'
+
+
+class PartitionedParquetPredictionWriter:
+    """Write detailed prediction DataFrames into date-partitioned Parquet.
+
+    Each written batch (e.g., 1 input file's predictions) becomes
+    1 part file per date, so that results are never collected in memory.
+    Parts are staged in a temporary directory, and written date partitions
+    only replace previous ones upon successful ``close()``
+    (on S3: previous partitions' other objects are only deleted
+    after all staged parts have been uploaded);
+    staged parts are discarded upon any exception.
+    """
+
+    def __init__(self, dir_path: Union[str, Path]):
+        """Init writer."""
+        self.url: str = str(dir_path).rstrip('/')
+        self.on_s3: bool = self.url.startswith('s3://')
+
+        if self.on_s3:
+            self.staging_dir_path: Path = Path(mkdtemp())
+
+        else:
+            # stage beside output directory (i.e., on the same file system),
+            # so that date partitions can be swapped in by renaming
+            (output_dir_path := Path(dir_path)).mkdir(parents=True,
+                                                      exist_ok=True)
+            self.staging_dir_path: Path = Path(
+                mkdtemp(prefix=f'.{output_dir_path.name}.staging-',
+                        dir=output_dir_path.parent))
+
+        self.n_parts: int = 0
+        self.dates: Set[str] = set()
+
+        # per-date counts of equipment-days & of positive predictions
+        self.n_equipment_days: Counter = Counter()
+        self.n_faults: Counter = Counter()
+
+    def __enter__(self) -> PartitionedParquetPredictionWriter:
+        """Enter context."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Publish written partitions upon successful exit only."""
+        if exc_info[0] is None:
+            self.close()
+
+        else:
+            self.discard()
+
+    @staticmethod
+    def positives(preds: DataFrame, /) -> Series:
+        """Flag rows with any positive final or component prediction.
+
+        (e.g., oracle rows where teacher, student or ensemble predict faults;
+        NULL predictions are not positive)
+        """
+        return (preds[[col for col in preds.columns
+                       if (col == _PRED_COL) or
+                       col.endswith(_COMPONENT_PRED_COL_SUFFIX)]]
+                .fillna(value=False)
+                .astype(dtype=bool, copy=True)
+                .any(axis='columns'))
+
+    def write(self, preds: DataFrame, /) -> DataFrame:
+        """Write 1 batch of predictions & return its positive predictions."""
+        df: DataFrame = preds.reset_index(level=None, drop=False,
+                                          inplace=False)
+        date_strs: Series = df[DATE_COL].astype(dtype=str, copy=True)
+        faults: Series = self.positives(df)
+
+        for date, date_df in df.groupby(by=date_strs, sort=True):
+            (date_dir_path := self.staging_dir_path / f'{DATE_COL}={date}') \
+                .mkdir(parents=True, exist_ok=True)
+            self.dates.add(date)
+
+            # date is encoded by partition directory
+            date_df.drop(columns=DATE_COL, inplace=False).to_parquet(
+                path=date_dir_path / f'part-{self.n_parts:05d}.parquet',
+                engine='pyarrow',
+                compression='snappy',
+                index=False)
+            self.n_parts += 1
+
+            self.n_equipment_days[date] += len(date_df)
+            self.n_faults[date] += int(faults.loc[date_df.index].sum())
+
+        return preds.loc[faults.values]
+
+    def close(self):
+        """Swap staged date partitions in, replacing previous ones."""
+        try:
+            if self.on_s3:
+                # upload all staged parts (raising upon any failure)
+                # before deleting other objects of previous date partitions
+                uploaded_urls: Set[str] = set()
+
+                for staged_part_path in sorted(self.staging_dir_path.glob(
+                        f'{DATE_COL}=*/*.parquet')):
+                    s3.upload(local_path=staged_part_path,
+                              s3_path=(part_url := (
+                                  f'{self.url}/{staged_part_path.parent.name}'
+                                  f'/{staged_part_path.name}')))
+                    uploaded_urls.add(part_url)
+
+                s3.delete([obj_url
+                           for date in sorted(self.dates)
+                           for obj_url in s3.list_files(
+                               f'{self.url}/{DATE_COL}={date}')
+                           if obj_url not in uploaded_urls])
+
+            else:
+                for date in sorted(self.dates):
+                    staged_dir_path: Path = \
+                        self.staging_dir_path / (partition :=
+                                                 f'{DATE_COL}={date}')
+
+                    # move previous partition aside (into staging directory,
+                    # hence removed below) then rename staged one into place
+                    previous_dir_path: Path = \
+                        self.staging_dir_path / f'{partition}.previous'
+
+                    if (date_dir_path := Path(self.url) / partition).exists():
+                        date_dir_path.rename(previous_dir_path)
+
+                    try:
+                        staged_dir_path.rename(date_dir_path)
+
+                    except OSError:
+                        # restore previous partition
+                        if previous_dir_path.exists():
+                            previous_dir_path.rename(date_dir_path)
+                        raise
+
+        finally:
+            self.discard()
+
+    def discard(self):
+        """Discard staged (i.e., unpublished) parts."""
+        shutil.rmtree(path=self.staging_dir_path, ignore_errors=True)
+
+    def summary(self) -> DataFrame:
+        """Summarize numbers of equipment-days & predicted faults per date."""
+        dates: List[str] = sorted(self.dates)
+
+        return DataFrame(data={'n_equipment_days': [self.n_equipment_days[d]
+                                                    for d in dates],
+                               'n_faults': [self.n_faults[d] for d in dates]},
+                         index=Series(dates, name=DATE_COL))
+
+    @property
+    def total(self) -> Dict[str, int]:
+        """Total numbers of equipment-days & predicted faults."""
+        return {'n_equipment_days': sum(self.n_equipment_days.values()),
+                'n_faults': sum(self.n_faults.values())}
+
+    def __repr__(self) -> str:
+        """Return string repr."""
+        return (f'{type(self).__name__}[{len(self.dates):,} dates, '
+                f'{self.n_parts:,} parts @ {self.url}]')
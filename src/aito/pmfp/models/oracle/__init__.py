@@ -7,8 +7,6 @@ from typing import List, Sequence, Tuple   # Py3.9+: use built-ins
 
 from pandas import DataFrame, Series
 
-from aito.util.data_proc import ParquetDataset
-
 from aito.pmfp.models.base import BaseFaultPredictor
 from .teacher.base import BaseFaultPredTeacher
 from .student.timeseries_dl import (TimeSeriesDLFaultPredStudentModeler,
@@ -69,6 +67,7 @@ class FaultPredOracle(BaseFaultPredictor):
         super().__init__(general_type=teacher.general_type,
                          unique_type_group=teacher.unique_type_group,
                          version=student.version)
+        self.has_explicit_version: bool = student.has_explicit_version
 
         self.teacher: BaseFaultPredTeacher = teacher
         self.student: TimeSeriesDLFaultPredStudent = student
@@ -107,14 +106,48 @@ class FaultPredOracle(BaseFaultPredictor):
             self.ensemble.predict(teacher_pred=teacher_pred,
                                   student_pred=student_pred))
 
-    def batch_predict(self, parquet_ds: ParquetDataset) -> Series:
-        """Batch-Predict faults."""
-        return Series(
-            data=zip(
-                teacher_preds := self.teacher.batch_predict(parquet_ds),
-                student_preds := self.student.batch_predict(parquet_ds,
-                                                            return_binary=True),  # noqa: E501
-                ensemble_preds := self.ensemble.batch_predict(
-                    teacher_preds=teacher_preds, student_preds=student_preds)),
-            index=ensemble_preds.index,
-            dtype=None, name='FAULT', copy=False, fastpath=False)
+    def predict_many(self,
+                     df_for_many_equipment_unit_days: DataFrame, /,
+                     **predict_kwargs) -> Series:
+        """Make oracle predictions for many equipment units & dates at once.
+
+        Teacher & student predictions are made on the same in-memory data,
+        so that ``batch_predict`` reads & decodes each file only once.
+        """
+        preds: DataFrame = self.predict_many_detailed(df_for_many_equipment_unit_days,  # noqa: E501
+                                                      **predict_kwargs)
+
+        return Series(data=zip(preds.TEACHER_FAULT,
+                               preds.STUDENT_FAULT,
+                               preds.FAULT),
+                      index=preds.index,
+                      dtype=None, name='FAULT', copy=False, fastpath=False)
+
+    def predict_many_detailed(self,
+                              df_for_many_equipment_unit_days: DataFrame, /,
+                              **predict_kwargs) -> DataFrame:
+        """Make teacher, student & ensemble predictions, w/ probabilities.
+
+        (oracle predictions take no prediction kwargs)
+        """
+        assert not predict_kwargs, \
+            ValueError(f'*** {type(self).__name__}: UNSUPPORTED PREDICTION '
+                       f'KWARGS {predict_kwargs} ***')
+
+        teacher_preds: Series = self.teacher.predict_many(df_for_many_equipment_unit_days)  # noqa: E501
+        student_probs: Series = self.student.predict_many(df_for_many_equipment_unit_days,  # noqa: E501
+                                                          return_binary=False)  # noqa: E501
+        student_preds: Series = student_probs > self.student.decision_threshold  # noqa: E501
+
+        return DataFrame(
+            data={'TEACHER_FAULT': teacher_preds,
+                  'STUDENT_FAULT_PROBA': student_probs,
+                  'STUDENT_FAULT': student_preds,
+                  'FAULT': self.ensemble.batch_predict(teacher_preds=teacher_preds,  # noqa: E501
+                                                       student_preds=student_preds)},  # noqa: E501
+            index=student_probs.index)
+
+    def prediction_store_key(self, **predict_kwargs) -> str:
+        """Key prediction kwargs & student's decision threshold."""
+        return (super().prediction_store_key(**predict_kwargs) +
+                f'--decision_threshold={self.student.decision_threshold}')
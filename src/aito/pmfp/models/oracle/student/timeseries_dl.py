@@ -3,8 +3,9 @@
 
 from __future__ import annotations
 
-from functools import cached_property
+from functools import cached_property, lru_cache, partial
 import math
+import os
 import pickle
 from tempfile import NamedTemporaryFile
 from typing import Optional, Union
@@ -36,6 +37,15 @@ from aito.pmfp.models.oracle.teacher.base import BaseFaultPredTeacher
 N_MINUTES_PER_DAY: int = 24 * 60
 
 
+@lru_cache(maxsize=None, typed=False)
+def _flattening_subsampler(columns: Tuple[str], every_n_rows: int,
+                           total_n_rows: int) -> PandasFlatteningSubsampler:
+    """Get (shared) Pandas flattening subsampler."""
+    return PandasFlatteningSubsampler(columns=columns,
+                                      everyNRows=every_n_rows,
+                                      totalNRows=total_n_rows)
+
+
 _ON_S3: bool = (isinstance(H1ST_MODELS_DIR_PATH, str) and
                 H1ST_MODELS_DIR_PATH.startswith('s3://'))
 
@@ -88,7 +98,7 @@ class TimeSeriesDLFaultPredStudentModeler:
 
         parquet_ds.cacheLocally()
 
-        parquet_ds, preprocessor = parquet_ds.preprocForML(
+        _, preprocessor = parquet_ds.preprocForML(
             *self.input_cat_cols, *self.input_num_cols,
             forceCat=self.input_cat_cols, forceNum=self.input_num_cols,
             returnPreproc=True)
@@ -99,17 +109,11 @@ class TimeSeriesDLFaultPredStudentModeler:
                                        totalNRows=self.input_n_rows_per_day)
 
         parquet_ds: ParquetDataset = parquet_ds.map(
-            lambda df: (df.groupby(by=[EQUIPMENT_INSTANCE_ID_COL, DATE_COL],
-                                   axis='index',
-                                   level=None,
-                                   as_index=True,   # group labels as index
-                                   sort=False,   # better performance
-                                   # when `apply`ing: add group keys to index?
-                                   group_keys=False,
-                                   # squeeze=False,   # deprecated
-                                   observed=False,
-                                   dropna=True)
-                        .apply(func=flattening_subsampler, padWithLastRow=True)))  # noqa: E501
+            partial(preprocessor.transformToDataFrame,
+                    keepCols=(EQUIPMENT_INSTANCE_ID_COL, DATE_COL)),
+            partial(flattening_subsampler.flattenGroups,
+                    by=(EQUIPMENT_INSTANCE_ID_COL, DATE_COL),
+                    padWithLastRow=True))
 
         parquet_ds.stdOutLogger.info(msg='Featurizing into Pandas DF...')
         df: DataFrame = parquet_ds.collect()
@@ -121,7 +125,9 @@ class TimeSeriesDLFaultPredStudentModeler:
         print('Getting Teacher Labels...')
         from_date, to_date = self.date_range
         teacher_predicted_faults_series: Series = \
-            self.teacher.batch_process(date=from_date, to_date=to_date)
+            self.teacher.batch_process(
+                date=from_date, to_date=to_date,
+                use_prediction_store=self.teacher.has_explicit_version)
         teacher_predicted_faults_series.mask(
             cond=teacher_predicted_faults_series.isnull(),
             other=False,
@@ -369,6 +375,8 @@ class TimeSeriesDLFaultPredStudent(BaseFaultPredictor):
                          version=_version)
 
         self.version: str = f'{teacher.name}---{type(self).__name__}--{self.version}'  # noqa: E501
+        self.has_explicit_version: bool = \
+            self.has_explicit_version and teacher.has_explicit_version
 
         self.teacher: BaseFaultPredTeacher = teacher
 
@@ -420,6 +428,11 @@ class TimeSeriesDLFaultPredStudent(BaseFaultPredictor):
         """Return model's preprocessing parameters URL."""
         return f'{self.instance_url}/preproc-params.yaml'
 
+    @cached_property
+    def preproc_params_npz_url(self) -> str:
+        """Return model's binary preprocessing parameters URL."""
+        return f'{self.instance_url}/preproc-params.npz'
+
     @cached_property
     def native_obj_url(self) -> str:
         """Return model's native object URL."""
@@ -491,6 +504,28 @@ class TimeSeriesDLFaultPredStudent(BaseFaultPredictor):
                   to_path=self.preproc_params_url,
                   hdfs=False, is_dir=False)
 
+        # (also in binary format, for faster loading)
+        with NamedTemporaryFile(mode='wb',
+                                buffering=-1,
+                                encoding=None,
+                                newline=None,
+                                suffix=None,
+                                prefix=None,
+                                dir=None,
+                                delete=False,
+                                errors=None) as preproc_params_npz_tmp_file:
+            self.preprocessor.to_npz(path=preproc_params_npz_tmp_file.name)
+
+        if _ON_S3:
+            s3.mv(from_path=preproc_params_npz_tmp_file.name,
+                  to_path=self.preproc_params_npz_url,
+                  is_dir=False, quiet=False)
+
+        else:
+            fs.mv(from_path=preproc_params_npz_tmp_file.name,
+                  to_path=self.preproc_params_npz_url,
+                  hdfs=False, is_dir=False)
+
         # save native object
         with NamedTemporaryFile(mode='wb',
                                 buffering=-1,
@@ -615,28 +650,53 @@ class TimeSeriesDLFaultPredStudent(BaseFaultPredictor):
             student.input_subsampling_factor = d.get('subsampling-factor', 1)
             student.input_n_rows_per_day = d.get('n-rows-per-day', N_MINUTES_PER_DAY)  # noqa: E501
 
-        # load preprocessing params
-        with NamedTemporaryFile(mode='rt',
+        # load preprocessing params, preferably from binary format
+        # (absent for models saved by older versions)
+        with NamedTemporaryFile(mode='rb',
                                 buffering=-1,
-                                encoding='utf-8',
+                                encoding=None,
                                 newline=None,
                                 suffix=None,
                                 prefix=None,
                                 dir=None,
                                 delete=True,
-                                errors=None) as preproc_params_tmp_file:
+                                errors=None) as preproc_params_npz_tmp_file:
             if _ON_S3:
-                s3.cp(from_path=student.preproc_params_url,
-                      to_path=preproc_params_tmp_file.name,
-                      is_dir=False, quiet=False)
+                s3.cp(from_path=student.preproc_params_npz_url,
+                      to_path=preproc_params_npz_tmp_file.name,
+                      is_dir=False, quiet=True)
 
-            else:
-                fs.cp(from_path=student.preproc_params_url,
-                      to_path=preproc_params_tmp_file.name,
+            elif os.path.isfile(student.preproc_params_npz_url):
+                fs.cp(from_path=student.preproc_params_npz_url,
+                      to_path=preproc_params_npz_tmp_file.name,
                       hdfs=False, is_dir=False)
 
-            student.preprocessor = \
-                PandasMLPreprocessor.from_yaml(path=preproc_params_tmp_file.name)  # noqa: E501
+            if os.path.getsize(preproc_params_npz_tmp_file.name):
+                student.preprocessor = \
+                    PandasMLPreprocessor.from_npz(path=preproc_params_npz_tmp_file.name)  # noqa: E501
+
+        if student.preprocessor is None:
+            with NamedTemporaryFile(mode='rt',
+                                    buffering=-1,
+                                    encoding='utf-8',
+                                    newline=None,
+                                    suffix=None,
+                                    prefix=None,
+                                    dir=None,
+                                    delete=True,
+                                    errors=None) as preproc_params_tmp_file:
+                if _ON_S3:
+                    s3.cp(from_path=student.preproc_params_url,
+                          to_path=preproc_params_tmp_file.name,
+                          is_dir=False, quiet=False)
+
+                else:
+                    fs.cp(from_path=student.preproc_params_url,
+                          to_path=preproc_params_tmp_file.name,
+                          hdfs=False, is_dir=False)
+
+                student.preprocessor = \
+                    PandasMLPreprocessor.from_yaml(path=preproc_params_tmp_file.name)  # noqa: E501
 
         # load native object
         with NamedTemporaryFile(mode='rb',
@@ -692,10 +752,10 @@ class TimeSeriesDLFaultPredStudent(BaseFaultPredictor):
     @property
     def flattening_subsampler(self) -> PandasFlatteningSubsampler:
         """Get instance's Pandas flattening subsampler."""
-        return PandasFlatteningSubsampler(
+        return _flattening_subsampler(
             columns=tuple(self.preprocessor.sortedPreprocCols),
-            everyNRows=self.input_subsampling_factor,
-            totalNRows=self.input_n_rows_per_day)
+            every_n_rows=self.input_subsampling_factor,
+            total_n_rows=self.input_n_rows_per_day)
 
     def predict(self,
                 df_for_1_equipment_unit_for_1_day: DataFrame, /,
@@ -710,29 +770,56 @@ class TimeSeriesDLFaultPredStudent(BaseFaultPredictor):
 
         return (prob > self.decision_threshold) if return_binary else prob
 
-    def batch_predict(self,
-                      parquet_ds: ParquetDataset, /,
-                      return_binary: bool = True) -> Series:
+    def predict_many(self,
+                     df_for_many_equipment_unit_days: DataFrame, /,
+                     return_binary: bool = True) -> Series:
+        # pylint: disable=arguments-differ
+        """Predict faults for many equipment units & dates at once.
+
+        All (equipment instance ID, date) groups of the given data are
+        preprocessed & flattened into 1 feature matrix,
+        scored by 1 ``predict_proba`` call.
+        (Batch predictions over Parquet data sets call this file by file,
+        i.e., 1 ``predict_proba`` call per file, so that only 1 file's
+        features are held in memory at a time.)
+        """
+        features: DataFrame = self.flattening_subsampler.flattenGroups(
+            self.preprocessor.transformToDataFrame(
+                df_for_many_equipment_unit_days,
+                keepCols=(EQUIPMENT_INSTANCE_ID_COL, DATE_COL)),
+            by=(EQUIPMENT_INSTANCE_ID_COL, DATE_COL),
+            padWithLastRow=True)
+
+        probs: Series = Series(
+            data=(self.native_obj.predict_proba(X=features.values)[:, 1]
+                  if len(features)
+                  else []),
+            index=features.index,
+            dtype=float, name='FAULT', copy=False)
+
+        return (probs > self.decision_threshold) if return_binary else probs
+
+    def predict_many_detailed(self,
+                              df_for_many_equipment_unit_days: DataFrame, /,
+                              **predict_kwargs) -> DataFrame:
+        # pylint: disable=unused-argument
+        """Predict fault probabilities & binary faults at once."""
+        probs: Series = self.predict_many(df_for_many_equipment_unit_days,
+                                          return_binary=False)
+
+        return DataFrame(data={'FAULT_PROBA': probs,
+                               'FAULT': probs > self.decision_threshold},
+                         index=probs.index)
+
+    def prediction_store_key(self, return_binary: bool = True,
+                             **predict_kwargs) -> str:
         # pylint: disable=arguments-differ
-        """Batch-Predict faults."""
-        df: DataFrame = parquet_ds.map(
-            self.preprocessor,
-            lambda df: (df.groupby(by=[EQUIPMENT_INSTANCE_ID_COL, DATE_COL],
-                                   axis='index',
-                                   level=None,
-                                   as_index=True,   # group labels as index
-                                   sort=False,   # better performance
-                                   # when `apply`ing: add group keys to index?
-                                   group_keys=False,
-                                   # squeeze=False,   # deprecated
-                                   observed=False,
-                                   dropna=True)
-                        .apply(func=self.flattening_subsampler,
-                               padWithLastRow=True))).collect()
-
-        df.loc[:, 'FAULT'] = self.native_obj.predict_proba(X=df.values)[:, 1]
-
-        return (df.FAULT > self.decision_threshold) if return_binary else df.FAULT  # noqa: E501
+        """Key prediction kwargs & (if binary) decision threshold."""
+        return (super().prediction_store_key(return_binary=return_binary,
+                                             **predict_kwargs) +
+                (f'--decision_threshold={self.decision_threshold}'
+                 if return_binary
+                 else ''))
 
     def tune_decision_threshold(self, tuning_date_range: Tuple[str, str]):
         """Tune Model's decision threshold to maximize P-R harmonic mean."""
@@ -741,7 +828,8 @@ class TimeSeriesDLFaultPredStudent(BaseFaultPredictor):
         precision, recall, thresholds = \
             precision_recall_curve(
                 y_true=((_y_true := self.teacher.batch_process(date=tune_from_date,  # noqa: E501
-                                                               to_date=tune_to_date))  # noqa: E501
+                                                               to_date=tune_to_date,  # noqa: E501
+                                                               use_prediction_store=self.teacher.has_explicit_version))  # noqa: E501
                         .mask(cond=_y_true.isnull(),
                               other=False,
                               inplace=False,
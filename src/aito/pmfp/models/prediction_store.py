@@ -0,0 +1,178 @@
+"""Persisted per-model-version, per-date prediction store.
+
+(1 Parquet file per date partition & data version, under local or S3 directory)
+"""
+
+
+from dataclasses import dataclass
+from functools import cached_property
+import os
+from pathlib import Path
+import re
+from typing import Optional
+from typing import Dict, List, Set, Tuple   # Py3.9+: use built-ins
+
+from numpy import ndarray
+from pandas import DataFrame, Series, concat, read_parquet
+
+from aito.util import s3
+
+from aito.pmfp.data_mgmt import EQUIPMENT_INSTANCE_ID_COL, DATE_COL
+
+
+__all__ = ('PredictionStore',)
+
+
+_PRED_COL: str = 'FAULT'
+
+# stored file names: date=<YYYY-MM-DD>--version=<data version>.parquet
+_VERSION_SEP: str = '--version='
+_FILE_NAME_PATTERN: re.Pattern = \
+    re.compile(f'{DATE_COL}=(.+?){re.escape(_VERSION_SEP)}(.+)\\.parquet')
+
+
+def _date_and_version(file_name: str) -> Optional[Tuple[str, str]]:
+    """Parse stored file name into date & data partition version."""
+    return (match.groups()
+            if (match := _FILE_NAME_PATTERN.fullmatch(file_name))
+            else None)
+
+
+@dataclass(init=True,
+           repr=True,
+           eq=True,
+           order=False,
+           unsafe_hash=False,
+           frozen=True)  # frozen=True needed for __hash__()
+class PredictionStore:
+    """Prediction store of 1 model version with 1 set of prediction kwargs.
+
+    Predictions live in ``<url>/date=<YYYY-MM-DD>--version=<v>.parquet`` files,
+    where ``<v>`` is the version of the date's input data partition
+    (e.g., from ``ParquetDataset.partitionVersions(DATE_COL)``),
+    so that re-processing a date range only needs to score dates
+    that are missing or whose input data have since changed.
+    If ``url`` is on S3, files are transferred via a local mirror directory.
+    """
+
+    url: str
+    local_dir_path: Path
+
+    @cached_property
+    def on_s3(self) -> bool:
+        """Check whether store is on S3."""
+        return self.url.startswith('s3://')
+
+    def _local_file_path(self, date: str, version: str) -> Path:
+        return (self.local_dir_path /
+                f'{DATE_COL}={date}{_VERSION_SEP}{version}.parquet')
+
+    def pull(self, versions: Dict[str, Optional[str]]):
+        """Download stored predictions of specified dates & data versions.
+
+        (from S3 to local mirror directory, concurrently,
+        skipping files whose local copies are unchanged;
+        dates of unknown data versions are never stored, hence skipped)
+        """
+        if self.on_s3:
+            s3.downloader().download_many(
+                [(s3_path, self.local_dir_path / file_name)
+                 for s3_path in s3.list_files(self.url, suffix='.parquet')
+                 if (date_and_version :=
+                     _date_and_version(file_name := s3_path.rsplit('/', 1)[1]))  # noqa: E501
+                 and (versions.get(date_and_version[0]) == date_and_version[1])])  # noqa: E501
+
+    def push(self, versions: Optional[Dict[str, str]] = None):
+        """Upload stored predictions (of specified dates & versions) to S3.
+
+        Other versions of specified dates are deleted from S3
+        after all uploads succeed.
+        """
+        if self.on_s3:
+            uploaded_s3_paths: Set[str] = set()
+
+            for file_path in (
+                    [self._local_file_path(date, version)
+                     for date, version in versions.items()]
+                    if versions is not None
+                    else self.local_dir_path.glob(f'{DATE_COL}=*.parquet')):
+                s3.upload(local_path=file_path,
+                          s3_path=(s3_path := f'{self.url}/{file_path.name}'))
+                uploaded_s3_paths.add(s3_path)
+
+            if versions:
+                s3.delete([s3_path
+                           for s3_path in s3.list_files(self.url, suffix='.parquet')  # noqa: E501
+                           if (s3_path not in uploaded_s3_paths) and
+                           (date_and_version := _date_and_version(s3_path.rsplit('/', 1)[1]))  # noqa: E501
+                           and (date_and_version[0] in versions)])
+
+    def stored_dates(self, versions: Dict[str, Optional[str]]) -> Set[str]:
+        """Get dates (YYYY-MM-DD) with stored predictions of specified data versions."""  # noqa: E501
+        return {date
+                for date, version in versions.items()
+                if (version is not None) and
+                self._local_file_path(date, version).is_file()}
+
+    def load(self, versions: Dict[str, str]) -> Series:
+        """Load stored predictions for specified dates & data versions."""
+        preds: List[Series] = [
+            read_parquet(path=self._local_file_path(date, version),
+                         engine='pyarrow',
+                         columns=[EQUIPMENT_INSTANCE_ID_COL, DATE_COL, _PRED_COL])  # noqa: E501
+            .set_index(keys=[EQUIPMENT_INSTANCE_ID_COL, DATE_COL],
+                       drop=True,
+                       append=False,
+                       verify_integrity=False,
+                       inplace=False)[_PRED_COL]
+            for date, version in sorted(versions.items())]
+
+        if not preds:
+            return Series(dtype=object, name=_PRED_COL)
+
+        stored_preds: Series = concat(preds, axis='index', copy=False)
+
+        # multi-valued (e.g., oracle) predictions are read back as arrays
+        if len(stored_preds) and isinstance(stored_preds.iloc[0], ndarray):
+            stored_preds: Series = stored_preds.map(tuple)
+
+        return stored_preds
+
+    def save(self, preds: Series, versions: Dict[str, str]):
+        """Store predictions for specified (newly scored) dates & versions.
+
+        Dates without any predictions get empty files,
+        so that they are not re-scored next time,
+        and stored predictions of other data versions of these dates
+        are removed.
+        """
+        self.local_dir_path.mkdir(parents=True, exist_ok=True)
+
+        df: DataFrame = (
+            preds.map(lambda pred: list(pred) if isinstance(pred, tuple) else pred)  # noqa: E501
+            .reset_index(level=None, drop=False, name=_PRED_COL)
+            if len(preds)
+            else DataFrame(columns=[EQUIPMENT_INSTANCE_ID_COL, DATE_COL, _PRED_COL]))  # noqa: E501
+
+        date_strs: Series = df[DATE_COL].astype(dtype=str, copy=True)
+
+        for date, version in versions.items():
+            # write to temp file then rename, so that interrupted writes
+            # never leave partial files looking like stored dates
+            tmp_file_path: Path = \
+                (file_path := self._local_file_path(date, version)) \
+                .with_suffix('.tmp')
+
+            df.loc[date_strs == date].to_parquet(path=tmp_file_path,
+                                                 engine='pyarrow',
+                                                 compression='snappy',
+                                                 index=False)
+
+            os.replace(tmp_file_path, file_path)
+
+            for other_file_path in self.local_dir_path.glob(
+                    f'{DATE_COL}={date}{_VERSION_SEP}*.parquet'):
+                if other_file_path != file_path:
+                    other_file_path.unlink()
+
+        self.push(versions=versions)
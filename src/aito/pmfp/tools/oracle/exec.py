@@ -7,19 +7,115 @@ AWS_SECRET_ACCESS_KEY=<...aws-secret-access-key...> \
     <...model-class-name...> \
     <...model-version...> \
     --from-date 2016-09-01 --to-date 2022-02-22
+
+Daily incremental run over several equipment unique type groups:
+    aito predict-faults \
+    <...model-class-name...> \
+    <...model-version...> \
+    2016-09-01 --incremental \
+    --unique-type-group <...group-1...> --unique-type-group <...group-2...>
 """
 
+import os
 from pathlib import Path
-from pprint import pprint
+from tempfile import NamedTemporaryFile
 from typing import Optional
+from typing import Dict, List, Tuple   # Py3.9+: use built-ins
 
 import click
-from pandas import Series
+from pandas import DataFrame
+from ruamel import yaml
 
+from aito.pmfp.data_mgmt import EquipmentParquetDataSet, DATE_COL
 from aito.pmfp.models import BaseFaultPredictor, H1ST_BATCH_OUTPUT_DIR_PATH
+from aito.pmfp.models.batch_output import PartitionedParquetPredictionWriter
 
 import aito.util.debug
+from aito.util.data_proc import ParquetDataset
 from aito.util.path import add_cwd_to_py_path
+from aito.util import fs, s3
+
+
+CHECKPOINT_FILE_NAME: str = 'incremental-checkpoint.yaml'
+
+
+def _load_checkpoint(checkpoint_url: str) \
+        -> Dict[str, Dict[str, Optional[str]]]:
+    """Load processed date partitions' versions per unique type group."""
+    with NamedTemporaryFile(mode='rt',
+                            buffering=-1,
+                            encoding='utf-8',
+                            newline=None,
+                            suffix=None,
+                            prefix=None,
+                            dir=None,
+                            delete=True,
+                            errors=None) as checkpoint_tmp_file:
+        if checkpoint_url.startswith('s3://'):
+            s3.cp(from_path=checkpoint_url,
+                  to_path=checkpoint_tmp_file.name,
+                  is_dir=False, quiet=True)
+
+        elif os.path.isfile(checkpoint_url):
+            fs.cp(from_path=checkpoint_url,
+                  to_path=checkpoint_tmp_file.name,
+                  hdfs=False, is_dir=False)
+
+        # pylint: disable=consider-using-with
+        checkpoint: Optional[dict] = \
+            yaml.safe_load(stream=open(file=checkpoint_tmp_file.name,
+                                       mode='rt', encoding='utf-8'),
+                           version=None)
+
+    # (empty if no checkpoint yet)
+    return ({group: {str(date): version
+                     for date, version in (date_versions or {}).items()}
+             for group, date_versions in checkpoint.items()}
+            if checkpoint
+            else {})
+
+
+def _save_checkpoint(checkpoint: Dict[str, Dict[str, Optional[str]]],
+                     checkpoint_url: str):
+    """Save processed date partitions' versions per unique type group."""
+    with NamedTemporaryFile(mode='wt',
+                            buffering=-1,
+                            encoding='utf-8',
+                            newline=None,
+                            suffix=None,
+                            prefix=None,
+                            dir=None,
+                            delete=False,
+                            errors=None) as checkpoint_tmp_file:
+        yaml.safe_dump(data=checkpoint,
+                       stream=checkpoint_tmp_file,
+                       default_flow_style=False,
+                       encoding='utf-8',
+                       indent=2,
+                       allow_unicode=True)
+
+    if checkpoint_url.startswith('s3://'):
+        s3.mv(from_path=checkpoint_tmp_file.name, to_path=checkpoint_url,
+              is_dir=False, quiet=True, verbose=False)
+
+    else:
+        Path(checkpoint_url).parent.mkdir(parents=True, exist_ok=True)
+        fs.mv(from_path=checkpoint_tmp_file.name, to_path=checkpoint_url,
+              hdfs=False, is_dir=False)
+
+
+def _new_partition_versions(partition_versions: Dict[str, Optional[str]],
+                            processed_versions: Dict[str, Optional[str]],
+                            *, date: str, to_date: Optional[str] = None) \
+        -> Dict[str, Optional[str]]:
+    """Select new or changed date partitions' versions within date range.
+
+    (partitions of unknown versions are always re-processed)
+    """
+    return {i: version
+            for i, version in partition_versions.items()
+            if (i >= date) and ((not to_date) or (i <= to_date)) and
+            ((version is None) or (processed_versions.get(i) != version))}
 
 
 @click.command(name='predict-faults',
@@ -98,6 +194,90 @@ from aito.util.path import add_cwd_to_py_path
               envvar=None,
               # shell_complete=None,
               )
+@click.option('--unique-type-group',
+              show_default=True,
+              prompt=False,
+              confirmation_prompt=False,
+              # prompt_required=True,
+              hide_input=False,
+              is_flag=False,
+              flag_value=None,
+              multiple=True,
+              count=False,
+              allow_from_autoenv=True,
+              help='Equipment Unique Type Group(s) (default: model\'s own)',  # noqa: E501
+              hidden=False,
+              show_choices=True,
+              show_envvar=False,
+
+              type=str,
+              required=False,
+              default=(),
+              callback=None,
+              nargs=None,
+              # multiple=False,
+              metavar='UNIQUE_TYPE_GROUP',
+              expose_value=True,
+              is_eager=False,
+              envvar=None,
+              # shell_complete=None,
+              )
+@click.option('--incremental',
+              show_default=True,
+              prompt=False,
+              confirmation_prompt=False,
+              # prompt_required=True,
+              hide_input=False,
+              is_flag=True,
+              flag_value=True,
+              multiple=False,
+              count=False,
+              allow_from_autoenv=True,
+              help='Only process new or changed date partitions since last run',  # noqa: E501
+              hidden=False,
+              show_choices=True,
+              show_envvar=False,
+
+              type=bool,
+              required=False,
+              default=False,
+              callback=None,
+              nargs=None,
+              # multiple=False,
+              metavar='INCREMENTAL',
+              expose_value=True,
+              is_eager=False,
+              envvar=None,
+              # shell_complete=None,
+              )
+@click.option('--summary-only',
+              show_default=True,
+              prompt=False,
+              confirmation_prompt=False,
+              # prompt_required=True,
+              hide_input=False,
+              is_flag=True,
+              flag_value=True,
+              multiple=False,
+              count=False,
+              allow_from_autoenv=True,
+              help='Only print summary (not positive predictions)',  # noqa: E501
+              hidden=False,
+              show_choices=True,
+              show_envvar=False,
+
+              type=bool,
+              required=False,
+              default=False,
+              callback=None,
+              nargs=None,
+              # multiple=False,
+              metavar='SUMMARY_ONLY',
+              expose_value=True,
+              is_eager=False,
+              envvar=None,
+              # shell_complete=None,
+              )
 @click.option('--debug',
               show_default=True,
               prompt=False,
@@ -129,8 +309,20 @@ from aito.util.path import add_cwd_to_py_path
 def predict_faults(
         model_class_name: str, model_version: str,
         date: str, to_date: Optional[str] = None,
-        debug: bool = False):
-    """Batch-predict equipment faults."""
+        unique_type_group: Tuple[str] = (), incremental: bool = False,
+        summary_only: bool = False, debug: bool = False):
+    # pylint: disable=too-many-arguments,too-many-locals
+    """Batch-predict equipment faults.
+
+    With ``--incremental``, DATE is the earliest date to consider,
+    and only date partitions that are new or whose files have changed
+    since they were last successfully processed (as recorded per
+    unique type group in a checkpoint file, by partition version
+    hashing file paths, modification times & sizes) are processed.
+
+    Detailed predictions are written per input file into Parquet files
+    partitioned by date, under each unique type group's output directory.
+    """
     if debug:
         aito.util.debug.ON = True
 
@@ -141,26 +333,80 @@ def predict_faults(
     model: BaseFaultPredictor = (getattr(ai.models, model_class_name)
                                  .load(version=model_version))
 
-    # predict
-    results: Series = model.batch_process(date=date, to_date=to_date,
-                                          return_json=False)
-
-    # filter for positive predictions
-    fault_preds: Series = results.loc[(results.map(sum) > 0)
-                                      if isinstance(results.iloc[0], tuple)
-                                      else results]
-
-    # print
-    pprint(fault_preds.to_dict())
-
-    # save
-    Path(output_path := (f'{H1ST_BATCH_OUTPUT_DIR_PATH}/'
-                         f'{model_class_name}/{model_version}/'
-                         f'{date}-to-{to_date}.csv')
-         ).parent.mkdir(parents=True, exist_ok=True)
-    fault_preds.to_csv(output_path, header=True, index=True)
-    print(f'\n@ {output_path}')
-
-    # summarize
-    print(f'\n{(n_faults := len(fault_preds)):,} Predicted Daily Faults '
-          f'({100 * n_faults / (n := len(results)):.3f}% of {n:,})')
+    checkpoint_url: str = (f'{H1ST_BATCH_OUTPUT_DIR_PATH}/'
+                           f'{model_class_name}/{model_version}/'
+                           f'{CHECKPOINT_FILE_NAME}')
+    checkpoint: Dict[str, Dict[str, Optional[str]]] = (
+        _load_checkpoint(checkpoint_url)
+        if incremental
+        else {})
+
+    # apply the same loaded model to each unique type group
+    for _unique_type_group in (unique_type_group or (model.unique_type_group,)):  # noqa: E501
+        if incremental:
+            processed_versions: Dict[str, Optional[str]] = \
+                checkpoint.get(_unique_type_group, {})
+
+            new_versions: Dict[str, Optional[str]] = _new_partition_versions(
+                (EquipmentParquetDataSet(general_type=model.general_type,
+                                         unique_type_group=_unique_type_group)  # noqa: E501
+                 .load().partitionVersions(DATE_COL)),
+                processed_versions,
+                date=date, to_date=to_date)
+
+            if not new_versions:
+                print(f'\n{_unique_type_group}: No New or Changed Dates')
+                continue
+
+            new_dates: List[str] = sorted(new_versions)
+            from_date, _to_date = new_dates[0], new_dates[-1]
+
+        else:
+            from_date, _to_date = date, to_date
+
+        try:
+            parquet_ds: ParquetDataset = (
+                EquipmentParquetDataSet(general_type=model.general_type,
+                                        unique_type_group=_unique_type_group)  # noqa: E501
+                .load_by_date(date=from_date, to_date=_to_date))
+
+            if incremental:
+                # skip unchanged dates within new/changed date range
+                parquet_ds: ParquetDataset = \
+                    parquet_ds.filterByPartitionKeys((DATE_COL, tuple(new_dates)))  # noqa: E501
+
+        except Exception as err:   # pylint: disable=broad-except
+            print(f'*** {_unique_type_group}: {err} ***')
+            continue
+
+        output_dir_path: str = (f'{H1ST_BATCH_OUTPUT_DIR_PATH}/'
+                                f'{model_class_name}/{model_version}/'
+                                f'{_unique_type_group}')
+
+        # predict file by file, streaming detailed predictions to Parquet
+        with PartitionedParquetPredictionWriter(dir_path=output_dir_path) \
+                as writer:
+            for preds in model.iter_batch_predict_detailed(parquet_ds):
+                fault_preds: DataFrame = writer.write(preds)
+
+                # print positive predictions (by any component)
+                if not (summary_only or fault_preds.empty):
+                    print(fault_preds.to_string())
+
+        print(f'\n@ {output_dir_path}')
+
+        # summarize
+        if not summary_only:
+            print(writer.summary().to_string())
+
+        print(f'\n{_unique_type_group}: '
+              f'{(n_faults := writer.total["n_faults"]):,} '
+              'Predicted Daily Faults '
+              f'({100 * n_faults / max(n := writer.total["n_equipment_days"], 1):.3f}% '  # noqa: E501
+              f'of {n:,})')
+
+        # checkpoint only after successful processing
+        if incremental:
+            checkpoint[_unique_type_group] = {**processed_versions,
+                                              **new_versions}
+            _save_checkpoint(checkpoint, checkpoint_url)
@@ -0,0 +1,188 @@
+"""Bounded, memory-aware method result cache for data handlers.
+
+Results are keyed by owner identity, method & arguments,
+evicted in least-recently-used order beyond entry-count & byte limits,
+and purged once their owners are garbage-collected
+(owners are only weakly referenced).
+"""
+
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from functools import wraps
+import sys
+from threading import RLock
+from typing import Any, Optional
+import weakref
+
+from numpy import ndarray
+from pandas import DataFrame, Series
+
+from aito.util.namespace import Namespace
+
+
+__all__ = 'MethodCache', 'METHOD_CACHE', 'boundedMethodCache'
+
+
+# pylint: disable=invalid-name
+# e.g., camelCase names
+
+
+# default limits
+_MAX_N_ENTRIES: int = 1024
+_MAX_N_BYTES: int = 2 * 1024 ** 3   # 2 GiB
+
+
+def _estimateNBytes(value: Any, /) -> int:
+    """Estimate memory footprint of a cached value."""
+    if isinstance(value, (DataFrame, Series)):
+        return int(value.memory_usage(index=True, deep=False).sum()
+                   if isinstance(value, DataFrame)
+                   else value.memory_usage(index=True, deep=False))
+
+    if isinstance(value, ndarray):
+        return value.nbytes
+
+    if isinstance(reprSample := getattr(getattr(value, '_cache', None),
+                                        'reprSample', None),
+                  DataFrame):
+        # data handler carrying a materialized representative sample
+        return sys.getsizeof(value) + _estimateNBytes(reprSample)
+
+    return sys.getsizeof(value)
+
+
+class MethodCache:
+    """Bounded LRU cache of method results, keyed by owner identity."""
+
+    def __init__(self, maxNEntries: int = _MAX_N_ENTRIES,
+                 maxNBytes: int = _MAX_N_BYTES):
+        """Init method cache."""
+        self.maxNEntries: int = maxNEntries
+        self.maxNBytes: int = maxNBytes
+
+        self._entries: OrderedDict[tuple, tuple[Any, int]] = OrderedDict()
+        self._keysByOwner: dict[int, set[tuple]] = {}
+
+        self._nBytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._hitsByOwner: dict[int, int] = {}
+        self._missesByOwner: dict[int, int] = {}
+
+        self._lock: RLock = RLock()
+
+    def get(self, owner: Any, key: Hashable, default: Any = None) -> Any:
+        """Get cached value (or default) & record hit/miss."""
+        ownerID: int = id(owner)
+
+        with self._lock:
+            if (entry := self._entries.get(fullKey := (ownerID, key))) is None:
+                self._misses += 1
+                self._missesByOwner[ownerID] = \
+                    self._missesByOwner.get(ownerID, 0) + 1
+                return default
+
+            self._entries.move_to_end(fullKey)
+            self._hits += 1
+            self._hitsByOwner[ownerID] = self._hitsByOwner.get(ownerID, 0) + 1
+            return entry[0]
+
+    def put(self, owner: Any, key: Hashable, value: Any):
+        """Cache value, evicting least-recently-used entries beyond limits."""
+        ownerID: int = id(owner)
+
+        nBytes: int = _estimateNBytes(value)
+
+        with self._lock:
+            if ownerID not in self._keysByOwner:
+                self._keysByOwner[ownerID] = set()
+
+                # purge owner's entries once it is garbage-collected
+                weakref.finalize(owner, self.clear, ownerID)
+
+            fullKey: tuple = ownerID, key
+
+            if (oldEntry := self._entries.pop(fullKey, None)) is not None:
+                self._nBytes -= oldEntry[1]
+
+            self._entries[fullKey] = value, nBytes
+            self._keysByOwner[ownerID].add(fullKey)
+            self._nBytes += nBytes
+
+            while self._entries and ((len(self._entries) > self.maxNEntries) or
+                                     (self._nBytes > self.maxNBytes)):
+                evictedKey, (_, evictedNBytes) = \
+                    self._entries.popitem(last=False)
+                self._keysByOwner[evictedKey[0]].discard(evictedKey)
+                self._nBytes -= evictedNBytes
+                self._evictions += 1
+
+    def clear(self, ownerID: Optional[int] = None, /):
+        """Clear entries of specified owner (by ID), or all entries."""
+        with self._lock:
+            if ownerID is None:
+                self._entries.clear()
+                self._nBytes = 0
+
+                for keys in self._keysByOwner.values():
+                    keys.clear()
+
+                return
+
+            for fullKey in self._keysByOwner.pop(ownerID, set()):
+                if (entry := self._entries.pop(fullKey, None)) is not None:
+                    self._nBytes -= entry[1]
+
+            self._hitsByOwner.pop(ownerID, None)
+            self._missesByOwner.pop(ownerID, None)
+
+    def stats(self, owner: Optional[Any] = None) -> Namespace:
+        """Get hit/miss/eviction stats (of specified owner, or overall)."""
+        with self._lock:
+            if owner is None:
+                return Namespace(hits=self._hits, misses=self._misses,
+                                 evictions=self._evictions,
+                                 nEntries=len(self._entries),
+                                 nBytes=self._nBytes)
+
+            ownerID: int = id(owner)
+            ownerKeys: set[tuple] = self._keysByOwner.get(ownerID, set())
+
+            return Namespace(hits=self._hitsByOwner.get(ownerID, 0),
+                             misses=self._missesByOwner.get(ownerID, 0),
+                             nEntries=len(ownerKeys),
+                             nBytes=sum(self._entries[k][1]
+                                        for k in ownerKeys))
+
+
+# process-wide method cache
+METHOD_CACHE: MethodCache = MethodCache()
+
+
+def boundedMethodCache(method: Callable, /) -> Callable:
+    """Cache method results in the bounded process-wide method cache.
+
+    (drop-in replacement for ``lru_cache(maxsize=None)`` on instance methods,
+    without pinning instances or their results in memory indefinitely)
+    """
+    _MISSING: object = object()
+
+    @wraps(method)
+    def cachedMethod(self, *args: Hashable, **kwargs: Hashable) -> Any:
+        key: tuple = method.__name__, args, tuple(sorted(kwargs.items()))
+
+        if (result := METHOD_CACHE.get(self, key, _MISSING)) is _MISSING:
+            result: Any = method(self, *args, **kwargs)
+
+            # results that are the instance itself need no caching
+            # (and would otherwise keep it alive)
+            if result is not self:
+                METHOD_CACHE.put(self, key, result)
+
+        return result
+
+    return cachedMethod
@@ -0,0 +1,157 @@
+"""Persistent on-disk catalog of Parquet file metadata & schemas.
+
+Entries are keyed by file path plus file version
+(modification time & size),
+so that they are automatically invalidated when files are rewritten.
+"""
+
+
+from __future__ import annotations
+
+import datetime
+import json
+import os
+from pathlib import Path
+import sqlite3
+from threading import Lock
+from typing import Any, Optional, Union
+
+from pyarrow.ipc import read_schema as readSerializedSchema
+from pyarrow.lib import Schema, py_buffer  # pylint: disable=no-name-in-module
+from pyarrow.parquet import FileMetaData
+
+
+__all__ = 'FileMetadataCatalog', 'rowGroupStats'
+
+
+# pylint: disable=invalid-name
+# e.g., camelCase names
+
+
+# JSON-serializable row-group statistic values
+_STAT_VALUE_TYPES: tuple[type] = bool, int, float, str
+
+
+RowGroupStatsType = list[dict[str, Any]]
+
+
+def _statValue(value: Any, /) -> Optional[Union[bool, int, float, str]]:
+    if isinstance(value, _STAT_VALUE_TYPES):
+        return value
+
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+
+    return None
+
+
+def rowGroupStats(metadata: FileMetaData, /) -> RowGroupStatsType:
+    """Extract per-row-group row counts & per-column min/max/null counts."""
+    stats: RowGroupStatsType = []
+
+    for i in range(metadata.num_row_groups):
+        rowGroup = metadata.row_group(i)
+
+        colStats: dict[str, tuple[Any, Any, Optional[int]]] = {}
+
+        for j in range(rowGroup.num_columns):
+            colChunk = rowGroup.column(j)
+
+            if (statistics := colChunk.statistics) is not None:
+                hasMinMax: bool = statistics.has_min_max
+
+                colStats[colChunk.path_in_schema] = (
+                    _statValue(statistics.min) if hasMinMax else None,
+                    _statValue(statistics.max) if hasMinMax else None,
+                    (statistics.null_count
+                     if statistics.has_null_count
+                     else None))
+
+        stats.append(dict(nRows=rowGroup.num_rows, colStats=colStats))
+
+    return stats
+
+
+class FileMetadataCatalog:
+    """SQLite-backed catalog of Parquet file metadata & schemas."""
+
+    _SCHEMA_DDL: str = ('CREATE TABLE IF NOT EXISTS files ('
+                        'filePath TEXT PRIMARY KEY, '
+                        'version TEXT NOT NULL, '
+                        'arrowSchema BLOB NOT NULL, '
+                        'nCols INTEGER NOT NULL, '
+                        'nRows INTEGER NOT NULL, '
+                        'rowGroupStats TEXT NOT NULL)')
+
+    def __init__(self, dbPath: Path, /):
+        """Init catalog."""
+        self.dbPath: Path = dbPath
+
+        self._lock: Lock = Lock()
+
+        # connections are (re)opened lazily per process
+        self._conn: Optional[sqlite3.Connection] = None
+        self._connPID: Optional[int] = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get picklable state."""
+        return dict(dbPath=self.dbPath)
+
+    def __setstate__(self, state: dict[str, Any], /):
+        """Restore state."""
+        self.__init__(state['dbPath'])
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Get SQLite connection for current process."""
+        if (self._conn is None) or (self._connPID != os.getpid()):
+            self.dbPath.parent.mkdir(parents=True, exist_ok=True)
+
+            self._conn = sqlite3.connect(database=self.dbPath,
+                                         timeout=60,
+                                         isolation_level=None,
+                                         check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(self._SCHEMA_DDL)
+
+            self._connPID = os.getpid()
+
+        return self._conn
+
+    def get(self, filePath: str, version: Optional[str]) \
+            -> Optional[tuple[Schema, int, int, RowGroupStatsType]]:
+        """Get (schema, nCols, nRows, rowGroupStats) of file version."""
+        if not version:
+            return None
+
+        with self._lock:
+            row: Optional[tuple] = self.conn.execute(
+                'SELECT arrowSchema, nCols, nRows, rowGroupStats FROM files '
+                'WHERE filePath = ? AND version = ?',
+                (filePath, version)).fetchone()
+
+        if row is None:
+            return None
+
+        arrowSchema, nCols, nRows, stats = row
+        return (readSerializedSchema(py_buffer(arrowSchema)),
+                nCols, nRows, json.loads(stats))
+
+    def put(self, filePath: str, version: Optional[str],
+            schema: Schema, metadata: FileMetaData) -> RowGroupStatsType:
+        """Record schema, column/row counts & row-group stats of file version.
+
+        (only recorded if file version is known)
+        """
+        stats: RowGroupStatsType = rowGroupStats(metadata)
+
+        if version:
+            with self._lock:
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)',
+                    (filePath, version,
+                     schema.serialize().to_pybytes(),
+                     metadata.num_columns, metadata.num_rows,
+                     json.dumps(stats)))
+
+        return stats
@@ -0,0 +1,154 @@
+"""Mergeable running statistics for incrementally refitting ML preprocessors.
+
+Numerical statistics combine per-batch counts, means
+& sums of squared deviations with the parallel form of Welford's algorithm
+(Chan et al.), so that merging batch statistics equals
+computing them over all batches at once.
+Categorical statistics are plain per-category frequency counts.
+"""
+
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+import math
+from typing import Any, Optional
+
+from numpy import generic, ndarray
+from pandas import Series
+
+from aito.util.data_types.python import PyPossibleFeatureType
+
+
+__all__ = 'RunningCatCounts', 'RunningNumStats'
+
+
+# pylint: disable=invalid-name
+# e.g., camelCase names
+
+
+@dataclass(init=True,
+           repr=True,
+           eq=True,
+           order=False,
+           unsafe_hash=False,
+           frozen=True)
+class RunningNumStats:
+    """Running count, mean, sum of squared deviations, min & max."""
+
+    n: int = 0
+    mean: float = 0.
+    m2: float = 0.   # sum of squared deviations from mean
+    min: Optional[float] = None
+    max: Optional[float] = None
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (with 1 delta degree of freedom)."""
+        return (math.sqrt(self.m2 / (self.n - 1))
+                if self.n > 1
+                else float('nan'))
+
+    @classmethod
+    def fromValues(cls, values: ndarray, /) -> RunningNumStats:
+        """Compute statistics of (valid, non-NULL) values."""
+        if not (n := len(values)):
+            return cls()
+
+        mean: float = float(values.mean())
+
+        return cls(n=n,
+                   mean=mean,
+                   m2=float(((values - mean) ** 2).sum()),
+                   min=float(values.min()),
+                   max=float(values.max()))
+
+    def merge(self, other: RunningNumStats, /) -> RunningNumStats:
+        """Merge with statistics of other data."""
+        if not other.n:
+            return self
+
+        if not self.n:
+            return other
+
+        n: int = self.n + other.n
+        delta: float = other.mean - self.mean
+
+        return RunningNumStats(n=n,
+                               mean=self.mean + delta * other.n / n,
+                               m2=(self.m2 + other.m2 +
+                                   delta ** 2 * self.n * other.n / n),
+                               min=min(self.min, other.min),
+                               max=max(self.max, other.max))
+
+    def toDict(self) -> dict[str, Any]:
+        """Convert to serializable dict."""
+        return dict(n=self.n, mean=self.mean, m2=self.m2,
+                    min=self.min, max=self.max)
+
+    @classmethod
+    def fromDict(cls, d: Optional[dict[str, Any]], /) -> RunningNumStats:
+        """Restore from serialized dict."""
+        return cls(**d) if d else cls()
+
+
+@dataclass(init=True,
+           repr=False,
+           eq=True,
+           order=False,
+           unsafe_hash=False,
+           frozen=True)
+class RunningCatCounts:
+    """Running per-category frequency counts."""
+
+    counts: Counter
+
+    def __repr__(self) -> str:
+        """Return string repr."""
+        return (f'{type(self).__name__}[{len(self.counts):,} categories '
+                f'counting {self.n:,} values]')
+
+    @property
+    def n(self) -> int:
+        """Number of counted values."""
+        return sum(self.counts.values())
+
+    @classmethod
+    def fromValues(cls, values: Series, /) -> RunningCatCounts:
+        """Count (non-NULL) values."""
+        return cls(counts=Counter(values.value_counts(normalize=False,
+                                                      sort=False,
+                                                      ascending=False,
+                                                      dropna=True)
+                                  .to_dict()))
+
+    def merge(self, other: RunningCatCounts, /) -> RunningCatCounts:
+        """Merge with counts of other data."""
+        return RunningCatCounts(counts=self.counts + other.counts)
+
+    def top(self, n: int, /) -> RunningCatCounts:
+        """Keep only the counts of the ``n`` most frequent categories."""
+        return (self
+                if len(self.counts) <= n
+                else RunningCatCounts(
+                    counts=Counter(dict(self.counts.most_common(n)))))
+
+    def mostCommon(self, n: Optional[int] = None, /) \
+            -> list[PyPossibleFeatureType]:
+        """Get categories in descending order of frequency."""
+        return [cat for cat, _ in self.counts.most_common(n)]
+
+    def toPairs(self) -> list[list]:
+        """Convert to serializable [category, count] pairs."""
+        return [[cat.item() if isinstance(cat, generic) else cat, int(count)]
+                for cat, count in self.counts.items()]
+
+    @classmethod
+    def fromPairs(cls, pairs: Optional[Iterable[Sequence]], /) \
+            -> RunningCatCounts:
+        """Restore from serialized [category, count] pairs."""
+        return cls(counts=Counter({cat: count for cat, count in pairs}
+                                  if pairs
+                                  else {}))
@@ -0,0 +1,134 @@
+"""Mergeable approximate quantile sketch.
+
+Each sketch is a weighted equi-depth summary of sorted values:
+at most ``maxNPoints`` points, each standing for an equal share of rows.
+Summarizing ``n`` values this way mis-estimates ranks
+by at most ``n / maxNPoints``, and merging summaries
+(then re-summarizing) at most doubles that,
+so ``maxNPoints = ceil(2 / rankError)`` guarantees the requested rank error
+for per-file sketches merged once, e.g. in ``ParquetDataset.reduce(...)``.
+"""
+
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+import math
+from typing import Union
+
+from numpy import (asarray, concatenate, cumsum, float64, full, interp, isnan,
+                   linspace, ndarray, ones, searchsorted, sort)
+from pandas import Series
+
+
+__all__ = 'QuantileSketch', 'nPointsForRankError'
+
+
+# pylint: disable=invalid-name
+# e.g., camelCase names
+
+
+def nPointsForRankError(rankError: float, /) -> int:
+    """Get number of sketch points guaranteeing rank error (as proportion)."""
+    assert 0 < rankError < 1, \
+        ValueError(f'*** RANK ERROR {rankError} NOT IN (0, 1) ***')
+    return int(math.ceil(2 / rankError))
+
+
+@dataclass(init=True,
+           repr=False,
+           eq=False,
+           order=False,
+           unsafe_hash=False,
+           frozen=True)
+class QuantileSketch:
+    """Weighted equi-depth quantile summary."""
+
+    values: ndarray   # sorted
+    weights: ndarray
+    maxNPoints: int
+
+    @property
+    def n(self) -> float:
+        """Number of summarized values."""
+        return float(self.weights.sum())
+
+    def __repr__(self) -> str:
+        """Return string repr."""
+        return (f'{type(self).__name__}[{len(self.values):,} points '
+                f'summarizing {self.n:,.0f} values]')
+
+    @classmethod
+    def _summarize(cls, values: ndarray, weights: ndarray,
+                   maxNPoints: int) -> QuantileSketch:
+        # values must already be sorted
+        if len(values) <= maxNPoints:
+            return cls(values=values, weights=weights, maxNPoints=maxNPoints)
+
+        cumWeights: ndarray = cumsum(weights)
+        total: float = cumWeights[-1]
+
+        # pick values at mid-points of maxNPoints equal-weight rank buckets
+        idx: ndarray = searchsorted(
+            cumWeights,
+            ((linspace(0, maxNPoints - 1, maxNPoints) + .5) *
+             (total / maxNPoints)),
+            side='left').clip(max=len(values) - 1)
+
+        return cls(values=values[idx],
+                   weights=full(shape=maxNPoints,
+                                fill_value=total / maxNPoints,
+                                dtype=float64),
+                   maxNPoints=maxNPoints)
+
+    @classmethod
+    def fromValues(cls, values: Union[Series, ndarray, Sequence[float]],
+                   maxNPoints: int) -> QuantileSketch:
+        """Summarize values (ignoring NaNs/NULLs)."""
+        if isinstance(values, Series):
+            values: Series = values.dropna()
+
+        values: ndarray = asarray(values, dtype=float64)
+        values: ndarray = sort(values[~isnan(values)], kind='quicksort')
+
+        return cls._summarize(values=values,
+                              weights=ones(shape=len(values), dtype=float64),
+                              maxNPoints=maxNPoints)
+
+    @classmethod
+    def merge(cls, sketches: Sequence[QuantileSketch]) -> QuantileSketch:
+        """Merge sketches (e.g., of different files) into 1."""
+        maxNPoints: int = max(sketch.maxNPoints for sketch in sketches)
+
+        values: ndarray = concatenate([sketch.values for sketch in sketches])
+        weights: ndarray = concatenate([sketch.weights for sketch in sketches])
+
+        order: ndarray = values.argsort(kind='mergesort')
+
+        return cls._summarize(values=values[order], weights=weights[order],
+                              maxNPoints=maxNPoints)
+
+    def quantile(self, q: Union[float, Sequence[float]] = .5) \
+            -> Union[float, Series]:
+        """Approximate quantile(s) by interpolating between sketch points."""
+        if not len(self.values):
+            return (float('nan')
+                    if isinstance(q, (float, int))
+                    else Series([float('nan')] * len(q),
+                                index=list(q), dtype=float64))
+
+        # rank positions (in [0, 1]) of points,
+        # consistent with pandas' linear interpolation
+        cumWeights: ndarray = cumsum(self.weights)
+        positions: ndarray = (
+            (cumWeights - self.weights / 2 - .5) / (cumWeights[-1] - 1)
+            if cumWeights[-1] > 1
+            else cumWeights * 0)
+
+        result: ndarray = interp(asarray(q, dtype=float64),
+                                 positions, self.values)
+
+        return (float(result)
+                if isinstance(q, (float, int))
+                else Series(result, index=list(q), dtype=float64))
@@ -4,14 +4,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
+from hashlib import sha1
 from itertools import chain
+import json
 from pathlib import Path
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 from typing import Dict, List, Sequence, Tuple   # Py3.9+: use built-ins
 
-from numpy import array, full, ndarray, tile
-from pandas import concat, DataFrame, Series
+from numpy import (array, asarray, bincount, empty, errstate, float32, float64, frombuffer, full,
+                   int64, isfinite, isnan, load as loadNumPy, median, minimum, nan, ndarray,
+                   newaxis, ones, savez, searchsorted, tile, uint8, where, zeros)
+from pandas import concat, DataFrame, Index, MultiIndex, Series, notnull
 from pandas._libs.missing import NA   # pylint: disable=no-name-in-module
+from pandas.api.types import is_integer_dtype
 from sklearn.preprocessing import MaxAbsScaler, MinMaxScaler, StandardScaler
 
 from aito.util.data_types.python import PyPossibleFeatureType
@@ -20,6 +26,8 @@ from aito.util.fs import PathType
 from aito.util.iter import to_iterable
 from aito.util.namespace import Namespace, DICT_OR_NAMESPACE_TYPES
 
+from ._running_stats import RunningCatCounts, RunningNumStats
+
 
 __all__ = (
     'PandasFlatteningSubsampler',
@@ -52,7 +60,7 @@ class PandasFlatteningSubsampler:
         """Integer row index range."""
         return range(0, self.totalNRows, self.everyNRows)
 
-    @property
+    @cached_property
     def transformedCols(self) -> List[str]:
         """Flattened column names."""
         r: range = self.rowIndexRange
@@ -91,6 +99,55 @@ class PandasFlatteningSubsampler:
                       index=self.transformedCols,
                       dtype=None, name=None, copy=False, fastpath=False)
 
+    def flattenGroups(self, pandasDF: DataFrame, /, *, by: Sequence[str],
+                      padWithLastRow: bool = False) -> DataFrame:
+        # pylint: disable=too-many-locals
+        """Subsample & flatten each group of rows in 1 vectorized pass.
+
+        Equivalent to ``pandasDF.groupby(by=by, sort=False, dropna=True)
+        .apply(func=self, padWithLastRow=padWithLastRow)``,
+        without per-group Python overhead.
+        """
+        by: List[str] = to_iterable(by, iterable_type=list)
+        cols: List[str] = to_iterable(self.columns, iterable_type=list)
+
+        groupBy = pandasDF.groupby(by=by, axis='index', level=None, as_index=True,
+                                   sort=False, group_keys=False, observed=False, dropna=True)
+
+        # group numbers in order of first appearance
+        # (rows with NULL group keys are dropped)
+        inGroups: ndarray = pandasDF[by].notnull().all(axis='columns').to_numpy(dtype=bool)
+        groupIDs: ndarray = groupBy.ngroup().to_numpy()[inGroups].astype(int64, copy=False)
+
+        nGroups: int = groupBy.ngroups
+        groupSizes: ndarray = bincount(groupIDs, minlength=nGroups)
+
+        # row order grouped by group number (stably, i.e., preserving within-group order)
+        rowOrder: ndarray = groupIDs.argsort(kind='stable')
+        groupStarts: ndarray = groupSizes.cumsum() - groupSizes
+
+        # source row (within grouped row order) of each subsampled row of each group,
+        # forward-filling groups with too few rows with their last rows
+        rowIndices: ndarray = array(self.rowIndexRange, dtype=int64)
+        isPadded: ndarray = rowIndices[newaxis, :] >= groupSizes[:, newaxis]
+        srcRows: ndarray = rowOrder[groupStarts[:, newaxis] +
+                                    minimum(rowIndices[newaxis, :], groupSizes[:, newaxis] - 1)]
+
+        # (groups x subsampled rows x columns) -> (groups x (columns x subsampled rows))
+        values: ndarray = pandasDF[cols].to_numpy()[inGroups][srcRows]
+
+        if (not padWithLastRow) and isPadded.any():
+            values: ndarray = values.astype(object, copy=False)
+            values[isPadded] = NA
+
+        keys: DataFrame = pandasDF.loc[inGroups, by].iloc[rowOrder[groupStarts]]
+
+        return DataFrame(data=values.transpose(0, 2, 1).reshape(nGroups, -1),
+                         index=(MultiIndex.from_frame(keys)
+                                if len(by) > 1
+                                else Index(data=keys[by[0]], name=by[0])),
+                         columns=self.transformedCols)
+
 
 class PandasMLPreprocessor:
     # pylint: disable=too-many-instance-attributes,too-few-public-methods
@@ -99,7 +156,30 @@ class PandasMLPreprocessor:
     _CAT_INDEX_SCALED_FIELD_NAME: str = '__CAT_IDX_SCALED__'
     _NUM_SCALER_FIELD_NAME: str = '__NUM_SCALER__'
 
-    _PREPROC_CACHE: Dict[Path, Namespace] = {}
+    # per-column running statistics for incremental refitting
+    _RUNNING_CAT_COUNTS_KEY: str = 'running-counts'
+    _RUNNING_NUM_STATS_KEY: str = 'running-stats'
+
+    # outlier-robust (lower, upper) bounds of fitted numerical columns
+    # (None for tails not treated as out-lying)
+    _OUTLIER_RST_RANGE_KEY: str = 'outlier-rst-range'
+
+    # default max number of running category counts kept per vocabulary slot
+    _RUNNING_CAT_COUNTS_PER_CAT: int = 10
+
+    # absolute tolerance for matching numerical categories
+    _FLOAT_ABS_TOL: float = 1e-9
+
+    # NumPy equivalents of Pandas NULL-fill statistics
+    _NUMPY_NULL_FILL_STATS: Dict[str, Callable[[ndarray], float]] = dict(
+        mean=ndarray.mean, min=ndarray.min, max=ndarray.max, median=median)
+
+    # loaded/saved preprocessors by file content hash
+    _PREPROC_CACHE: Dict[str, PandasMLPreprocessor] = {}
+
+    # binary NPZ file layout
+    _NPZ_MAP_KEY: str = '__ORIG_TO_PREPROC_COL_MAP_JSON__'
+    _NPZ_ARRAY_KEY: str = '__NPZ_ARRAY__'
 
     def __init__(self, origToPreprocColMap: Namespace):
         """Init ML Preprocessor."""
@@ -189,37 +269,69 @@ class PandasMLPreprocessor:
         self.sortedPreprocCols: List[str] = (self.sortedCatPreprocCols +
                                              self.sortedNumPreprocCols)
 
+    @classmethod
+    def _floatCatIndices(cls, values: ndarray, /, *,
+                         sortedCats: Sequence[PyPossibleFeatureType]) -> ndarray:
+        """Match float values to numerical categories within tolerance (-1 if none)."""
+        # nearest sorted float category on either side, if within tolerance
+        cats: ndarray = asarray(sortedCats, dtype=float64)
+        catOrder: ndarray = cats.argsort(kind='stable')
+        cats: ndarray = cats[catOrder]
+
+        indices: ndarray = full(shape=len(values), fill_value=-1, dtype=int64)
+
+        if len(cats):
+            rightPos: ndarray = searchsorted(cats, values, side='left').clip(max=len(cats) - 1)
+
+            with errstate(invalid='ignore'):
+                for pos in (rightPos, (rightPos - 1).clip(min=0)):
+                    isMatch: ndarray = abs(values - cats[pos]) <= cls._FLOAT_ABS_TOL
+                    indices[isMatch] = catOrder[pos[isMatch]]
+
+        return indices
+
+    @classmethod
+    def _catIndices(cls, series: Series, /, *,
+                    sortedCats: Sequence[PyPossibleFeatureType], nCats: int,
+                    numeric: bool) -> Series:
+        """Map categorical data to integer indices in 1 pass per column.
+
+        Out-of-vocabulary values & NULLs (incl. those of nullable extension types)
+        all map to ``nCats``.
+        Numerical categories are matched within an absolute tolerance.
+        """
+        isNull: ndarray = series.isna().to_numpy(dtype=bool)
+
+        if numeric and not (is_integer_dtype(series.dtype) and
+                            all(isinstance(cat, int) for cat in sortedCats)):
+            indices: ndarray = cls._floatCatIndices(series.to_numpy(dtype=float64, na_value=nan),
+                                                    sortedCats=sortedCats)
+
+        else:
+            # exact (hash-based) lookup
+            indices: ndarray = (Index(data=list(sortedCats), dtype=None if numeric else object)
+                                .get_indexer(target=series)
+                                .astype(int64, copy=True))
+
+        indices[(indices < 0) | isNull] = nCats
+
+        return Series(data=indices, index=series.index)
+
     def __call__(self, pandasDF: DataFrame, /, *, returnNumPy: bool = False) \
             -> Union[DataFrame, ndarray]:
         # pylint: disable=too-many-locals
         """Preprocess a Pandas Data Frame."""
-        _FLOAT_ABS_TOL: float = 1e-9
-
         if self.sortedCatCols:   # preprocess categorical columns
             for catCol, catPreprocDetails in self.catOrigToPreprocColMap.items():
                 nCats: int = catPreprocDetails['n-cats']
-                sortedCats: Sequence[PyPossibleFeatureType] = catPreprocDetails['sorted-cats']
-
-                # extract categorical data column
-                series: Series = pandasDF[catCol]
 
                 # transform categorical data column into integer indices
-                pandasDF.loc[:, (catPreprocCol := catPreprocDetails['transform-to'])] = (
-
-                    (sum(((series == cat) * i) for i, cat in enumerate(sortedCats)) +
-                     ((~series.isin(sortedCats)) * nCats))
-
-                    if catPreprocDetails['physical-type'] in (bool.__name__, _STR_TYPE)
-
-                    else (sum(((series - cat).abs().between(left=0, right=_FLOAT_ABS_TOL) * i)
-                              for i, cat in enumerate(sortedCats)) +
-                          ((1 - sum(((series - cat).abs().between(left=0, right=_FLOAT_ABS_TOL) * 1)
-                                    for cat in sortedCats)) * nCats)))
-
-                # *** NOTE: NumPy BUG ***
-                # abs(...) of a data type most negative value equals to the same most negative value
-                # github.com/numpy/numpy/issues/5657
-                # github.com/numpy/numpy/issues/9463
+                pandasDF.loc[:, (catPreprocCol := catPreprocDetails['transform-to'])] = \
+                    self._catIndices(pandasDF[catCol],
+                                     sortedCats=catPreprocDetails['sorted-cats'],
+                                     nCats=nCats,
+                                     numeric=(catPreprocDetails['physical-type']
+                                              not in (bool.__name__, _STR_TYPE)))
 
                 if self.catIdxScaled:
                     # MinMax-scale categorical data integer indices
@@ -268,15 +380,257 @@ class PandasMLPreprocessor:
 
         return pandasDF[self.sortedPreprocCols].values if returnNumPy else pandasDF
 
+    @cached_property
+    def _compiled(self) -> Namespace:
+        """Pre-compute lookup tables & per-column scale/offset vectors."""
+        nCatCols: int = len(self.sortedCatCols)
+
+        catScales: ndarray = ones(shape=nCatCols, dtype=float64)
+        catOffsets: ndarray = zeros(shape=nCatCols, dtype=float64)
+
+        for i, catCol in enumerate(self.sortedCatCols):
+            if self.catIdxScaled:
+                catScales[i] = 2 / self.catOrigToPreprocColMap[catCol]['n-cats']
+                catOffsets[i] = -1
+
+        numScales: ndarray = ones(shape=len(self.sortedNumCols), dtype=float64)
+        numOffsets: ndarray = zeros(shape=len(self.sortedNumCols), dtype=float64)
+
+        if self.sortedNumCols and self.numScaler:
+            if isinstance(self.numScaler, StandardScaler):
+                numScales: ndarray = 1 / self.numScaler.scale_
+                numOffsets: ndarray = -self.numScaler.mean_ / self.numScaler.scale_
+
+            elif isinstance(self.numScaler, MaxAbsScaler):
+                numScales: ndarray = 1 / self.numScaler.scale_
+
+            elif isinstance(self.numScaler, MinMaxScaler):
+                numScales: ndarray = self.numScaler.scale_
+                numOffsets: ndarray = self.numScaler.min_
+
+        return Namespace(
+            cat=[(catCol,
+                  (catPreprocDetails := self.catOrigToPreprocColMap[catCol])['sorted-cats'],
+                  catPreprocDetails['n-cats'],
+                  catPreprocDetails['physical-type'] not in (bool.__name__, _STR_TYPE),
+                  catScales[i], catOffsets[i])
+                 for i, catCol in enumerate(self.sortedCatCols)],
+
+            num=[(numCol,
+                  *(numPreprocDetails := self.numOrigToPreprocColMap[numCol])['nulls'],
+                  numPreprocDetails['null-fill-method'],
+                  (nan
+                   if (nullFillValue := numPreprocDetails['null-fill-value']) is None
+                   else nullFillValue),
+                  numScales[i], numOffsets[i])
+                 for i, numCol in enumerate(self.sortedNumCols)])
+
+    def transformToNumPy(self, pandasDF: DataFrame, /, *,
+                         out: Optional[ndarray] = None) -> ndarray:
+        # pylint: disable=too-many-locals
+        """Preprocess a Pandas Data Frame directly into a float32 matrix.
+
+        (columns are in ``sortedPreprocCols`` order;
+        the input Data Frame is left untouched)
+        """
+        if out is None:
+            out: ndarray = empty(shape=(len(pandasDF), len(self.sortedPreprocCols)),
+                                 dtype=float32, order='F')
+
+        else:
+            assert out.shape == (len(pandasDF), len(self.sortedPreprocCols)), \
+                ValueError(f'*** OUTPUT ARRAY SHAPE {out.shape} != '
+                           f'{(len(pandasDF), len(self.sortedPreprocCols))} ***')
+
+        j: int = 0
+
+        for catCol, sortedCats, nCats, numeric, scale, offset in self._compiled.cat:
+            out[:, j] = (self._catIndices(pandasDF[catCol],
+                                          sortedCats=sortedCats, nCats=nCats, numeric=numeric)
+                         .to_numpy(dtype=float64, na_value=nan) * scale + offset)
+            j += 1
+
+        for (numCol, lowerNull, upperNull, nullFillMethod, nullFillValue,
+             scale, offset) in self._compiled.num:
+            values: ndarray = pandasDF[numCol].to_numpy(dtype=float64, na_value=nan)
+
+            # check numerical data validity
+            isValid: ndarray = ~isnan(values)
+            if lowerNull is not None:
+                isValid &= (values > lowerNull)
+            if upperNull is not None:
+                isValid &= (values < upperNull)
+
+            if nullFillMethod and isValid.any():
+                validValues: ndarray = values[isValid]
+
+                nullFillValue: float = (
+                    statFunc(validValues)
+                    if (statFunc := self._NUMPY_NULL_FILL_STATS.get(nullFillMethod))
+                    else getattr(Series(data=validValues), nullFillMethod)(skipna=True))
+
+            # NULL-fill & scale numerical data column
+            out[:, j] = where(isValid, values, nullFillValue) * scale + offset
+            j += 1
+
+        return out
+
+    def transformToDataFrame(self, pandasDF: DataFrame, /, *,
+                             keepCols: Sequence[str] = ()) -> DataFrame:
+        """Preprocess a Pandas Data Frame into a new float32 Data Frame.
+
+        (with specified original columns kept alongside preprocessed columns)
+        """
+        df: DataFrame = DataFrame(data=self.transformToNumPy(pandasDF),
+                                  index=pandasDF.index,
+                                  columns=self.sortedPreprocCols,
+                                  copy=False)
+
+        for col in keepCols:
+            df[col] = pandasDF[col]
+
+        return df
+
+    def _copiedOrigToPreprocColMap(self) -> Namespace:
+        # per-column details are copied, so that cached/shared preprocessors
+        # (e.g., loaded ones in ``_PREPROC_CACHE``) are never mutated
+        return Namespace(**{
+            col: (dict(preprocDetails.items())
+                  if isinstance(preprocDetails, DICT_OR_NAMESPACE_TYPES)
+                  else preprocDetails)
+            for col, preprocDetails in self.origToPreprocColMap.items()})
+
+    def update(self, pandasDF: DataFrame, /, *,
+               maxNCats: Optional[int] = None) -> PandasMLPreprocessor:
+        """Get new preprocessor with running statistics updated with new data.
+
+        Category frequency counts and Welford count/mean/variance & min/max
+        of valid finite numerical values are merged into a copy of ``origToPreprocColMap``
+        (hence saved alongside it), e.g., for new partitions:
+        ``parquetDS.foldBatches(PandasMLPreprocessor.update, preproc, *newFilePaths)``.
+
+        Numerical values outside fitted outlier-robust ranges are not counted,
+        as when fitting, and only the ``maxNCats`` (by default 10x current vocabulary sizes)
+        most frequent categories' counts are kept.
+        Running statistics only cover data passed to ``.update(...)``
+        (by ``ParquetDataset.preprocForML(...)`` only if ``seedRunningStats=True``).
+        Fitted transformations only change upon ``.refit(...)``.
+        """
+        origToPreprocColMap: Namespace = self._copiedOrigToPreprocColMap()
+
+        for catCol in self.sortedCatCols:
+            catPreprocDetails: Namespace = origToPreprocColMap[catCol]
+
+            catPreprocDetails[self._RUNNING_CAT_COUNTS_KEY] = (
+                RunningCatCounts.fromPairs(catPreprocDetails.get(self._RUNNING_CAT_COUNTS_KEY))
+                .merge(RunningCatCounts.fromValues(pandasDF[catCol]))
+                .top(maxNCats or (self._RUNNING_CAT_COUNTS_PER_CAT *
+                                  max(catPreprocDetails['n-cats'], 1)))
+                .toPairs())
+
+        for numCol in self.sortedNumCols:
+            numPreprocDetails: Namespace = origToPreprocColMap[numCol]
+
+            lowerNull, upperNull = numPreprocDetails['nulls']
+            lowerBound, upperBound = numPreprocDetails.get(self._OUTLIER_RST_RANGE_KEY,
+                                                           (None, None))
+
+            values: ndarray = pandasDF[numCol].to_numpy(dtype=float64, na_value=nan)
+
+            isValid: ndarray = isfinite(values)
+            if lowerNull is not None:
+                isValid &= (values > lowerNull)
+            if upperNull is not None:
+                isValid &= (values < upperNull)
+            if lowerBound is not None:
+                isValid &= (values >= lowerBound)
+            if upperBound is not None:
+                isValid &= (values <= upperBound)
+
+            numPreprocDetails[self._RUNNING_NUM_STATS_KEY] = (
+                RunningNumStats.fromDict(numPreprocDetails.get(self._RUNNING_NUM_STATS_KEY))
+                .merge(RunningNumStats.fromValues(values[isValid]))
+                .toDict())
+
+        return type(self)(origToPreprocColMap=origToPreprocColMap)
+
+    def refit(self, *, maxNCats: Optional[int] = None) -> PandasMLPreprocessor:
+        """Get new preprocessor refitted from running statistics.
+
+        Non-boolean categorical vocabularies become the most frequent valid categories
+        (up to ``maxNCats``, by default current vocabulary sizes);
+        numerical NULL-fill values (by mean/min/max) and scaler parameters
+        become running means, standard deviations, mins & maxes,
+        which stay within fitted outlier-robust ranges
+        because out-lying values are never counted by ``.update(...)``.
+        Columns without running statistics keep their current parameters.
+        """
+        origToPreprocColMap: Namespace = self._copiedOrigToPreprocColMap()
+
+        for catCol in self.sortedCatCols:
+            catPreprocDetails: Namespace = origToPreprocColMap[catCol]
+
+            if (catPreprocDetails['physical-type'] == bool.__name__) or not (
+                    catCounts := RunningCatCounts.fromPairs(
+                        catPreprocDetails.get(self._RUNNING_CAT_COUNTS_KEY))).n:
+                continue
+
+            isStr: bool = catPreprocDetails['physical-type'] == _STR_TYPE
+
+            sortedCats: Tuple[PyPossibleFeatureType] = tuple(
+                cat
+                for cat in catCounts.mostCommon()
+                if notnull(cat) and ((cat != '') if isStr else isfinite(cat))
+            )[:(maxNCats or len(catPreprocDetails['sorted-cats']))]
+
+            catPreprocDetails['sorted-cats'] = sortedCats
+            catPreprocDetails['n-cats'] = len(sortedCats)
+
+        for numCol in self.sortedNumCols:
+            numPreprocDetails: Namespace = origToPreprocColMap[numCol]
+
+            if not (numStats := RunningNumStats.fromDict(
+                    numPreprocDetails.get(self._RUNNING_NUM_STATS_KEY))).n:
+                continue
+
+            if (nullFillMethod := numPreprocDetails['null-fill-method']) in ('mean', 'min', 'max'):
+                numPreprocDetails['null-fill-value'] = getattr(numStats, nullFillMethod)
+
+            if 'mean' in numPreprocDetails:   # standard scaler
+                numPreprocDetails['mean'] = numStats.mean
+
+                if numStats.n > 1:
+                    numPreprocDetails['std'] = numStats.std
+
+            if 'max-abs' in numPreprocDetails:
+                numPreprocDetails['max-abs'] = max(abs(numStats.min), abs(numStats.max))
+
+            if 'orig-min' in numPreprocDetails:
+                numPreprocDetails['orig-min'] = numStats.min
+                numPreprocDetails['orig-max'] = numStats.max
+
+        return type(self)(origToPreprocColMap=origToPreprocColMap)
+
+    @staticmethod
+    def _fileContentHash(path: Path, /) -> str:
+        return sha1(path.read_bytes()).hexdigest()
+
     @classmethod
-    def from_json(cls, path: PathType) -> PandasMLPreprocessor:
-        """Load from JSON file."""
+    def _fromFile(cls, path: PathType, load: Callable[[Path], Namespace]) \
+            -> PandasMLPreprocessor:
+        # loaded preprocessors are cached by file content,
+        # so that repeated loads (e.g., from different temporary files) share 1 object
         path: Path = Path(path).resolve(strict=True)
 
-        if path not in cls._PREPROC_CACHE:
-            cls._PREPROC_CACHE[path] = cls(origToPreprocColMap=Namespace.from_json(path=path))
+        if (contentHash := cls._fileContentHash(path)) not in cls._PREPROC_CACHE:
+            cls._PREPROC_CACHE[contentHash] = cls(origToPreprocColMap=load(path))
 
-        return cls._PREPROC_CACHE[path]
+        return cls._PREPROC_CACHE[contentHash]
+
+    @classmethod
+    def from_json(cls, path: PathType) -> PandasMLPreprocessor:
+        """Load from JSON file."""
+        return cls._fromFile(path, load=Namespace.from_json)
 
     def to_json(self, path: PathType):
         """Save to JSON file."""
@@ -284,17 +638,12 @@ class PandasMLPreprocessor:
 
         self.origToPreprocColMap.to_json(path=path)
 
-        self._PREPROC_CACHE[path] = self
+        self._PREPROC_CACHE[self._fileContentHash(path)] = self
 
     @classmethod
     def from_yaml(cls, path: PathType) -> PandasMLPreprocessor:
         """Load from YAML file."""
-        path: Path = Path(path).resolve(strict=True)
-
-        if path not in cls._PREPROC_CACHE:
-            cls._PREPROC_CACHE[path] = cls(origToPreprocColMap=Namespace.from_yaml(path=path))
-
-        return cls._PREPROC_CACHE[path]
+        return cls._fromFile(path, load=Namespace.from_yaml)
 
     def to_yaml(self, path: PathType):
         """Save to YAML file."""
@@ -302,4 +651,62 @@ class PandasMLPreprocessor:
 
         self.origToPreprocColMap.to_yaml(path=path)
 
-        self._PREPROC_CACHE[path] = self
+        self._PREPROC_CACHE[self._fileContentHash(path)] = self
+
+    @classmethod
+    def _loadNPZ(cls, path: Path, /) -> Namespace:
+        with loadNumPy(file=path, mmap_mode=None, allow_pickle=False) as npz:
+            origToPreprocColMap: dict = json.loads(npz[cls._NPZ_MAP_KEY].tobytes().decode('utf-8'))
+
+            return Namespace(**{
+                col: ({k: (npz[v[cls._NPZ_ARRAY_KEY]].tolist()
+                           if isinstance(v, dict) and (cls._NPZ_ARRAY_KEY in v)
+                           else v)
+                       for k, v in preprocDetails.items()}
+                      if isinstance(preprocDetails, dict)
+                      else preprocDetails)
+                for col, preprocDetails in origToPreprocColMap.items()})
+
+    @classmethod
+    def from_npz(cls, path: PathType) -> PandasMLPreprocessor:
+        """Load from binary NumPy NPZ file."""
+        return cls._fromFile(path, load=cls._loadNPZ)
+
+    def to_npz(self, path: PathType):
+        """Save to binary NumPy NPZ file.
+
+        Homogeneous list-valued column details (e.g., long ``sorted-cats`` vocabularies)
+        are stored as typed arrays, and everything else as embedded JSON.
+        """
+        path: Path = Path(path).resolve(strict=False)
+
+        arrays: Dict[str, ndarray] = {}
+        origToPreprocColMap: dict = {}
+
+        # pylint: disable=protected-access
+        for col, preprocDetails in Namespace._serializable(self.origToPreprocColMap).items():
+            if not isinstance(preprocDetails, dict):
+                origToPreprocColMap[col] = preprocDetails
+                continue
+
+            origToPreprocColMap[col] = packedPreprocDetails = {}
+
+            for k, v in preprocDetails.items():
+                if (isinstance(v, list) and v and (len({type(i) for i in v}) == 1) and
+                        ((arr := asarray(v)).ndim == 1) and (arr.dtype.kind in 'biufU')):
+                    arrays[arrKey := f'arr_{len(arrays)}'] = arr
+                    packedPreprocDetails[k] = {self._NPZ_ARRAY_KEY: arrKey}
+
+                else:
+                    packedPreprocDetails[k] = v
+
+        arrays[self._NPZ_MAP_KEY] = frombuffer(json.dumps(origToPreprocColMap).encode('utf-8'),
+                                               dtype=uint8)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # write to file object so that no ".npz" suffix is appended to path
+        with open(file=path, mode='wb') as f:
+            savez(f, **arrays)
+
+        self._PREPROC_CACHE[self._fileContentHash(path)] = self
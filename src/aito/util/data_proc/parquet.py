@@ -3,9 +3,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Collection, Sequence
+import ast
+from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 import datetime
-from functools import lru_cache, partial
+from functools import lru_cache, partial, reduce as fold
+from hashlib import sha1
 from itertools import chain
 from logging import Logger
 import math
@@ -14,6 +17,8 @@ import os
 import random
 import re
 import time
+from types import (BuiltinFunctionType, CodeType, FunctionType, MethodType,
+                   ModuleType)
 from typing import Any, LiteralString, Optional, Union
 from urllib.parse import ParseResult, urlparse
 from uuid import uuid4
@@ -26,14 +31,17 @@ from pandas._libs.missing import NAType  # pylint: disable=no-name-in-module
 from tqdm import tqdm
 
 from pyarrow.dataset import dataset
-from pyarrow.fs import LocalFileSystem, S3FileSystem
-from pyarrow.lib import RecordBatch, Schema, Table  # pylint: disable=no-name-in-module
-from pyarrow.parquet import FileMetaData, read_metadata, read_schema, read_table
-
-from aito.util import debug, fs, s3
+from pyarrow.feather import read_table as readFeather, write_feather as writeFeather
+from pyarrow.fs import FileInfo, FileSelector, FileType, LocalFileSystem, S3FileSystem
+from pyarrow.lib import (RecordBatch, Schema, Table,  # pylint: disable=no-name-in-module
+                         array as arrowArray)
+from pyarrow.parquet import (FileMetaData, ParquetFile, filters_to_expression,
+                             read_metadata, read_schema)
+
+from aito.util import debug, s3
 from aito.util.data_types.arrow import (
     DataType, _ARROW_STR_TYPE, _ARROW_DATE_TYPE,
-    is_binary, is_boolean, is_num, is_possible_cat, is_possible_feature, is_string)
+    is_binary, is_boolean, is_integer, is_num, is_possible_cat, is_possible_feature, is_string)
 from aito.util.data_types.numpy_pandas import NUMPY_FLOAT_TYPES, NUMPY_INT_TYPES
 from aito.util.data_types.python import (PY_NUM_TYPES, PyNumType,
                                          PyPossibleFeatureType, PY_LIST_OR_TUPLE)
@@ -43,6 +51,9 @@ from aito.util.namespace import Namespace, DICT_OR_NAMESPACE_TYPES
 
 from ._abstract import (AbstractDataHandler, AbstractFileDataHandler, AbstractS3FileDataHandler,
                         ColsType, ReducedDataSetType)
+from ._cache import METHOD_CACHE, boundedMethodCache
+from ._catalog import FileMetadataCatalog
+from ._sketch import QuantileSketch, nPointsForRankError
 from .pandas import PandasMLPreprocessor
 
 
@@ -74,14 +85,262 @@ __all__: Sequence[LiteralString] = ('ParquetDataset',)
 
 
 def randomSample(population: Sequence[Any], sampleSize: int,
-                 returnCollectionType=set) -> Collection[Any]:
-    """Draw random sample from population."""
-    return returnCollectionType(random.sample(population=list(population),
-                                              k=sampleSize)
+                 returnCollectionType=set,
+                 rng: Optional[random.Random] = None) -> Collection[Any]:
+    """Draw random sample from population.
+
+    (with a given random number generator, the population is sorted first
+    so that the sample is reproducible regardless of population ordering)
+    """
+    return returnCollectionType((random.sample(population=list(population), k=sampleSize)
+                                 if rng is None
+                                 else rng.sample(population=sorted(population), k=sampleSize))
                                 if len(population) > sampleSize
                                 else population)
 
 
+# Arrow filter operators translatable from pandas query comparisons
+# (!= & "not in" are excluded because Arrow drops NULLs while pandas keeps them)
+_ARROW_FILTER_OPS: dict[type, str] = {ast.Eq: '==',
+                                      ast.Lt: '<', ast.LtE: '<=',
+                                      ast.Gt: '>', ast.GtE: '>=',
+                                      ast.In: 'in'}
+_ARROW_FILTER_FLIPPED_OPS: dict[str, str] = {'==': '==',
+                                             '<': '>', '<=': '>=',
+                                             '>': '<', '>=': '<='}
+_ARROW_FILTER_LITERAL_TYPES: tuple[type] = bool, int, float, str
+
+
+def _arrowFiltersFromCondition(condition: str, /) \
+        -> tuple[tuple[tuple[str, str, Any]], bool]:
+    # pylint: disable=too-many-return-statements
+    """Translate simple conjunctive pandas query condition into Arrow filters.
+
+    Only ``col <op> literal`` comparisons (incl. ``col in [literals]``)
+    AND-ed together are translated; other conjuncts are skipped,
+    so the resulting filters are a (possibly looser) necessary condition,
+    also returned is whether they are exactly equivalent (no conjunct skipped).
+    """
+    try:
+        expr: ast.expr = ast.parse(condition.strip(), mode='eval').body
+    except SyntaxError:   # e.g., `backtick-quoted` names or @local variables
+        return (), False
+
+    conjuncts: list[ast.expr] = (expr.values
+                                 if isinstance(expr, ast.BoolOp) and isinstance(expr.op, ast.And)
+                                 else [expr])
+
+    arrowFilters: list[tuple[str, str, Any]] = []
+
+    for conjunct in conjuncts:
+        if not (isinstance(conjunct, ast.Compare) and (len(conjunct.ops) == 1)):
+            continue
+
+        if (op := _ARROW_FILTER_OPS.get(type(conjunct.ops[0]))) is None:
+            continue
+
+        left, right = conjunct.left, conjunct.comparators[0]
+
+        if isinstance(right, ast.Name) and (op != 'in'):
+            left, right = right, left
+            op: str = _ARROW_FILTER_FLIPPED_OPS[op]
+
+        if not isinstance(left, ast.Name):
+            continue
+
+        try:
+            value: Any = ast.literal_eval(right)
+        except (TypeError, ValueError):
+            continue
+
+        if op == 'in':
+            if not (isinstance(value, (list, tuple, set)) and value and
+                    all(isinstance(v, _ARROW_FILTER_LITERAL_TYPES) for v in value)):
+                continue
+
+            value: list[Any] = list(value)
+
+        elif not isinstance(value, _ARROW_FILTER_LITERAL_TYPES):
+            continue
+
+        arrowFilters.append((left.id, op, value))
+
+    return tuple(arrowFilters), len(arrowFilters) == len(conjuncts)
+
+
+class _QueryFilter:
+    # pylint: disable=too-few-public-methods
+    """Picklable pandas query mapper, also translated to Arrow filters where possible."""
+
+    def __init__(self, condition: str, /):
+        """Init query filter."""
+        self.condition: str = condition
+        self.arrowFilters, self.arrowExact = _arrowFiltersFromCondition(condition)
+
+    def __call__(self, pandasDF: DataFrame, /) -> DataFrame:
+        """Apply pandas query."""
+        return pandasDF.query(expr=self.condition, inplace=False)
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f'{type(self).__name__}({self.condition!r})'
+
+
+@lru_cache(maxsize=None, typed=False)
+def _s3FileSystem(region: Optional[str] = None,
+                  accessKey: Optional[str] = None, secretKey: Optional[str] = None) \
+        -> S3FileSystem:
+    """Get (shared) Arrow S3 file system."""
+    return S3FileSystem(region=region, access_key=accessKey, secret_key=secretKey)
+
+
+# default max rank error (as proportion) of approximate quantiles
+_DEFAULT_QUANTILE_RANK_ERROR: float = 1e-3
+
+
+# per-file execution engines for ParquetDataset.reduce
+_REDUCE_EXECUTORS: tuple[str] = 'serial', 'thread', 'process'
+
+# number of upcoming files to download in the background during serial reduction
+_PREFETCH_N_FILES: int = 2
+
+
+# data set held by each process-pool worker
+# (rebuilt once per worker process by _initReduceWorker)
+_WORKER_PARQUET_DS: Optional[ParquetDataset] = None
+
+
+def _initReduceWorker(workerState: dict[str, Any], fileCaches: dict[str, Namespace]):
+    global _WORKER_PARQUET_DS   # pylint: disable=global-statement
+    # seed file metadata & schema caches first, so that rebuilding the data set
+    # neither lists nor opens any file
+    ParquetDataset._FILE_CACHES.update(fileCaches)
+    _WORKER_PARQUET_DS = ParquetDataset(**workerState, verbose=False)
+
+
+def _reduceFileInWorker(filePath: str, /, **kwargs: Any) -> ReducedDataSetType:
+    return _WORKER_PARQUET_DS._reduceFile(filePath, **kwargs)
+
+
+# max nesting depth of values identified by _valueIdentity
+_MAX_IDENTITY_DEPTH: int = 12
+
+_IDENTIFIABLE_SCALAR_TYPES: tuple[type] = (type(None), bool, int, float, complex, str, bytes,
+                                           datetime.date, datetime.datetime)
+
+
+def _codeIdentity(code: CodeType, /) -> str:
+    """Hash code object, incl. referenced names & nested code objects."""
+    return sha1(repr((code.co_code,
+                      code.co_names,
+                      code.co_varnames,
+                      code.co_freevars,
+                      tuple(_codeIdentity(const) if isinstance(const, CodeType) else repr(const)
+                            for const in code.co_consts))).encode()).hexdigest()
+
+
+def _codeGlobalNames(code: CodeType, /) -> set[str]:
+    """Get names possibly referenced as globals by code (incl. nested code)."""
+    return set(code.co_names).union(*(_codeGlobalNames(const)
+                                      for const in code.co_consts
+                                      if isinstance(const, CodeType)))
+
+
+def _valueIdentity(value: Any, /, *, depth: int, seen: frozenset[int]) -> Optional[str]:
+    # pylint: disable=too-many-return-statements,too-many-branches
+    """Get identity of value that is stable across processes (or None if not determinable)."""
+    if isinstance(value, _IDENTIFIABLE_SCALAR_TYPES):
+        return f'{type(value).__name__}:{value!r}'
+
+    if (depth > _MAX_IDENTITY_DEPTH) or (id(value) in seen):
+        return None
+
+    seen: frozenset[int] = seen | {id(value)}
+
+    def identity(v: Any, /) -> Optional[str]:
+        return _valueIdentity(v, depth=depth + 1, seen=seen)
+
+    def identities(values: Iterable[Any], /) -> Optional[list[str]]:
+        return None if None in (ids := [identity(v) for v in values]) else ids
+
+    if isinstance(value, ModuleType):
+        return f'module:{value.__name__}'
+
+    if isinstance(value, type):
+        return f'type:{value.__module__}.{value.__qualname__}'
+
+    if isinstance(value, (tuple, list)):
+        return (None
+                if (ids := identities(value)) is None
+                else f"{type(value).__name__}:[{','.join(ids)}]")
+
+    if isinstance(value, (set, frozenset)):
+        return (None
+                if (ids := identities(value)) is None
+                else f"{type(value).__name__}:{{{','.join(sorted(ids))}}}")
+
+    if isinstance(value, dict):
+        return (None
+                if ((keyIds := identities(value.keys())) is None) or
+                   ((valueIds := identities(value.values())) is None)
+                else f"{type(value).__name__}:{{{','.join(sorted(f'{k}={v}' for k, v in zip(keyIds, valueIds)))}}}")  # noqa: E501
+
+    if isinstance(value, ndarray):
+        return (f'ndarray:{value.dtype}{value.shape}:{sha1(value.tobytes()).hexdigest()}'
+                if value.dtype.kind in 'biufcmMSU'
+                else None)
+
+    if isinstance(value, partial):
+        return (None
+                if ((funcId := identity(value.func)) is None) or
+                   ((argIds := identities(value.args)) is None) or
+                   ((kwargsId := identity(value.keywords)) is None)
+                else f"partial:{funcId}({','.join(argIds)};{kwargsId})")
+
+    if isinstance(value, MethodType):
+        return (None
+                if ((selfId := identity(value.__self__)) is None) or
+                   ((funcId := identity(value.__func__)) is None)
+                else f'method:{selfId}.{funcId}')
+
+    if isinstance(value, FunctionType):
+        code: CodeType = value.__code__
+
+        closureIds: Optional[list[str]] = identities(cell.cell_contents
+                                                     for cell in (value.__closure__ or ()))
+
+        # referenced global functions are identified by name & code only
+        # (without recursing into their own globals, e.g. entire library modules)
+        globalIds: Optional[list[str]] = identities(
+            (name, (f'function:{v.__module__}.{v.__qualname__}:{_codeIdentity(v.__code__)}'
+                    if isinstance(v := value.__globals__[name], FunctionType)
+                    else v))
+            for name in sorted(_codeGlobalNames(code))
+            if name in value.__globals__)
+
+        if (closureIds is None) or (globalIds is None) or \
+                ((defaultsId := identity(value.__defaults__)) is None) or \
+                ((kwDefaultsId := identity(value.__kwdefaults__)) is None):
+            return None
+
+        return (f'function:{value.__module__}.{value.__qualname__}:' +
+                sha1(repr((_codeIdentity(code), defaultsId, kwDefaultsId,
+                           closureIds, globalIds)).encode()).hexdigest())
+
+    if isinstance(value, BuiltinFunctionType):
+        return (f'builtin:{value.__module__}.{value.__qualname__}'
+                if isinstance(getattr(value, '__self__', None), (type(None), ModuleType))
+                else None)
+
+    # other objects: identified by type & full state
+    if (state := getattr(value, '__dict__', None)) is not None:
+        return (None
+                if (stateId := identity(dict(state))) is None
+                else f'{identity(type(value))}:{stateId}')
+
+    return None
+
+
 class ParquetDataset(AbstractS3FileDataHandler):
     # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """S3 Parquet Data Feeder."""
@@ -90,6 +349,11 @@ class ParquetDataset(AbstractS3FileDataHandler):
     _CACHE: dict[str, Namespace] = {}
     _FILE_CACHES: dict[str, Namespace] = {}
 
+    # persistent file metadata & schema catalog
+    # (surviving across processes, keyed by file path & version)
+    _CATALOG: FileMetadataCatalog = FileMetadataCatalog(
+        AbstractFileDataHandler._LOCAL_CACHE_DIR_PATH / 'parquet-metadata-catalog.sqlite')
+
     # default arguments dict
     # (cannot be aito.util.namespace.Namespace
     # because that makes nested dicts into normal dicts)
@@ -104,12 +368,17 @@ class ParquetDataset(AbstractS3FileDataHandler):
         outlierTailProportion=DefaultDict(AbstractDataHandler._DEFAULT_OUTLIER_TAIL_PROPORTION),
         maxNCats=DefaultDict(AbstractDataHandler._DEFAULT_MAX_N_CATS),
         minProportionByMaxNCats=DefaultDict(
-            AbstractDataHandler._DEFAULT_MIN_PROPORTION_BY_MAX_N_CATS))
+            AbstractDataHandler._DEFAULT_MIN_PROPORTION_BY_MAX_N_CATS),
+
+        reduceExecutor='serial', reduceNWorkers=None,
+
+        seed=None)
 
     def __init__(self, path: str, *, awsRegion: Optional[str] = None,
                  accessKey: Optional[str] = None, secretKey: Optional[str] = None,  # noqa: E501
                  _mappers: Optional[Callable] = None,
                  _reduceMustInclCols: Optional[ColsType] = None,
+                 _filePaths: Optional[Collection[str]] = None,
                  verbose: bool = True, **kwargs: Any):
         # pylint: disable=too-many-branches,too-many-locals,too-many-statements
         """Init S3 Parquet Data Feeder."""
@@ -126,14 +395,27 @@ class ParquetDataset(AbstractS3FileDataHandler):
 
         self.path: str = path if self.onS3 else os.path.expanduser(path)
 
-        if self.path in self._CACHE:
-            _cache: Namespace = self._CACHE[self.path]
+        # virtual subset of files under path
+        # (sharing the parent data set's file metadata & schema caches)
+        self._subsetFilePaths: Optional[frozenset[str]] = (frozenset(_filePaths)
+                                                           if _filePaths is not None
+                                                           else None)
+        assert (self._subsetFilePaths is None) or self._subsetFilePaths, \
+            ValueError(f'*** {type(self).__name__}: EMPTY FILE SELECTION UNDER "{path}" ***')
+
+        self._cacheKey: str = (
+            f"{self.path}[{sha1('|'.join(sorted(self._subsetFilePaths)).encode()).hexdigest()}]"
+            if self._subsetFilePaths
+            else self.path)
+
+        if self._cacheKey in self._CACHE:
+            _cache: Namespace = self._CACHE[self._cacheKey]
         else:
-            self._CACHE[self.path] = _cache = Namespace()
+            self._CACHE[self._cacheKey] = _cache = Namespace()
 
         if _cache:
             if debug.ON:
-                logger.debug(msg=f'*** RETRIEVING CACHE FOR "{self.path}" ***')
+                logger.debug(msg=f'*** RETRIEVING CACHE FOR "{self._cacheKey}" ***')
 
         else:
             if self.onS3:
@@ -141,45 +423,39 @@ class ParquetDataset(AbstractS3FileDataHandler):
                 _cache.s3Bucket = _parsedURL.netloc
                 _cache.pathS3Key = _parsedURL.path[1:]
 
-            if self.path in self._FILE_CACHES:
+            if self._subsetFilePaths:
+                _cache.filePaths = set(self._subsetFilePaths)
+                _cache.nFiles = len(_cache.filePaths)
+
+                fileVersions: dict[str, Optional[str]] = {}
+
+            elif self.path in self._FILE_CACHES:
                 _cache.nFiles = 1
                 _cache.filePaths = {self.path}
 
+                fileVersions: dict[str, Optional[str]] = {}
+
             else:
                 if verbose:
-                    logger.info(msg=(msg := f'Loading "{self.path}" by Arrow...'))
+                    logger.info(msg=(msg := f'Listing "{self.path}" by Arrow...'))
                     tic: float = time.time()
 
-                if self.onS3:
+                fileVersions: dict[str, Optional[str]] = self._listFileVersions()
+
+                if self.onS3 and any(filePath.endswith('_$folder$') for filePath in fileVersions):
                     s3.rm(path=path,
                           is_dir=True,
                           globs='*_$folder$',   # redundant AWS EMR-generated files
                           quiet=True,
                           verbose=False)
 
-                _cache._srcArrowDS = dataset(source=(path.replace('s3://', '')
-                                                     if self.onS3
-                                                     else self.path),
-                                             schema=None,
-                                             format='parquet',
-                                             filesystem=(S3FileSystem(region=awsRegion,
-                                                                      access_key=accessKey,
-                                                                      secret_key=secretKey)
-                                                         if self.onS3
-                                                         else LocalFileSystem()),
-                                             partitioning=None,
-                                             partition_base_dir=None,
-                                             exclude_invalid_files=None,
-                                             ignore_prefixes=None)
-
                 if verbose:
                     toc: float = time.time()
                     logger.info(msg=f'{msg} done!  <{toc - tic:,.1f} s>')
 
-                if _filePaths := _cache._srcArrowDS.files:
-                    _cache.filePaths = {(f's3://{filePath}' if self.onS3 else filePath)
-                                        for filePath in _filePaths
-                                        if not filePath.endswith('_$folder$')}
+                if _filePaths := {filePath for filePath in fileVersions
+                                  if not filePath.endswith('_$folder$')}:
+                    _cache.filePaths = _filePaths
                     _cache.nFiles = len(_cache.filePaths)
 
                 else:
@@ -189,34 +465,22 @@ class ParquetDataset(AbstractS3FileDataHandler):
             _cache.srcColsInclPartitionKVs = set()
             _cache.srcTypesInclPartitionKVs = Namespace()
 
+            # forget cached metadata & schemas of files that have since changed
+            for filePath, version in fileVersions.items():
+                if (filePath in self._FILE_CACHES) and \
+                        (self._FILE_CACHES[filePath].version != version):
+                    del self._FILE_CACHES[filePath]
+
             for i, filePath in enumerate(_cache.filePaths):
                 if filePath in self._FILE_CACHES:
                     fileCache: Namespace = self._FILE_CACHES[filePath]
 
                     if (fileCache.nRows is None) and (i < self._SCHEMA_MIN_N_FILES):
-                        fileCache.localPath = self.fileLocalPath(filePath=filePath)
-
-                        schema: Schema = read_schema(where=fileCache.localPath)
-
-                        fileCache.srcColsExclPartitionKVs = (set(schema.names)
-                                                             - {'__index_level_0__'})
-
-                        fileCache.srcColsInclPartitionKVs.update(fileCache.srcColsExclPartitionKVs)
-
-                        for col in (fileCache.srcColsExclPartitionKVs
-                                    .difference(fileCache.partitionKVs)):
-                            fileCache.srcTypesExclPartitionKVs[col] = \
-                                fileCache.srcTypesInclPartitionKVs[col] = \
-                                schema.field(col).type
-
-                        metadata: FileMetaData = read_metadata(where=fileCache.localPath)
-                        fileCache.nCols = metadata.num_columns
-                        fileCache.nRows = metadata.num_rows
+                        self._readFileMetadataAndSchema(filePath, fileCache)
 
                 else:
                     srcColsInclPartitionKVs: set[str] = set()
 
-                    srcTypesExclPartitionKVs: Namespace = Namespace()
                     srcTypesInclPartitionKVs: Namespace = Namespace()
 
                     partitionKVs: dict[str, Union[datetime.date, str]] = {}
@@ -234,45 +498,25 @@ class ParquetDataset(AbstractS3FileDataHandler):
                             srcTypesInclPartitionKVs[k] = _ARROW_STR_TYPE
                             partitionKVs[k] = v[:-1]
 
-                    if i < self._SCHEMA_MIN_N_FILES:
-                        localPath: Path = self.fileLocalPath(filePath=filePath)
-
-                        schema: Schema = read_schema(where=localPath)
-
-                        srcColsExclPartitionKVs: set[str] = (set(schema.names)
-                                                             - {'__index_level_0__'})
-
-                        srcColsInclPartitionKVs.update(srcColsExclPartitionKVs)
-
-                        for col in srcColsExclPartitionKVs.difference(partitionKVs):
-                            srcTypesExclPartitionKVs[col] = \
-                                srcTypesInclPartitionKVs[col] = \
-                                schema.field(col).type
-
-                        metadata: FileMetaData = read_metadata(where=localPath)
-                        nCols: int = metadata.num_columns
-                        nRows: int = metadata.num_rows
-
-                    else:
-                        localPath: Optional[Path] = None if self.onS3 else filePath
-
-                        srcColsExclPartitionKVs: Optional[set[str]] = None
-
-                        nCols: Optional[int] = None
-                        nRows: Optional[int] = None
-
                     self._FILE_CACHES[filePath] = fileCache = \
-                        Namespace(localPath=localPath,
+                        Namespace(localPath=None if self.onS3 else filePath,
+
+                                  version=fileVersions.get(filePath),
 
                                   partitionKVs=partitionKVs,
 
-                                  srcColsExclPartitionKVs=srcColsExclPartitionKVs,
+                                  srcColsExclPartitionKVs=None,
                                   srcColsInclPartitionKVs=srcColsInclPartitionKVs,
 
-                                  srcTypesExclPartitionKVs=srcTypesExclPartitionKVs,
+                                  srcTypesExclPartitionKVs=Namespace(),
                                   srcTypesInclPartitionKVs=srcTypesInclPartitionKVs,
 
-                                  nCols=nCols, nRows=nRows)
+                                  rowGroupStats=None,
+
+                                  nCols=None, nRows=None)
+
+                    if i < self._SCHEMA_MIN_N_FILES:
+                        self._readFileMetadataAndSchema(filePath, fileCache)
 
                 _cache.srcColsInclPartitionKVs |= fileCache.srcColsInclPartitionKVs
 
@@ -364,6 +608,29 @@ class ParquetDataset(AbstractS3FileDataHandler):
                 (f'[{self.path} + {len(self._mappers):,} transform(s)]'
                  f"[{', '.join(colsDescStr)}]"))
 
+    # ========
+    # PICKLING
+    # --------
+    # __getstate__
+    # __setstate__
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get picklable state (e.g., for process-pool workers)."""
+        state: dict[str, Any] = self.__dict__.copy()
+
+        # Boto3 clients are not picklable
+        state.pop('s3Client', None)
+
+        return state
+
+    def __setstate__(self, state: dict[str, Any], /):
+        """Restore state."""
+        self.__dict__.update(state)
+
+        if self.onS3:
+            self.s3Client = s3.client(region=self.awsRegion,
+                                      access_key=self.accessKey, secret_key=self.secretKey)
+
     # ================================
     # "INTERNAL / DON'T TOUCH" METHODS
     # --------------------------------
@@ -410,8 +677,10 @@ class ParquetDataset(AbstractS3FileDataHandler):
     # -------
     # _emptyCache
     # _inheritCache
+    # clearCaches / cacheStats
     # cacheLocally
     # fileLocalPath
+    # prefetchFiles
     # cacheFileMetadataAndSchema
 
     def _emptyCache(self):
@@ -468,22 +737,40 @@ class ParquetDataset(AbstractS3FileDataHandler):
                     self._cache.__dict__[cacheCategory][newCol] = \
                         oldS3ParquetDF._cache.__dict__[cacheCategory][oldCol]
 
+    def clearCaches(self):
+        """Clear this data set's cached method results & profiling cache."""
+        METHOD_CACHE.clear(id(self))
+        self._emptyCache()
+
+    @property
+    def cacheStats(self) -> Namespace:
+        """Method result cache hit/miss statistics of this data set.
+
+        (process-wide statistics incl. evictions: ``ParquetDataset.globalCacheStats()``)
+        """
+        return METHOD_CACHE.stats(self)
+
+    @staticmethod
+    def globalCacheStats() -> Namespace:
+        """Process-wide method result cache statistics."""
+        return METHOD_CACHE.stats()
+
     def cacheLocally(self, verbose: bool = True):
-        """Cache files to local disk."""
-        if self.onS3 and (not (_cache := self._CACHE[self.path]).cachedLocally):
+        """Cache files to local disk (concurrently)."""
+        if self.onS3 and (not (_cache := self._CACHE[self._cacheKey]).cachedLocally):
             if verbose:
                 self.stdOutLogger.info(msg=(msg := 'Caching Files to Local Disk...'))
                 tic: float = time.time()
 
-            parsedURL: ParseResult = urlparse(url=self.path, scheme='', allow_fragments=True)
-
-            localPath: str = str(self._LOCAL_CACHE_DIR_PATH / parsedURL.netloc / parsedURL.path[1:])
-
-            s3.sync(from_dir_path=self.path, to_dir_path=localPath,
-                    delete=True, quiet=True, verbose=True)
+            filePaths: list[str] = sorted(self.filePaths)
 
-            for filePath in self.filePaths:
-                self._FILE_CACHES[filePath].localPath = filePath.replace(self.path, localPath)
+            for filePath, localPath in zip(
+                    filePaths,
+                    s3.downloader(region=self.awsRegion,
+                                  access_key=self.accessKey, secret_key=self.secretKey)
+                    .download_many((filePath, self._fileLocalCachePath(filePath))
+                                   for filePath in filePaths)):
+                self._FILE_CACHES[filePath].localPath = localPath
 
             _cache.cachedLocally = True
 
@@ -491,29 +778,21 @@ class ParquetDataset(AbstractS3FileDataHandler):
                 toc: float = time.time()
                 self.stdOutLogger.info(msg=f'{msg} done!  <{toc - tic:,.1f} s>')
 
+    def _fileLocalCachePath(self, filePath: str, /) -> Path:
+        parsedURL: ParseResult = urlparse(url=filePath, scheme='', allow_fragments=True)
+        return self._LOCAL_CACHE_DIR_PATH / parsedURL.netloc / parsedURL.path[1:]
+
     def fileLocalPath(self, filePath: str) -> Path:
-        """Get local cache file path."""
+        """Get local cache file path (downloading file if necessary)."""
         if self.onS3:
             if (filePath in self._FILE_CACHES) and self._FILE_CACHES[filePath].localPath:
                 return self._FILE_CACHES[filePath].localPath
 
-            parsedURL: ParseResult = urlparse(url=filePath, scheme='', allow_fragments=True)
-
-            localPath: Path = self._LOCAL_CACHE_DIR_PATH / parsedURL.netloc / parsedURL.path[1:]
-
-            localDirPath: Path = localPath.parent
-            fs.mkdir(dir_path=localDirPath, hdfs=False)
-            # make sure the dir has been created
-            while not localDirPath.is_dir():
-                time.sleep(1)
-
-            self.s3Client.download_file(Bucket=parsedURL.netloc,
-                                        Key=parsedURL.path[1:],
-                                        Filename=str(localPath))
-            # make sure AWS S3's asynchronous process has finished
-            # downloading a potentially large file
-            while not localPath.is_file():
-                time.sleep(1)
+            # wait for (possibly already prefetching) download to complete
+            localPath: Path = (s3.downloader(region=self.awsRegion,
+                                             access_key=self.accessKey, secret_key=self.secretKey)
+                               .download(s3_path=filePath,
+                                         local_path=self._fileLocalCachePath(filePath)))
 
             if filePath in self._FILE_CACHES:
                 self._FILE_CACHES[filePath].localPath = localPath
@@ -522,25 +801,128 @@ class ParquetDataset(AbstractS3FileDataHandler):
 
         return filePath
 
+    def prefetchFiles(self, *filePaths: str):
+        """Start downloading files in the background (non-blocking)."""
+        if self.onS3:
+            _downloader: s3.Downloader = s3.downloader(region=self.awsRegion,
+                                                       access_key=self.accessKey,
+                                                       secret_key=self.secretKey)
+
+            for filePath in filePaths:
+                if not ((filePath in self._FILE_CACHES) and self._FILE_CACHES[filePath].localPath):
+                    _downloader.submit(s3_path=filePath,
+                                       local_path=self._fileLocalCachePath(filePath))
+
+    def _iterPrefetching(self, filePaths: Sequence[str], /, nAhead: int) -> Iterator[str]:
+        """Iterate through file paths while prefetching the next few files."""
+        for i, filePath in enumerate(filePaths):
+            if nAhead:
+                self.prefetchFiles(*filePaths[(i + 1):(i + 1 + nAhead)])
+
+            yield filePath
+
+    def _listFileVersions(self) -> dict[str, Optional[str]]:
+        """List files under path, with versions (modification time & size).
+
+        (only lists object metadata, without opening any file)
+        """
+        fileSystem: Union[LocalFileSystem, S3FileSystem] = (
+            _s3FileSystem(region=self.awsRegion,
+                          accessKey=self.accessKey, secretKey=self.secretKey)
+            if self.onS3
+            else LocalFileSystem())
+
+        basePath: str = self.path.replace('s3://', '') if self.onS3 else os.path.abspath(self.path)
+
+        # arrow.apache.org/docs/python/generated/pyarrow.fs.FileSystem.html
+        # #pyarrow.fs.FileSystem.get_file_info
+        fileInfos: list[FileInfo] = (
+            [baseFileInfo]
+            if (baseFileInfo := fileSystem.get_file_info(basePath)).type == FileType.File
+            else fileSystem.get_file_info(FileSelector(base_dir=basePath,
+                                                       allow_not_found=False,
+                                                       recursive=True)))
+
+        _basePathPlusSepLen: int = len(basePath) + 1
+
+        fileVersions: dict[str, Optional[str]] = {}
+
+        for fileInfo in fileInfos:
+            if fileInfo.type != FileType.File:
+                continue
+
+            if fileInfo.path == basePath:
+                filePath: str = self.path
+
+            else:
+                relPath: str = fileInfo.path[_basePathPlusSepLen:]
+
+                # same as Arrow data set discovery's default ignored prefixes
+                if any(part.startswith(('.', '_')) for part in relPath.split('/')):
+                    continue
+
+                filePath: str = f'{self.path}/{relPath}'
+
+            fileVersions[filePath] = (None
+                                      if fileInfo.mtime_ns is None
+                                      else f'{fileInfo.mtime_ns}:{fileInfo.size}')
+
+        return fileVersions
+
+    def _readFileMetadataAndSchema(self, filePath: str, fileCache: Namespace, /):
+        """Read file metadata & schema from persistent catalog or else from file footer.
+
+        (files not yet cached locally have only their footers read from S3)
+        """
+        if (catalogued := self._CATALOG.get(filePath, fileCache.version)) is None:
+            if self.onS3 and not fileCache.localPath:
+                # only read footer by ranged reads, without downloading whole file
+                with (_s3FileSystem(region=self.awsRegion,
+                                    accessKey=self.accessKey, secretKey=self.secretKey)
+                      .open_input_file(filePath.replace('s3://', ''))) as s3File:
+                    parquetFile: ParquetFile = ParquetFile(source=s3File)
+                    schema: Schema = parquetFile.schema_arrow
+                    metadata: FileMetaData = parquetFile.metadata
+
+            else:
+                fileLocalPath: Path = self.fileLocalPath(filePath=filePath)
+
+                schema: Schema = read_schema(where=fileLocalPath)
+
+                metadata: FileMetaData = read_metadata(where=fileLocalPath)
+
+            nCols: int = metadata.num_columns
+            nRows: int = metadata.num_rows
+
+            fileCache.rowGroupStats = self._CATALOG.put(filePath, fileCache.version,
+                                                        schema=schema, metadata=metadata)
+
+        else:
+            schema, nCols, nRows, fileCache.rowGroupStats = catalogued
+
+        fileCache.srcColsExclPartitionKVs = set(schema.names) - {'__index_level_0__'}
+
+        fileCache.srcColsInclPartitionKVs.update(fileCache.srcColsExclPartitionKVs)
+
+        for col in fileCache.srcColsExclPartitionKVs.difference(fileCache.partitionKVs):
+            fileCache.srcTypesExclPartitionKVs[col] = \
+                fileCache.srcTypesInclPartitionKVs[col] = \
+                schema.field(col).type
+
+        fileCache.nCols = nCols
+        fileCache.nRows = nRows
+
     def cacheFileMetadataAndSchema(self, filePath: str) -> Namespace:
         """Cache file metadata and schema."""
-        fileLocalPath: Path = self.fileLocalPath(filePath=filePath)
-
         fileCache: Namespace = self._FILE_CACHES[filePath]
 
         if fileCache.nRows is None:
-            schema: Schema = read_schema(where=fileLocalPath)
-
-            fileCache.srcColsExclPartitionKVs = set(schema.names) - {'__index_level_0__'}
-
-            fileCache.srcColsInclPartitionKVs.update(fileCache.srcColsExclPartitionKVs)
+            self._readFileMetadataAndSchema(filePath, fileCache)
 
             self.srcColsInclPartitionKVs.update(fileCache.srcColsExclPartitionKVs)
 
             for col in fileCache.srcColsExclPartitionKVs.difference(fileCache.partitionKVs):
-                fileCache.srcTypesExclPartitionKVs[col] = \
-                    fileCache.srcTypesInclPartitionKVs[col] = \
-                    _arrowType = schema.field(col).type
+                _arrowType: DataType = fileCache.srcTypesExclPartitionKVs[col]
 
                 assert not is_binary(_arrowType), \
                     TypeError(f'*** {filePath}: {col} IS OF BINARY TYPE ***')
@@ -553,10 +935,6 @@ class ParquetDataset(AbstractS3FileDataHandler):
                 else:
                     self.srcTypesInclPartitionKVs[col] = _arrowType
 
-            metadata: FileMetaData = read_metadata(where=fileCache.localPath)
-            fileCache.nCols = metadata.num_columns
-            fileCache.nRows = metadata.num_rows
-
         return fileCache
 
     # =====================
@@ -628,12 +1006,12 @@ class ParquetDataset(AbstractS3FileDataHandler):
         """Return column data types."""
         return self.srcTypesInclPartitionKVs
 
-    @lru_cache(maxsize=None, typed=False)
+    @boundedMethodCache
     def type(self, col: str) -> DataType:
         """Return data type of specified column."""
         return self.types[col]
 
-    @lru_cache(maxsize=None, typed=False)
+    @boundedMethodCache
     def typeIsNum(self, col: str) -> bool:
         """Check whether specified column's data type is numerical."""
         return is_num(self.type(col))
@@ -651,11 +1029,44 @@ class ParquetDataset(AbstractS3FileDataHandler):
     # ====================
     # MAP/REDUCE & related
     # --------------------
+    # reduceExecutor / reduceNWorkers
     # map
     # reduce
     # __getitem__
     # castType
     # collect
+    # iterBatches
+    # foldBatches
+
+    @property
+    def reduceExecutor(self) -> str:
+        """Per-file execution engine for ``.reduce(...)``.
+
+        One of:
+            - ``serial`` (default)
+            - ``thread``
+            - ``process`` (requires picklable mappers)
+        """
+        return self._reduceExecutor
+
+    @reduceExecutor.setter
+    def reduceExecutor(self, executor: str, /):
+        assert executor in _REDUCE_EXECUTORS, \
+            ValueError(f'*** EXECUTOR MUST BE ONE OF {_REDUCE_EXECUTORS} ***')
+        self._reduceExecutor: str = executor
+
+    @property
+    def reduceNWorkers(self) -> Optional[int]:
+        """Max number of parallel ``.reduce(...)`` workers.
+
+        (default = ``None``, i.e. the executor's own default,
+        which scales with the number of CPU cores)
+        """
+        return self._reduceNWorkers
+
+    @reduceNWorkers.setter
+    def reduceNWorkers(self, n: Optional[int], /):
+        self._reduceNWorkers: Optional[int] = n
 
     def map(self, *mappers: callable,
             reduceMustInclCols: Optional[ColsType] = None,
@@ -675,6 +1086,7 @@ class ParquetDataset(AbstractS3FileDataHandler):
                 _mappers=self._mappers + mappers,
                 _reduceMustInclCols=(self._reduceMustInclCols |
                                      to_iterable(reduceMustInclCols, iterable_type=set)),
+                _filePaths=self._subsetFilePaths,
 
                 iCol=self._iCol, tCol=self._tCol,
 
@@ -686,6 +1098,10 @@ class ParquetDataset(AbstractS3FileDataHandler):
                 maxNCats=self._maxNCats,
                 minProportionByMaxNCats=self._minProportionByMaxNCats,
 
+                reduceExecutor=self._reduceExecutor, reduceNWorkers=self._reduceNWorkers,
+
+                seed=self._seed,
+
                 **kwargs)
 
         if inheritCache:
@@ -698,10 +1114,23 @@ class ParquetDataset(AbstractS3FileDataHandler):
         return s3ParquetDF
 
     def reduce(self, *filePaths: str, **kwargs: Any) -> ReducedDataSetType:
-        # pylint: disable=too-many-branches,too-many-locals,too-many-statements
-        """Reduce from mapped content."""
-        _CHUNK_SIZE: int = 10 ** 5
-
+        """Reduce from mapped content.
+
+        Keyword Args:
+            - **cols**: column(s) to read from each file
+            - **nSamplesPerFile**: number of rows to sub-sample from each file
+            - **reducer**: callable combining the list of per-file results
+            - **executor**: one of ``serial``, ``thread`` & ``process``
+            (default: ``.reduceExecutor``)
+            - **nWorkers**: max number of parallel workers
+            (default: ``.reduceNWorkers``)
+            - **prefetchNFiles**: number of upcoming S3 files to download
+            in the background during serial reduction (default: 2)
+
+        Per-file results are passed to ``reducer`` in sorted file-path order
+        regardless of executor.
+        The ``process`` executor requires all mappers to be picklable.
+        """
         cols: Optional[Collection[str]] = kwargs.get('cols')
         cols: set[str] = to_iterable(cols, iterable_type=set) if cols else set()
 
@@ -722,264 +1151,287 @@ class ParquetDataset(AbstractS3FileDataHandler):
                                                        sort=False,
                                                        copy=False))
 
+        executor: str = kwargs.pop('executor', self._reduceExecutor)
+        nWorkers: Optional[int] = kwargs.pop('nWorkers', self._reduceNWorkers)
+
+        prefetchNFiles: int = kwargs.pop('prefetchNFiles', _PREFETCH_N_FILES)
+
         verbose: bool = kwargs.pop('verbose', True)
 
-        if not filePaths:
-            filePaths: set[str] = self.filePaths
+        # sort file paths to make result order deterministic
+        filePaths: list[str] = sorted(filePaths if filePaths else self.filePaths)
+
+        if (executor == 'serial') or (len(filePaths) < 2) or (nWorkers == 1):
+            results: Iterator[ReducedDataSetType] = (
+                self._reduceFile(filePath, cols=cols, nSamplesPerFile=nSamplesPerFile)
+                for filePath in self._iterPrefetching(filePaths, nAhead=prefetchNFiles))
+
+            return reducer(list(tqdm(results, total=len(filePaths))
+                                if verbose and (len(filePaths) > 1)
+                                else results))
+
+        if executor == 'thread':
+            pool: Executor = ThreadPoolExecutor(max_workers=nWorkers,
+                                                thread_name_prefix=type(self).__name__)
+            reduceFile: Callable = partial(self._reduceFile,
+                                           cols=cols, nSamplesPerFile=nSamplesPerFile)
+
+        elif executor == 'process':
+            pool: Executor = ProcessPoolExecutor(
+                max_workers=nWorkers,
+                initializer=_initReduceWorker,
+                initargs=(self._reduceWorkerState(filePaths),
+                          {filePath: self._FILE_CACHES[filePath]
+                           for filePath in filePaths
+                           if filePath in self._FILE_CACHES}))
+            reduceFile: Callable = partial(_reduceFileInWorker,
+                                           cols=cols, nSamplesPerFile=nSamplesPerFile)
 
-        results: list[ReducedDataSetType] = []
+        else:
+            raise ValueError(f'*** {type(self).__name__} EXECUTOR MUST BE ONE OF '
+                             f'{_REDUCE_EXECUTORS}, NOT "{executor}" ***')
 
-        # pylint: disable=too-many-nested-blocks
-        for filePath in (tqdm(filePaths) if verbose and (len(filePaths) > 1) else filePaths):
-            fileLocalPath: Path = self.fileLocalPath(filePath=filePath)
+        with pool:
+            # Executor.map yields results in submission order
+            results: Iterator[ReducedDataSetType] = pool.map(reduceFile, filePaths)
 
-            fileCache: Namespace = self.cacheFileMetadataAndSchema(filePath=filePath)
+            return reducer(list(tqdm(results, total=len(filePaths))
+                                if verbose
+                                else results))
 
-            colsForFile: set[str] = (
-                cols
-                if cols
-                else fileCache.srcColsInclPartitionKVs
-            ) | self._reduceMustInclCols
+    def _reduceWorkerState(self, filePaths: Sequence[str], /) -> dict[str, Any]:
+        """Get slim state for rebuilding this data set in process-pool workers.
 
-            srcCols: set[str] = colsForFile & fileCache.srcColsExclPartitionKVs
+        (only path, files, mappers, credentials & settings needed by ``._reduceFile(...)``,
+        not profiling caches such as the possibly large ``reprSample``)
+        """
+        return dict(path=self.path if len(filePaths) > 1 else filePaths[0],
+                    awsRegion=self.awsRegion,
+                    accessKey=self.accessKey, secretKey=self.secretKey,
 
-            partitionKeyCols: set[str] = colsForFile.intersection(fileCache.partitionKVs)
+                    _mappers=self._mappers, _reduceMustInclCols=self._reduceMustInclCols,
+                    _filePaths=tuple(filePaths) if len(filePaths) > 1 else None,
+
+                    iCol=self._iCol, tCol=self._tCol,
+
+                    seed=self._seed)
+
+    def _reduceFile(self, filePath: str, /, *,
+                    cols: set[str], nSamplesPerFile: Optional[int]) -> ReducedDataSetType:
+        # pylint: disable=too-many-branches,too-many-locals,too-many-nested-blocks
+        # pylint: disable=too-many-statements
+        """Read, (sub-sample) & map a single file."""
+        fileLocalPath: Path = self.fileLocalPath(filePath=filePath)
+
+        fileCache: Namespace = self.cacheFileMetadataAndSchema(filePath=filePath)
+
+        colsForFile: set[str] = (
+            cols
+            if cols
+            else fileCache.srcColsInclPartitionKVs
+        ) | self._reduceMustInclCols
+
+        srcCols: set[str] = colsForFile & fileCache.srcColsExclPartitionKVs
+
+        partitionKeyCols: set[str] = colsForFile.intersection(fileCache.partitionKVs)
+
+        if srcCols:
+            pandasDFConstructed: bool = False
+
+            # filters pushed down into Arrow, to skip row groups using Parquet statistics
+            arrowFilters: Optional[list[tuple[str, str, Any]]] = \
+                self._arrowFiltersForFile(fileCache) or None
 
-            if srcCols:
-                pandasDFConstructed: bool = False
-
-                if toSubSample := nSamplesPerFile and (nSamplesPerFile < fileCache.nRows):
-                    intermediateN: float = (nSamplesPerFile * fileCache.nRows) ** .5
-
-                    if ((nChunksForIntermediateN := int(math.ceil(intermediateN / _CHUNK_SIZE)))
-                            < (approxNChunks := int(math.ceil(fileCache.nRows / _CHUNK_SIZE)))):
-                        # arrow.apache.org/docs/python/generated/pyarrow.parquet.read_table
-                        fileArrowTable: Table = read_table(source=fileLocalPath,
-                                                           columns=list(srcCols),
-                                                           use_threads=True,
-                                                           metadata=None,
-                                                           use_pandas_metadata=True,
-                                                           memory_map=False,
-                                                           read_dictionary=None,
-                                                           filesystem=None,
-                                                           filters=None,
-                                                           buffer_size=0,
-                                                           partitioning='hive',
-                                                           use_legacy_dataset=False,
-                                                           ignore_prefixes=None,
-                                                           pre_buffer=True,
-                                                           coerce_int96_timestamp_unit=None)
-
-                        chunkRecordBatches: list[RecordBatch] = \
-                            fileArrowTable.to_batches(max_chunksize=_CHUNK_SIZE)
-
-                        nChunks: int = len(chunkRecordBatches)
-
-                        # TODO: CHECK
-                        # assert nChunks in (approxNChunks - 1, approxNChunks), \
-                        #     ValueError(f'*** {filePath}: {nChunks} vs. '
-                        #                f'{approxNChunks} Record Batches ***')
-
-                        assert nChunksForIntermediateN <= nChunks, \
-                            ValueError(f'*** {filePath}: {nChunksForIntermediateN} vs. '
-                                       f'{nChunks} Record Batches ***')
-
-                        chunkPandasDFs: list[DataFrame] = []
-
-                        nSamplesPerChunk: int = int(math.ceil(nSamplesPerFile /
-                                                              nChunksForIntermediateN))
-
-                        for chunkRecordBatch in randomSample(population=chunkRecordBatches,
-                                                             sampleSize=nChunksForIntermediateN,
-                                                             returnCollectionType=tuple):
-                            # arrow.apache.org/docs/python/generated/pyarrow.RecordBatch.html
-                            # #pyarrow.RecordBatch.to_pandas
-                            chunkPandasDF: DataFrame = \
-                                chunkRecordBatch.to_pandas(
-                                    memory_pool=None,
-                                    categories=None,
-                                    strings_to_categorical=False,
-                                    zero_copy_only=False,
-
-                                    integer_object_nulls=False,
-                                    # TODO: check
-                                    # (bool, default False) –
-                                    # Cast integers with nulls to objects
-
-                                    date_as_object=True,
-                                    # TODO: check
-                                    # (bool, default True) –
-                                    # Cast dates to objects.
-                                    # If False, convert to datetime64[ns] dtype.
-
-                                    timestamp_as_object=False,
-                                    use_threads=True,
-
-                                    deduplicate_objects=True,
-                                    # TODO: check
-                                    # (bool, default False) –
-                                    # Do not create multiple copies Python objects when created,
-                                    # to save on memory use. Conversion will be slower.
-
-                                    ignore_metadata=False,
-                                    safe=True,
-
-                                    split_blocks=True,
-                                    # TODO: check
-                                    # (bool, default False) –
-                                    # If True, generate one internal “block”
-                                    # for each column when creating a pandas.DataFrame
-                                    # from a RecordBatch or Table.
-                                    # While this can temporarily reduce memory
-                                    # note that various pandas operations can
-                                    # trigger “consolidation” which may balloon memory use.
-
-                                    self_destruct=True,
-                                    # TODO: check
-                                    # EXPERIMENTAL: If True, attempt to deallocate
-                                    # the originating Arrow memory while
-                                    # converting the Arrow object to pandas.
-                                    # If you use the object after calling to_pandas
-                                    # with this option it will crash your program.
-                                    # Note that you may not see always memory usage improvements.
-                                    # For example, if multiple columns share
-                                    # an underlying allocation, memory can’t be freed
-                                    # until all columns are converted.
-
-                                    types_mapper=None)
-
-                            for k in partitionKeyCols:
-                                chunkPandasDF[k] = fileCache.partitionKVs[k]
-
-                            if nSamplesPerChunk < len(chunkPandasDF):
-                                chunkPandasDF: DataFrame = \
-                                    chunkPandasDF.sample(n=nSamplesPerChunk,
-                                                         # frac=None,
-                                                         replace=False,
-                                                         weights=None,
-                                                         random_state=None,
-                                                         axis='index',
-                                                         ignore_index=False)
-
-                            chunkPandasDFs.append(chunkPandasDF)
-
-                        filePandasDF: DataFrame = concat(objs=chunkPandasDFs,
-                                                         axis='index',
-                                                         join='outer',
-                                                         ignore_index=False,
-                                                         keys=None,
-                                                         levels=None,
-                                                         names=None,
-                                                         verify_integrity=False,
-                                                         sort=False,
-                                                         copy=False)
-
-                        pandasDFConstructed: bool = True
-
-                if not pandasDFConstructed:
-                    # pandas.pydata.org/docs/reference/api/pandas.read_parquet
-                    filePandasDF: DataFrame = read_parquet(
-                        path=fileLocalPath,
-                        engine='pyarrow',
-                        columns=list(srcCols),
-                        storage_options=None,
-                        use_nullable_dtypes=True,
-
-                        # arrow.apache.org/docs/python/generated/pyarrow.parquet.read_table:
-                        use_threads=True,
-                        metadata=None,
-                        use_pandas_metadata=True,
-                        memory_map=False,
-                        read_dictionary=None,
-                        filesystem=None,
-                        filters=None,
-                        buffer_size=0,
-                        partitioning='hive',
-                        use_legacy_dataset=False,
-                        ignore_prefixes=None,
-                        pre_buffer=True,
-                        coerce_int96_timestamp_unit=None,
-
-                        # arrow.apache.org/docs/python/generated/pyarrow.Table.html
-                        # #pyarrow.Table.to_pandas:
-                        # memory_pool=None,   # (default)
-                        # categories=None,   # (default)
-                        # strings_to_categorical=False,   # (default)
-                        # zero_copy_only=False,   # (default)
-
-                        # integer_object_nulls=False,   # (default)
-                        # TODO: check
-                        # (bool, default False) –
-                        # Cast integers with nulls to objects
-
-                        # date_as_object=True,   # (default)
-                        # TODO: check
-                        # (bool, default True) –
-                        # Cast dates to objects.
-                        # If False, convert to datetime64[ns] dtype.
-
-                        # timestamp_as_object=False,   # (default)
-                        # use_threads=True,   # (default)
-
-                        # deduplicate_objects=True,   # (default: *** False ***)
-                        # TODO: check
-                        # (bool, default False) –
-                        # Do not create multiple copies Python objects when created,
-                        # to save on memory use. Conversion will be slower.
-
-                        # ignore_metadata=False,   # (default)
-                        # safe=True,   # (default)
-
-                        # split_blocks=True,   # (default: *** False ***)
-                        # TODO: check
-                        # (bool, default False) –
-                        # If True, generate one internal “block” for each column
-                        # when creating a pandas.DataFrame from a RecordBatch or Table.
-                        # While this can temporarily reduce memory note that
-                        # various pandas operations can trigger “consolidation”
-                        # which may balloon memory use.
-
-                        # self_destruct=True,   # (default: *** False ***)
-                        # TODO: check
-                        # EXPERIMENTAL: If True, attempt to deallocate the originating
-                        # Arrow memory while converting the Arrow object to pandas.
-                        # If you use the object after calling to_pandas with this option
-                        # it will crash your program.
-                        # Note that you may not see always memory usage improvements.
-                        # For example, if multiple columns share an underlying allocation,
-                        # memory can’t be freed until all columns are converted.
-
-                        # types_mapper=None,   # (default)
-                    )
+            if toSubSample := nSamplesPerFile and (nSamplesPerFile < fileCache.nRows):
+                # per-file generator, for reproducibility regardless of executor
+                rng: random.Random = self._rng('reduce', filePath, nSamplesPerFile)
+
+                intermediateN: float = (nSamplesPerFile * fileCache.nRows) ** .5
+
+                rowGroupNRows: list[int] = self._rowGroupNRows(fileLocalPath, fileCache)
+
+                # number of row groups to read, sized for intermediate sample
+                nRowGroupsToRead: int = int(math.ceil(intermediateN * len(rowGroupNRows)
+                                                      / fileCache.nRows))
+
+                if (not arrowFilters) and (nRowGroupsToRead < len(rowGroupNRows)):
+                    filePandasDF: DataFrame = \
+                        self._sampleRowGroups(fileLocalPath,
+                                              cols=srcCols,
+                                              rowGroupNRows=rowGroupNRows,
+                                              nRowGroupsToRead=nRowGroupsToRead,
+                                              nSamples=nSamplesPerFile,
+                                              rng=rng)
 
                     for k in partitionKeyCols:
                         filePandasDF[k] = fileCache.partitionKVs[k]
 
-                    if toSubSample:
-                        filePandasDF: DataFrame = filePandasDF.sample(n=nSamplesPerFile,
-                                                                      # frac=None,
-                                                                      replace=False,
-                                                                      weights=None,
-                                                                      random_state=None,
-                                                                      axis='index',
-                                                                      ignore_index=False)
-
-            else:
-                filePandasDF: DataFrame = DataFrame(index=range(nSamplesPerFile
-                                                                if nSamplesPerFile and
-                                                                (nSamplesPerFile < fileCache.nRows)
-                                                                else fileCache.nRows))
+                    pandasDFConstructed: bool = True
+
+            if not pandasDFConstructed:
+                # pandas.pydata.org/docs/reference/api/pandas.read_parquet
+                filePandasDF: DataFrame = read_parquet(
+                    path=fileLocalPath,
+                    engine='pyarrow',
+                    columns=list(srcCols),
+                    storage_options=None,
+                    use_nullable_dtypes=True,
+
+                    # arrow.apache.org/docs/python/generated/pyarrow.parquet.read_table:
+                    use_threads=True,
+                    metadata=None,
+                    use_pandas_metadata=True,
+                    memory_map=False,
+                    read_dictionary=None,
+                    filesystem=None,
+                    filters=arrowFilters,
+                    buffer_size=0,
+                    partitioning='hive',
+                    use_legacy_dataset=False,
+                    ignore_prefixes=None,
+                    pre_buffer=True,
+                    coerce_int96_timestamp_unit=None,
+
+                    # arrow.apache.org/docs/python/generated/pyarrow.Table.html
+                    # #pyarrow.Table.to_pandas:
+                    # memory_pool=None,   # (default)
+                    # categories=None,   # (default)
+                    # strings_to_categorical=False,   # (default)
+                    # zero_copy_only=False,   # (default)
+
+                    # integer_object_nulls=False,   # (default)
+                    # TODO: check
+                    # (bool, default False) –
+                    # Cast integers with nulls to objects
+
+                    # date_as_object=True,   # (default)
+                    # TODO: check
+                    # (bool, default True) –
+                    # Cast dates to objects.
+                    # If False, convert to datetime64[ns] dtype.
+
+                    # timestamp_as_object=False,   # (default)
+                    # use_threads=True,   # (default)
+
+                    # deduplicate_objects=True,   # (default: *** False ***)
+                    # TODO: check
+                    # (bool, default False) –
+                    # Do not create multiple copies Python objects when created,
+                    # to save on memory use. Conversion will be slower.
+
+                    # ignore_metadata=False,   # (default)
+                    # safe=True,   # (default)
+
+                    # split_blocks=True,   # (default: *** False ***)
+                    # TODO: check
+                    # (bool, default False) –
+                    # If True, generate one internal “block” for each column
+                    # when creating a pandas.DataFrame from a RecordBatch or Table.
+                    # While this can temporarily reduce memory note that
+                    # various pandas operations can trigger “consolidation”
+                    # which may balloon memory use.
+
+                    # self_destruct=True,   # (default: *** False ***)
+                    # TODO: check
+                    # EXPERIMENTAL: If True, attempt to deallocate the originating
+                    # Arrow memory while converting the Arrow object to pandas.
+                    # If you use the object after calling to_pandas with this option
+                    # it will crash your program.
+                    # Note that you may not see always memory usage improvements.
+                    # For example, if multiple columns share an underlying allocation,
+                    # memory can’t be freed until all columns are converted.
+
+                    # types_mapper=None,   # (default)
+                )
 
                 for k in partitionKeyCols:
                     filePandasDF[k] = fileCache.partitionKVs[k]
 
-            result: ReducedDataSetType = filePandasDF
-            for mapper in self._mappers:
-                result: ReducedDataSetType = mapper(result)
+                if toSubSample and (nSamplesPerFile < len(filePandasDF)):
+                    filePandasDF: DataFrame = filePandasDF.sample(n=nSamplesPerFile,
+                                                                  # frac=None,
+                                                                  replace=False,
+                                                                  weights=None,
+                                                                  random_state=rng.getrandbits(32),
+                                                                  axis='index',
+                                                                  ignore_index=False)
 
-            results.append(result)
+        else:
+            filePandasDF: DataFrame = DataFrame(index=range(nSamplesPerFile
+                                                            if nSamplesPerFile and
+                                                            (nSamplesPerFile < fileCache.nRows)
+                                                            else fileCache.nRows))
+
+            for k in partitionKeyCols:
+                filePandasDF[k] = fileCache.partitionKVs[k]
+
+        result: ReducedDataSetType = filePandasDF
+        for mapper in self._mappers:
+            result: ReducedDataSetType = mapper(result)
+
+        return result
+
+    @staticmethod
+    def _rowGroupNRows(fileLocalPath: Path, fileCache: Namespace, /) -> list[int]:
+        """Get row counts of file's row groups (from catalogued footer if available)."""
+        if fileCache.rowGroupStats is None:
+            metadata: FileMetaData = read_metadata(where=fileLocalPath)
+            return [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
 
-        return reducer(results)
+        return [rowGroupStats['nRows'] for rowGroupStats in fileCache.rowGroupStats]
+
+    @staticmethod
+    def _sampleRowGroups(fileLocalPath: Path, /, *,
+                         cols: set[str], rowGroupNRows: list[int],
+                         nRowGroupsToRead: int, nSamples: int,
+                         rng: random.Random) -> DataFrame:
+        """Sample rows from a file by reading only randomly-selected row groups.
+
+        Row groups are drawn with replacement with probabilities proportional
+        to their row counts, then equal numbers of rows are drawn per draw
+        from the selected row groups, so that every row of the file is
+        (up to capping by row group sizes) equally likely to be sampled.
+        """
+        nSamplesPerDraw: int = int(math.ceil(nSamples / nRowGroupsToRead))
+
+        nDrawsByRowGroup: dict[int, int] = {}
+        for i in rng.choices(population=range(len(rowGroupNRows)),
+                             weights=rowGroupNRows,
+                             k=nRowGroupsToRead):
+            nDrawsByRowGroup[i] = nDrawsByRowGroup.get(i, 0) + 1
+
+        rowGroups: list[int] = sorted(nDrawsByRowGroup)
+
+        # row indices to take, offset by positions of row groups within table read
+        rowIndices: list[int] = []
+        offset: int = 0
+        for i in rowGroups:
+            rowIndices.extend(
+                offset + j
+                for j in sorted(rng.sample(population=range(rowGroupNRows[i]),
+                                           k=min(nSamplesPerDraw * nDrawsByRowGroup[i],
+                                                 rowGroupNRows[i]))))
+            offset += rowGroupNRows[i]
+
+        # arrow.apache.org/docs/python/generated/pyarrow.parquet.ParquetFile.html
+        # #pyarrow.parquet.ParquetFile.read_row_groups
+        sampleArrowTable: Table = (ParquetFile(source=fileLocalPath,
+                                               memory_map=False, buffer_size=0, pre_buffer=True)
+                                   .read_row_groups(row_groups=rowGroups,
+                                                    columns=list(cols),
+                                                    use_threads=True,
+                                                    use_pandas_metadata=True)
+                                   .take(rowIndices))
+
+        if len(rowIndices) > nSamples:
+            sampleArrowTable: Table = \
+                sampleArrowTable.take(sorted(rng.sample(population=range(len(rowIndices)),
+                                                        k=nSamples)))
+
+        return sampleArrowTable.to_pandas(date_as_object=True,
+                                          deduplicate_objects=True,
+                                          split_blocks=True,
+                                          self_destruct=True)
 
     @staticmethod
     def _getCols(pandasDF: DataFrame, cols: Union[str, tuple[str]]) -> DataFrame:
@@ -988,17 +1440,21 @@ class ParquetDataset(AbstractS3FileDataHandler):
 
         return pandasDF[cols if isinstance(cols, str) else list(cols)]
 
-    @lru_cache(maxsize=None, typed=False)
+    @boundedMethodCache
     def __getitem__(self, cols: Union[str, tuple[str]], /) -> ParquetDataset:
         """Get column(s)."""
         return self.map(partial(self._getCols, cols=cols),
                         reduceMustInclCols=cols,
                         inheritNRows=True)
 
-    @lru_cache(maxsize=None, typed=False)
+    @staticmethod
+    def _castType(pandasDF: DataFrame, colsToTypes: dict[str, Any]) -> DataFrame:
+        return pandasDF.astype(colsToTypes, copy=False, errors='raise')
+
+    @boundedMethodCache
     def castType(self, **colsToTypes: dict[str, Any]) -> ParquetDataset:
         """Cast data type(s) of column(s)."""
-        return self.map(lambda df: df.astype(colsToTypes, copy=False, errors='raise'),
+        return self.map(partial(self._castType, colsToTypes=colsToTypes),
                         reduceMustInclCols=set(colsToTypes),
                         inheritNRows=True)
 
@@ -1006,80 +1462,177 @@ class ParquetDataset(AbstractS3FileDataHandler):
         """Collect content."""
         return self.reduce(cols=cols if cols else None, **kwargs)
 
+    def iterBatches(self, *filePaths: str, **kwargs: Any) \
+            -> Iterator[Union[ReducedDataSetType, RecordBatch]]:
+        # pylint: disable=too-many-locals
+        """Iterate through mapped content file by file or chunk by chunk.
+
+        Keyword Args:
+            - **cols**: column(s) to read from each file
+            - **batchRows**: max number of rows to read into memory at a time;
+            if not given, each file is read & mapped as a whole
+            - **arrow**: whether to yield raw Arrow ``RecordBatch``es
+            (only for data sets without mappers, or whose mappers are all
+            pushable into Arrow scans: column selections, casts of other columns
+            & simple filters)
+            - **prefetchNFiles**: number of upcoming S3 files to download
+            in the background (default: 2)
+
+        Only 1 file/chunk is held in memory at a time,
+        and batches are yielded in sorted file-path order.
+        """
+        cols: Optional[Collection[str]] = kwargs.get('cols')
+        cols: set[str] = to_iterable(cols, iterable_type=set) if cols else set()
+
+        batchRows: Optional[int] = kwargs.get('batchRows')
+
+        if arrow := kwargs.get('arrow', False):
+            assert batchRows, ValueError('*** ARROW BATCHES REQUIRE batchRows ***')
+
+        verbose: bool = kwargs.get('verbose', True)
+
+        filePaths: list[str] = sorted(filePaths if filePaths else self.filePaths)
+
+        prefetchedFilePaths: Iterator[str] = \
+            self._iterPrefetching(filePaths,
+                                  nAhead=kwargs.get('prefetchNFiles', _PREFETCH_N_FILES))
+
+        for filePath in (tqdm(prefetchedFilePaths, total=len(filePaths))
+                         if verbose and (len(filePaths) > 1)
+                         else prefetchedFilePaths):
+            fileCache: Namespace = self.cacheFileMetadataAndSchema(filePath=filePath)
+
+            colsForFile: set[str] = (
+                cols
+                if cols
+                else fileCache.srcColsInclPartitionKVs
+            ) | self._reduceMustInclCols
+
+            srcCols: set[str] = colsForFile & fileCache.srcColsExclPartitionKVs
+
+            if not (batchRows and srcCols and (batchRows < fileCache.nRows)) and not arrow:
+                yield self._reduceFile(filePath, cols=cols, nSamplesPerFile=None)
+                continue
+
+            partitionKeyCols: set[str] = colsForFile.intersection(fileCache.partitionKVs)
+
+            if arrow:
+                # mappers must be fully pushed down into the Arrow scan
+                assert (arrowFilters := self._arrowFiltersForFile(fileCache,
+                                                                   exactFor=cols)) is not None, \
+                    ValueError(f'*** {self}: ARROW BATCHES ONLY AVAILABLE WITH MAPPERS THAT ARE '
+                               'COLUMN SELECTIONS, CASTS OF OTHER COLUMNS OR SIMPLE FILTERS ***')
+
+            else:
+                arrowFilters: list[tuple[str, str, Any]] = self._arrowFiltersForFile(fileCache)
+
+            if arrowFilters:
+                # arrow.apache.org/docs/python/generated/pyarrow.dataset.Dataset.html
+                # #pyarrow.dataset.Dataset.to_batches
+                recordBatches: Iterator[RecordBatch] = (
+                    dataset(source=str(self.fileLocalPath(filePath=filePath)),
+                            format='parquet')
+                    .to_batches(columns=list(srcCols),
+                                filter=filters_to_expression(arrowFilters),
+                                batch_size=batchRows,
+                                use_threads=True))
+
+            else:
+                # arrow.apache.org/docs/python/generated/pyarrow.parquet.ParquetFile.html
+                # #pyarrow.parquet.ParquetFile.iter_batches
+                recordBatches: Iterator[RecordBatch] = (
+                    ParquetFile(source=self.fileLocalPath(filePath=filePath),
+                                memory_map=False, buffer_size=0, pre_buffer=True)
+                    .iter_batches(batch_size=batchRows,
+                                  row_groups=None,
+                                  columns=list(srcCols),
+                                  use_threads=True,
+                                  use_pandas_metadata=True))
+
+            for recordBatch in recordBatches:
+                if arrow:
+                    for k in partitionKeyCols:
+                        recordBatch: RecordBatch = RecordBatch.from_arrays(
+                            arrays=[*recordBatch.columns,
+                                    arrowArray([fileCache.partitionKVs[k]] *
+                                               recordBatch.num_rows)],
+                            names=[*recordBatch.schema.names, k])
+
+                    yield recordBatch
+
+                else:
+                    chunkPandasDF: DataFrame = recordBatch.to_pandas(date_as_object=True,
+                                                                     deduplicate_objects=True,
+                                                                     split_blocks=True,
+                                                                     self_destruct=True)
+
+                    for k in partitionKeyCols:
+                        chunkPandasDF[k] = fileCache.partitionKVs[k]
+
+                    result: ReducedDataSetType = chunkPandasDF
+                    for mapper in self._mappers:
+                        result: ReducedDataSetType = mapper(result)
+
+                    yield result
+
+    def foldBatches(self, folder: Callable[[Any, Union[ReducedDataSetType, RecordBatch]], Any],
+                    initial: Any, *filePaths: str, **kwargs: Any) -> Any:
+        """Incrementally fold streamed batches into an accumulated result.
+
+        ``folder(accumulated, batch)`` is applied to each batch yielded by
+        ``.iterBatches(*filePaths, **kwargs)``, starting from ``initial``,
+        so that only the accumulated result & 1 batch are held in memory.
+        """
+        return fold(folder, self.iterBatches(*filePaths, **kwargs), initial)
+
     # =========
     # FILTERING
     # ---------
     # _subset
     # filterByPartitionKeys
     # filter
+    # _arrowFiltersForFile
 
-    @lru_cache(maxsize=None, typed=False)   # computationally expensive, so cached
+    @boundedMethodCache
     def _subset(self, *filePaths: str, **kwargs: Any) -> ParquetDataset:
-        # pylint: disable=too-many-locals
-        if filePaths:
-            assert self.filePaths.issuperset(filePaths)
+        """Get virtual subset backed by specified files.
 
-            nFilePaths: int = len(filePaths)
-
-            if nFilePaths == self.nFiles:
-                return self
-
-            if nFilePaths > 1:
-                verbose: bool = kwargs.pop('verbose', True)
+        No files are copied: the subset shares this data set's
+        file metadata & schema caches, so subsetting is metadata-only.
+        """
+        assert filePaths, ValueError(f'*** {self}: EMPTY FILE SELECTION ***')
+        assert self.filePaths.issuperset(filePaths)
 
-                _pathPlusSepLen: int = len(self.path) + 1
-                fileSubPaths: list[str] = [filePath[_pathPlusSepLen:] for filePath in filePaths]
+        nFilePaths: int = len(filePaths)
 
-                _uuid = uuid4()
-                subsetPath: str = (
-                    f"s3://{self.s3Bucket}/{(subsetDirS3Key := f'{self._TMP_DIR_S3_KEY}/{_uuid}')}"
-                    if self.onS3
-                    else f'{self._LOCAL_CACHE_DIR_PATH}/{_uuid}')
+        if nFilePaths == self.nFiles:
+            return self
 
-                if verbose:
-                    self.stdOutLogger.info(
-                        msg=(msg := f'Subsetting {len(filePaths):,} Files to "{subsetPath}"...'))
-                    tic: float = time.time()
+        return ParquetDataset(
+            path=self.path if nFilePaths > 1 else filePaths[0],
+            awsRegion=self.awsRegion,
+            accessKey=self.accessKey, secretKey=self.secretKey,
 
-                for fileSubPath in (tqdm(fileSubPaths) if verbose else fileSubPaths):
-                    if self.onS3:
-                        self.s3Client.copy(CopySource=dict(Bucket=self.s3Bucket,
-                                                           Key=f'{self.pathS3Key}/{fileSubPath}'),
-                                           Bucket=self.s3Bucket,
-                                           Key=f'{subsetDirS3Key}/{fileSubPath}')
-                    else:
-                        fs.cp(from_path=f'{self.path}/{fileSubPath}',
-                              to_path=f'{subsetPath}/{fileSubPath}',
-                              hdfs=False, is_dir=False)
+            _mappers=self._mappers, _reduceMustInclCols=self._reduceMustInclCols,
+            _filePaths=filePaths if nFilePaths > 1 else None,
 
-                if verbose:
-                    toc: float = time.time()
-                    self.stdOutLogger.info(msg=f'{msg} done!  <{toc-tic:.1f} s>')
+            iCol=self._iCol, tCol=self._tCol,
 
-            else:
-                subsetPath: str = filePaths[0]
+            reprSampleMinNFiles=self._reprSampleMinNFiles, reprSampleSize=self._reprSampleSize,
 
-            return ParquetDataset(
-                path=subsetPath, awsRegion=self.awsRegion,
-                accessKey=self.accessKey, secretKey=self.secretKey,
+            nulls=self._nulls,
+            minNonNullProportion=self._minNonNullProportion,
+            outlierTailProportion=self._outlierTailProportion,
+            maxNCats=self._maxNCats,
+            minProportionByMaxNCats=self._minProportionByMaxNCats,
 
-                _mappers=self._mappers, _reduceMustInclCols=self._reduceMustInclCols,
+            reduceExecutor=self._reduceExecutor, reduceNWorkers=self._reduceNWorkers,
 
-                iCol=self._iCol, tCol=self._tCol,
+            seed=self._seed,
 
-                reprSampleMinNFiles=self._reprSampleMinNFiles, reprSampleSize=self._reprSampleSize,
-
-                nulls=self._nulls,
-                minNonNullProportion=self._minNonNullProportion,
-                outlierTailProportion=self._outlierTailProportion,
-                maxNCats=self._maxNCats,
-                minProportionByMaxNCats=self._minProportionByMaxNCats,
-
-                **kwargs)
-
-        return self
+            **kwargs)
 
-    @lru_cache(maxsize=None, typed=False)
+    @boundedMethodCache
     def filterByPartitionKeys(self,
                               *filterCriteriaTuples: Union[tuple[str, str], tuple[str, str, str]],
                               **kwargs: Any) -> ParquetDataset:
@@ -1145,34 +1698,164 @@ class ParquetDataset(AbstractS3FileDataHandler):
 
         return self
 
-    @lru_cache(maxsize=None, typed=False)
+    @boundedMethodCache
     def filter(self, *conditions: str, **kwargs: Any) -> ParquetDataset:
-        """Apply filtering mapper."""
+        """Apply filtering mapper.
+
+        Simple comparisons of source columns against literals
+        (e.g., ``col == "x"``, ``col >= 3``, ``col in ["x", "y"]``)
+        are additionally pushed down into Arrow reads,
+        so that row groups can be skipped using Parquet statistics;
+        the pandas query is always applied afterwards for exactness.
+        """
         s3ParquetDF: ParquetDataset = self
 
         for condition in conditions:
-            # pylint: disable=cell-var-from-loop
-            s3ParquetDF: ParquetDataset = \
-                s3ParquetDF.map(lambda df: df.query(expr=condition, inplace=False),
-                                **kwargs)
+            s3ParquetDF: ParquetDataset = s3ParquetDF.map(_QueryFilter(condition), **kwargs)
 
         return s3ParquetDF
 
+    _STR_TYPES: tuple = str, 'str', 'string'
+
+    def _arrowFiltersForFile(self, fileCache: Namespace, /, *,
+                             exactFor: Optional[Collection[str]] = None) \
+            -> Optional[list[tuple[str, str, Any]]]:
+        # pylint: disable=too-many-branches
+        """Get Arrow filters pushable down into reading a file.
+
+        Filters are collected from the leading run of mappers that preserve
+        source column values (column selections, type casts & query filters).
+        Columns cast to string may still be filtered if their source type is
+        string, or integer with canonical integer string literals.
+
+        If ``exactFor`` columns are given, ALL mappers must be exactly replaced
+        by the Arrow scan of those columns with the returned filters
+        (i.e., only selections including, & casts excluding, those columns,
+        and fully translated query filters), or else ``None`` is returned.
+        """
+        exact: bool = exactFor is not None
+        if exact:
+            exactFor: set[str] = to_iterable(exactFor, iterable_type=set)
+
+        arrowFilters: list[tuple[str, str, Any]] = []
+
+        strCastCols: set[str] = set()
+        otherCastCols: set[str] = set()
+
+        for mapper in self._mappers:
+            if isinstance(mapper, _QueryFilter):
+                if exact and not mapper.arrowExact:
+                    return None
+
+                nArrowFilters: int = len(arrowFilters)
+
+                for col, op, value in mapper.arrowFilters:
+                    if ((col not in fileCache.srcTypesExclPartitionKVs) or
+                            (col in otherCastCols)):
+                        continue
+
+                    arrowType: DataType = fileCache.srcTypesExclPartitionKVs[col]
+
+                    values: list[Any] = value if op == 'in' else [value]
+
+                    if col in strCastCols:
+                        if not all(isinstance(v, str) for v in values):
+                            continue
+
+                        if is_integer(arrowType):
+                            if not all(v.lstrip('-').isdigit() and (str(int(v)) == v)
+                                       for v in values):
+                                continue
+
+                            values: list[int] = [int(v) for v in values]
+
+                        elif not is_string(arrowType):
+                            continue
+
+                    elif not all((isinstance(v, str) and is_string(arrowType)) or
+                                 (isinstance(v, bool) and is_boolean(arrowType)) or
+                                 (isinstance(v, (int, float)) and not isinstance(v, bool) and
+                                  is_num(arrowType))
+                                 for v in values):
+                        continue
+
+                    arrowFilters.append((col, op, values if op == 'in' else values[0]))
+
+                if exact and (len(arrowFilters) - nArrowFilters < len(mapper.arrowFilters)):
+                    return None
+
+            elif isinstance(mapper, partial) and (mapper.func is self._getCols):
+                if exact and not exactFor.issubset(to_iterable(mapper.keywords['cols'],
+                                                                iterable_type=set)):
+                    return None
+
+            elif isinstance(mapper, partial) and (mapper.func is self._castType):
+                if exact and not exactFor.isdisjoint(mapper.keywords['colsToTypes']):
+                    return None
+
+                for col, _type in mapper.keywords['colsToTypes'].items():
+                    (strCastCols
+                     if (_type in self._STR_TYPES) and (col not in otherCastCols)
+                     else otherCastCols).add(col)
+
+            elif exact:
+                return None
+
+            else:
+                break
+
+        return arrowFilters
+
     # ========
     # SAMPLING
     # --------
+    # seed / _rng
     # prelimReprSampleFilePaths
     # reprSampleFilePaths
     # sample
+    # _reprSampleCachePath
     # _assignReprSample
 
+    @property
+    def seed(self) -> Optional[int]:
+        """Random seed making file selection & row sampling reproducible.
+
+        (default = ``None``, i.e. non-reproducible sampling)
+        """
+        return self._seed
+
+    @seed.setter
+    def seed(self, seed: Optional[int], /):
+        if seed != self._seed:
+            self._seed: Optional[int] = seed
+
+            # invalidate samples drawn with previous seed
+            self._cache.prelimReprSampleFilePaths = None
+            self._cache.reprSampleFilePaths = None
+            self._cache.reprSample = None
+
+    def _rng(self, *salt: Any) -> random.Random:
+        """Get random number generator for a specific sampling purpose.
+
+        With a seed, generators are derived deterministically from the seed
+        and the salt (e.g., sampling purpose & file path), so that results
+        do not depend on process, execution order or executor.
+        """
+        if self._seed is None:
+            return random.Random()
+
+        return random.Random(int.from_bytes(
+            sha1('|'.join(str(i) for i in (self._seed, *salt)).encode()).digest()[:8],
+            byteorder='big'))
+
     @property
     def prelimReprSampleFilePaths(self) -> set[str]:
         """Prelim representative sample file paths."""
         if self._cache.prelimReprSampleFilePaths is None:
             self._cache.prelimReprSampleFilePaths = \
                 randomSample(population=self.filePaths,
-                             sampleSize=self._reprSampleMinNFiles)
+                             sampleSize=self._reprSampleMinNFiles,
+                             rng=self._rng('prelimReprSampleFilePaths'))
 
         return self._cache.prelimReprSampleFilePaths
 
@@ -1189,7 +1872,8 @@ class ParquetDataset(AbstractS3FileDataHandler):
                 self._cache.prelimReprSampleFilePaths |
                 (randomSample(
                     population=self.filePaths - self._cache.prelimReprSampleFilePaths,
-                    sampleSize=reprSampleNFiles - self._reprSampleMinNFiles)
+                    sampleSize=reprSampleNFiles - self._reprSampleMinNFiles,
+                    rng=self._rng('reprSampleFilePaths'))
                  if reprSampleNFiles > self._reprSampleMinNFiles
                  else set()))
 
@@ -1220,7 +1904,8 @@ class ParquetDataset(AbstractS3FileDataHandler):
                 nFiles: int = min(nFiles, maxNFiles)
 
             if nFiles < self.nFiles:
-                filePaths: set[str] = randomSample(population=self.filePaths, sampleSize=nFiles)
+                filePaths: set[str] = randomSample(population=self.filePaths, sampleSize=nFiles,
+                                                   rng=self._rng('sample', n, nFiles))
             else:
                 nFiles: int = self.nFiles
                 filePaths: set[str] = self.filePaths
@@ -1236,10 +1921,69 @@ class ParquetDataset(AbstractS3FileDataHandler):
                            verbose=verbose,
                            **kwargs)
 
+    @staticmethod
+    def _mapperIdentity(mapper: Callable, /) -> Optional[str]:
+        """Get identity of mapper that is stable across processes (if determinable).
+
+        Functions are identified by their code (incl. referenced names & nested code),
+        default argument values, closure cell values & referenced global values;
+        other objects by their type & full state.
+        Anything whose identity cannot be reliably derived yields ``None``.
+        """
+        return _valueIdentity(mapper, depth=0, seen=frozenset())
+
+    @property
+    def _reprSampleCachePath(self) -> Optional[Path]:
+        """Get local persisted representative sample file path.
+
+        The path is keyed by data set fingerprint (file paths & versions),
+        sample size, mapper chain identity & seed,
+        and is only available for seeded data sets with identifiable mappers.
+        """
+        if self._seed is None:
+            return None
+
+        mapperIdentities: list[Optional[str]] = [self._mapperIdentity(mapper)
+                                                 for mapper in self._mappers]
+        if None in mapperIdentities:
+            return None
+
+        fileVersions: list[tuple[str, Optional[str]]] = \
+            sorted((filePath, self._FILE_CACHES[filePath].version) for filePath in self.filePaths)
+        if any(version is None for _, version in fileVersions):
+            return None
+
+        key: str = sha1(repr((fileVersions, self._reprSampleSize, mapperIdentities,
+                              sorted(self._reduceMustInclCols), self._seed)).encode()).hexdigest()
+
+        return self._LOCAL_CACHE_DIR_PATH / 'repr-samples' / f'{key}.feather'
+
     def _assignReprSample(self):
-        self._cache.reprSample = self.sample(n=self._reprSampleSize,
-                                             filePaths=self.reprSampleFilePaths,
-                                             verbose=True)
+        if (reprSampleCachePath := self._reprSampleCachePath) and reprSampleCachePath.is_file():
+            self.stdOutLogger.info(
+                msg=f'Loading Representative Sample from "{reprSampleCachePath}"...')
+
+            # uncompressed Feather files are memory-mapped rather than read
+            self._cache.reprSample = readFeather(source=reprSampleCachePath,
+                                                 memory_map=True).to_pandas()
+
+        else:
+            self._cache.reprSample = self.sample(n=self._reprSampleSize,
+                                                 filePaths=self.reprSampleFilePaths,
+                                                 verbose=True)
+
+            if reprSampleCachePath and isinstance(self._cache.reprSample, DataFrame):
+                reprSampleCachePath.parent.mkdir(parents=True, exist_ok=True)
+
+                tmpReprSampleCachePath: Path = \
+                    reprSampleCachePath.with_name(f'{reprSampleCachePath.name}.{uuid4()}.part')
+
+                writeFeather(df=Table.from_pandas(df=self._cache.reprSample,
+                                                  preserve_index=True),
+                             dest=str(tmpReprSampleCachePath),
+                             compression='uncompressed')
+
+                os.replace(tmpReprSampleCachePath, reprSampleCachePath)
 
         # pylint: disable=attribute-defined-outside-init
         self._reprSampleSize: int = len(self._cache.reprSample)
@@ -1253,12 +1997,31 @@ class ParquetDataset(AbstractS3FileDataHandler):
     # count
     # nonNullProportion
     # distinct
-    # distinctPartitions
-    # quantile
+    # distinctPartitions / partitionVersions
+    # quantile / quantileSketch
     # sampleStat
     # outlierRstStat / outlierRstMin / outlierRstMax
+    # _profileInBulk
     # profile
 
+    @staticmethod
+    def _countNonNulls(series: Series,
+                       lowerNumericNull: Optional[float],
+                       upperNumericNull: Optional[float]) -> int:
+        if isnull(lowerNumericNull):
+            return ((series.notnull()
+                     if isnull(upperNumericNull)
+                     else (series < upperNumericNull))
+                    .sum(axis='index', skipna=True, level=None, min_count=0))
+
+        return ((series > lowerNumericNull)
+                if isnull(upperNumericNull)
+                else series.between(left=lowerNumericNull, right=upperNumericNull,
+                                    inclusive='neither')).sum(axis='index',
+                                                              skipna=True,
+                                                              level=None,
+                                                              min_count=0)
+
     def count(self, *cols: str, **kwargs: Any) -> Union[int, Namespace]:
         """Count non-NULL values in specified column(s).
 
@@ -1294,42 +2057,9 @@ class ParquetDataset(AbstractS3FileDataHandler):
 
                 self._cache.count[col] = result = int(
                     self[col]
-                    .map(((lambda series: (series.notnull()
-                                           .sum(axis='index',
-                                                skipna=True,
-                                                level=None,
-                                                # numeric_only=True,
-                                                min_count=0)))
-
-                          if isnull(upperNumericNull)
-
-                          else (lambda series: ((series < upperNumericNull)
-                                                .sum(axis='index',
-                                                     skipna=True,
-                                                     level=None,
-                                                     # numeric_only=True,
-                                                     min_count=0))))
-
-                         if isnull(lowerNumericNull)
-
-                         else ((lambda series: ((series > lowerNumericNull)
-                                                .sum(axis='index',
-                                                     skipna=True,
-                                                     level=None,
-                                                     # numeric_only=True,
-                                                     min_count=0)))
-
-                               if isnull(upperNumericNull)
-
-                               else (lambda series: (series
-                                                     .between(left=lowerNumericNull,
-                                                              right=upperNumericNull,
-                                                              inclusive='neither')
-                                                     .sum(axis='index',
-                                                          skipna=True,
-                                                          level=None,
-                                                          # numeric_only=True,
-                                                          min_count=0)))),
+                    .map(partial(self._countNonNulls,
+                                 lowerNumericNull=lowerNumericNull,
+                                 upperNumericNull=upperNumericNull),
                          reduceMustInclCols=col)
                     .reduce(cols=col, reducer=sum))
 
@@ -1433,19 +2163,67 @@ class ParquetDataset(AbstractS3FileDataHandler):
         return {re.search(f'{col}=(.*?)/', filePath).group(1)
                 for filePath in self.filePaths}
 
-    @lru_cache(maxsize=None, typed=False)   # computationally expensive, so cached
+    def partitionVersions(self, col: str, /) -> dict[str, Optional[str]]:
+        """Return versions of distinct partitions of a certain partition key.
+
+        (each partition's version hashes its files' paths & versions,
+        or is ``None`` if any of its files' versions is unknown)
+        """
+        partitionFileVersions: dict[str, list[tuple[str, Optional[str]]]] = {}
+
+        for filePath in self.filePaths:
+            partitionFileVersions.setdefault(re.search(f'{col}=(.*?)/', filePath).group(1),
+                                             []).append((filePath,
+                                                         self._FILE_CACHES[filePath].version))
+
+        return {partition: (None
+                            if any(version is None for _, version in fileVersions)
+                            else sha1(repr(sorted(fileVersions)).encode()).hexdigest())
+                for partition, fileVersions in partitionFileVersions.items()}
+
+    @boundedMethodCache   # computationally expensive, so cached
     def quantile(self, *cols: str, **kwargs: Any) -> Union[float, int,
                                                            Series, Namespace]:
-        """Return quantile values in specified column(s)."""
+        """Return quantile values in specified column(s).
+
+        Keyword Args:
+            - **q**: quantile(s) (default: 0.5)
+            - **approx**: whether to approximate from a mergeable sketch
+            (default: ``False``, i.e. exact from the whole reduced column)
+            - **rankError**: max rank error (as proportion) in approximate mode
+            (default: 0.001)
+        """
         if len(cols) > 1:
             return Namespace(**{col: self.quantile(col, **kwargs) for col in cols})
 
         col: str = cols[0]
 
+        if kwargs.get('approx', False):
+            return (self.quantileSketch(col, rankError=kwargs.get('rankError',
+                                                                  _DEFAULT_QUANTILE_RANK_ERROR))
+                    .quantile(q=kwargs.get('q', .5)))
+
         # for precision, calc from whole data set instead of from reprSample
         return self[col].reduce(cols=col).quantile(q=kwargs.get('q', .5),
                                                    interpolation='linear')
 
+    @boundedMethodCache
+    def quantileSketch(self, col: str, /, rankError: float = _DEFAULT_QUANTILE_RANK_ERROR) \
+            -> QuantileSketch:
+        """Compute mergeable approximate quantile sketch of specified column.
+
+        Per-file sketches are computed in the map step and merged in the reduce step,
+        in 1 pass over the whole data set with memory bounded by the number of files,
+        with quantiles' rank errors (as proportions) at most ``rankError``.
+        Any number of quantiles (e.g., outlier-resistant bounds)
+        can then be read off the same sketch.
+        """
+        return (self[col]
+                .map(partial(QuantileSketch.fromValues,
+                             maxNPoints=nPointsForRankError(rankError)),
+                     reduceMustInclCols=col)
+                .reduce(cols=col, reducer=QuantileSketch.merge))
+
     def sampleStat(self, *cols: str, **kwargs: Any) -> Union[float, int, Namespace]:
         """Approximate measurements of a certain stat on numerical columns.
 
@@ -1698,6 +2476,107 @@ class ParquetDataset(AbstractS3FileDataHandler):
         raise ValueError(f'*** {self}.outlierRstMax({col}, ...): '
                          f'COLUMN "{col}" NOT NUMERICAL ***')
 
+    @staticmethod
+    def _toPyNums(series: Series, /) -> dict[str, PyNumType]:
+        return {col: (float(v) if isinstance(v, NUMPY_FLOAT_TYPES)
+                      else (int(v) if isinstance(v, NUMPY_INT_TYPES) else v))
+                for col, v in series.items()}
+
+    def _profileInBulk(self, *cols: str, **kwargs: Any):
+        # pylint: disable=too-many-locals
+        """Compute profiling statistics of many columns at once, into caches.
+
+        Non-NULL proportions, distinct proportions, sample min/median/max/mean,
+        outlier-resistant min/max/mean/median are computed with vectorized
+        operations over the representative sample's columns together
+        (rather than column by column), and cached in bulk.
+        """
+        verbose: Optional[Union[bool, int]] = True if debug.ON else kwargs.get('verbose')
+
+        if verbose:
+            self.stdOutLogger.info(msg=(msg := f'Profiling {len(cols):,} Columns in Bulk...'))
+            tic: float = time.time()
+
+        cols: list[str] = [col for col in cols if col in self.reprSample.columns]
+        reprSample: DataFrame = self.reprSample[cols]
+
+        # non-NULL proportions
+        if colsToCount := [col for col in cols if col not in self._cache.nonNullProportion]:
+            noNumNullCols: list[str] = [col for col in colsToCount
+                                        if all(isnull(v) for v in self._nulls[col])]
+
+            self._cache.nonNullProportion.update(
+                (reprSample[noNumNullCols].notnull().sum(axis='index') / self.reprSampleSize)
+                .to_dict())
+
+            for col in set(colsToCount).difference(noNumNullCols):
+                self.nonNullProportion(col)
+
+        skipIfInsuffNonNull: bool = kwargs.get('skipIfInsuffNonNull', False)
+        cols: list[str] = [col for col in cols
+                           if self.suffNonNull(col) or (not skipIfInsuffNonNull)]
+
+        # distinct proportions of possible categorical columns
+        if kwargs.get('profileCat', True):
+            for col in cols:
+                if (col not in self._cache.distinct) and is_possible_cat(self.type(col)):
+                    self.distinct(col)
+
+        # numerical columns, grouped by outlier tail proportion
+        numColsByTail: dict[float, list[str]] = {}
+        for col in (cols if kwargs.get('profileNum', True) else ()):
+            if self.typeIsNum(col) and (col not in self._cache.outlierRstMedian):
+                numColsByTail.setdefault(self._outlierTailProportion[col], []).append(col)
+
+        for outlierTailProportion, numCols in numColsByTail.items():
+            numSample: DataFrame = reprSample[numCols]
+
+            quantiles: DataFrame = numSample.quantile(q=[0, outlierTailProportion, .5,
+                                                         1 - outlierTailProportion, 1],
+                                                      axis='index',
+                                                      numeric_only=False,
+                                                      interpolation='linear')
+
+            sampleMin, outlierRstMin, sampleMedian, outlierRstMax, sampleMax = \
+                (quantiles.iloc[i] for i in range(5))
+
+            # outlier-resistant bounds must exclude sample extremes unless degenerate
+            outlierRstMin: Series = outlierRstMin.mask(
+                cond=(outlierRstMin == sampleMin) & (outlierRstMin < sampleMedian),
+                other=numSample.where(numSample.gt(sampleMin, axis='columns'))
+                .min(axis='index', skipna=True))
+            outlierRstMax: Series = outlierRstMax.mask(
+                cond=(outlierRstMax == sampleMax) & (outlierRstMax > sampleMedian),
+                other=numSample.where(numSample.lt(sampleMax, axis='columns'))
+                .max(axis='index', skipna=True))
+
+            outlierRstSample: DataFrame = numSample.where(
+                numSample.ge(outlierRstMin, axis='columns') &
+                numSample.le(outlierRstMax, axis='columns'))
+
+            outlierRstMean: Series = outlierRstSample.mean(axis='index', skipna=True)
+            outlierRstMean: Series = outlierRstMean.mask(cond=outlierRstMean.isnull(),
+                                                         other=outlierRstMin)
+            outlierRstMedian: Series = outlierRstSample.median(axis='index', skipna=True)
+            outlierRstMedian: Series = outlierRstMedian.mask(cond=outlierRstMedian.isnull(),
+                                                             other=outlierRstMin)
+
+            for cacheCategory, stats in (
+                    ('sampleMin', sampleMin), ('sampleMax', sampleMax),
+                    ('sampleMedian', sampleMedian),
+                    ('sampleMean', numSample.mean(axis='index', skipna=True)),
+                    ('outlierRstMin', outlierRstMin), ('outlierRstMax', outlierRstMax),
+                    ('outlierRstMean', outlierRstMean), ('outlierRstMedian', outlierRstMedian)):
+                cache: Namespace = getattr(self._cache, cacheCategory)
+
+                for col, v in self._toPyNums(stats).items():
+                    if col not in cache:
+                        cache[col] = v
+
+        if verbose:
+            toc: float = time.time()
+            self.stdOutLogger.info(msg=f'{msg} done!  <{toc - tic:,.1f} s>')
+
     def profile(self, *cols: str, **kwargs: Any) -> Namespace:
         # pylint: disable=too-many-branches,too-many-locals,too-many-statements
         """Profile specified column(s).
@@ -1727,6 +2606,10 @@ class ParquetDataset(AbstractS3FileDataHandler):
         asDict: bool = kwargs.pop('asDict', False)
 
         if len(cols) > 1:
+            # compute statistics of all columns together, so that below per-column
+            # profiles are assembled from caches
+            self._profileInBulk(*cols, **kwargs)
+
             return Namespace(**{col: self.profile(col, **kwargs) for col in cols})
 
         col: str = cols[0]
@@ -1903,6 +2786,11 @@ class ParquetDataset(AbstractS3FileDataHandler):
 
                 - **savePath** *(str)*: path to save new fitted data transformations
 
+                - **seedRunningStats** *(bool, default = False)*: whether to seed
+                running statistics for ``PandasMLPreprocessor.refit(...)``
+                from all files (1 extra pass); if not, running statistics
+                only cover data later passed to ``PandasMLPreprocessor.update(...)``
+
                 - **method** *(str)*: one of the following methods to fill
                     ``NULL`` values in **numerical** columns,
                     or *dict* of such method specifications by column name
@@ -1924,6 +2812,8 @@ class ParquetDataset(AbstractS3FileDataHandler):
 
         returnPreproc: bool = kwargs.pop('returnPreproc', False)
 
+        seedRunningStats: bool = kwargs.pop('seedRunningStats', False)
+
         verbose: Union[bool, int] = kwargs.pop('verbose', True)
         if debug.ON:
             verbose: bool = True
@@ -2201,6 +3091,11 @@ class ParquetDataset(AbstractS3FileDataHandler):
                                 'null-fill-value': numColNullFillValue,
                                 'transform-to': scaledCol}
 
+                        origToPreprocColMap[numCol][
+                            PandasMLPreprocessor._OUTLIER_RST_RANGE_KEY] = (
+                                numColMin if numColOutlierTail in ('lower', 'both') else None,
+                                numColMax if numColOutlierTail in ('upper', 'both') else None)
+
                         numScaledCols.add(scaledCol)
 
                 if verbose:
@@ -2211,6 +3106,14 @@ class ParquetDataset(AbstractS3FileDataHandler):
             pandasMLPreproc: PandasMLPreprocessor = \
                 PandasMLPreprocessor(origToPreprocColMap=origToPreprocColMap)
 
+            if seedRunningStats:
+                # seed running statistics for later incremental refitting with new data
+                # from full files, i.e., the same population as later updates
+                # (rather than from the representative sample)
+                pandasMLPreproc: PandasMLPreprocessor = \
+                    self.foldBatches(PandasMLPreprocessor.update, pandasMLPreproc,
+                                     cols=cols, verbose=verbose)
+
             if savePath := kwargs.pop('savePath', None):
                 if verbose:
                     self.stdOutLogger.info(
@@ -2227,7 +3130,7 @@ class ParquetDataset(AbstractS3FileDataHandler):
 
         if returnNumPy:
             s3ParquetDF: ParquetDataset = \
-                self.map(partial(pandasMLPreproc.__call__, returnNumPy=True),
+                self.map(pandasMLPreproc.transformToNumPy,
                          inheritNRows=True, **kwargs)
 
         else:
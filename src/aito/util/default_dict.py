@@ -7,6 +7,19 @@ from typing import Any, Callable
 __all__ = ('DefaultDict',)
 
 
+class _ConstantFactory:
+    # pylint: disable=too-few-public-methods
+    """Picklable factory of a constant default value."""
+
+    def __init__(self, value: Any, /):
+        """Init constant factory."""
+        self.value: Any = value
+
+    def __call__(self) -> Any:
+        """Return constant value."""
+        return self.value
+
+
 class DefaultDict(dict):
     """Dict with Default Value."""
 
@@ -14,9 +27,8 @@ class DefaultDict(dict):
         """Init Default Dict."""
         super().__init__(*args, **kwargs)
 
-        self.default_factory: Callable[..., Any] = (default
-                                                    if callable(default)
-                                                    else (lambda: default))
+        self.default_factory: Callable[..., Any] = (
+            default if callable(default) else _ConstantFactory(default))
 
     def __getitem__(self, item: str, /) -> Any:
         """Get item."""
@@ -36,4 +48,5 @@ class DefaultDict(dict):
             self.default_factory: Callable[..., Any] = default
 
         elif default != self.default_factory():
-            self.default_factory: Callable[..., Any] = lambda: default
+            self.default_factory: Callable[..., Any] = \
+                _ConstantFactory(default)
@@ -1,20 +1,28 @@
 """AWS S3 utilities."""
 
 
+from collections.abc import Collection
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from logging import getLogger, Logger, INFO
 import os
+from pathlib import Path
+from threading import Lock
 import time
 from typing import Optional
+from urllib.parse import ParseResult, urlparse
 
 import botocore
 import boto3
+from boto3.s3.transfer import TransferConfig
 
 from aito.util.fs import PathType
 from aito.util.iter import to_iterable
 from aito.util.log import STDOUT_HANDLER
 
 
-__all__ = 'client', 'cp', 'mv', 'rm', 'sync'
+__all__ = ('client', 'Downloader', 'downloader', 'list_files', 'upload',
+           'delete', 'cp', 'mv', 'rm', 'sync')
 
 
 _LOGGER: Logger = getLogger(name=__name__)
@@ -22,7 +30,35 @@ _LOGGER.setLevel(level=INFO)
 _LOGGER.addHandler(hdlr=STDOUT_HANDLER)
 
 
+# max number of pooled HTTP connections per client
+_MAX_POOL_CONNECTIONS: int = 64
+
+# max number of objects downloaded concurrently
+_MAX_CONCURRENT_DOWNLOADS: int = 16
+
+# multipart (byte-range) download settings per object
+_MB: int = 1024 ** 2
+_TRANSFER_CONFIG: TransferConfig = TransferConfig(multipart_threshold=8 * _MB,
+                                                  multipart_chunksize=8 * _MB,
+                                                  max_concurrency=4,
+                                                  use_threads=True)
+
+# max number of objects deleted per request
+_MAX_N_KEYS_PER_DELETE: int = 1000
+
+
 _CLIENT = None
+_DOWNLOADER = None
+
+
+def _reset_after_fork():
+    # Boto3 clients & thread pools inherited from a parent process are unusable
+    # (pool threads do not survive fork), so forked children rebuild their own
+    global _CLIENT, _DOWNLOADER   # pylint: disable=global-statement
+    _CLIENT = _DOWNLOADER = None
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
 
 
 def client(region: Optional[str] = None,
@@ -40,12 +76,177 @@ def client(region: Optional[str] = None,
                                aws_access_key_id=access_key,
                                aws_secret_access_key=secret_key,
                                aws_session_token=None,
-                               config=botocore.client.Config(connect_timeout=9,
-                                                             read_timeout=9))
+                               config=botocore.client.Config(
+                                   connect_timeout=9,
+                                   read_timeout=9,
+                                   max_pool_connections=_MAX_POOL_CONNECTIONS))
 
     return _CLIENT
 
 
+def _bucket_and_key(s3_path: str) -> tuple[str, str]:
+    parsed_url: ParseResult = urlparse(url=s3_path, scheme='',
+                                       allow_fragments=True)
+    return parsed_url.netloc, parsed_url.path[1:]
+
+
+class Downloader:
+    """Concurrent S3 object downloader.
+
+    Downloads share 1 pooled Boto3 client & a bounded thread pool;
+    large objects are downloaded in concurrent byte-range parts.
+    Concurrent requests for the same object & local path
+    share the same in-flight future instead of re-downloading,
+    and objects whose local copies already match their S3 size
+    & modification time are not downloaded again.
+    """
+
+    def __init__(self, s3_client,
+                 max_workers: int = _MAX_CONCURRENT_DOWNLOADS):
+        """Init downloader."""
+        self.s3_client = s3_client
+
+        self._executor: ThreadPoolExecutor = \
+            ThreadPoolExecutor(max_workers=max_workers,
+                               thread_name_prefix=type(self).__name__)
+
+        # in-flight downloads only (completed ones are forgotten)
+        self._futures: dict[tuple[str, Path], Future] = {}
+        self._lock: Lock = Lock()
+
+    def _download(self, s3_path: str, local_path: Path) -> Path:
+        bucket, key = _bucket_and_key(s3_path)
+
+        metadata: dict = self.s3_client.head_object(Bucket=bucket, Key=key)
+        size: int = metadata['ContentLength']
+        mtime: float = metadata['LastModified'].timestamp()
+
+        # skip objects already downloaded & unchanged since
+        # (local copies are stamped with their S3 modification times)
+        if local_path.is_file() and \
+                ((stat := local_path.stat()).st_size == size) and \
+                (stat.st_mtime == mtime):
+            return local_path
+
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # download to a temporary file then rename,
+        # so that partially-downloaded files are never visible at local path
+        tmp_local_path: Path = \
+            local_path.with_name(f'{local_path.name}.{os.getpid()}.part')
+
+        self.s3_client.download_file(Bucket=bucket,
+                                     Key=key,
+                                     Filename=str(tmp_local_path),
+                                     Config=_TRANSFER_CONFIG)
+
+        os.utime(tmp_local_path, times=(mtime, mtime))
+        os.replace(tmp_local_path, local_path)
+
+        return local_path
+
+    def _forget(self, key: tuple[str, Path], future: Future):
+        with self._lock:
+            if self._futures.get(key) is future:
+                del self._futures[key]
+
+    def submit(self, s3_path: str, local_path: PathType) -> Future:
+        """Submit download of an S3 object to a local path."""
+        local_path: Path = Path(local_path)
+        key: tuple[str, Path] = s3_path, local_path
+        is_new: bool = False
+
+        with self._lock:
+            if (future := self._futures.get(key)) is None:
+                self._futures[key] = future = \
+                    self._executor.submit(self._download, s3_path, local_path)
+                is_new: bool = True
+
+        # (outside lock: callback runs immediately if already done)
+        if is_new:
+            future.add_done_callback(partial(self._forget, key))
+
+        return future
+
+    def download(self, s3_path: str, local_path: PathType) -> Path:
+        """Download an S3 object to a local path, waiting for completion."""
+        return self.submit(s3_path=s3_path, local_path=local_path).result()
+
+    def download_many(self,
+                      s3_and_local_paths: Collection[tuple[str, PathType]]) \
+            -> list[Path]:
+        """Download S3 objects concurrently, waiting for completion."""
+        futures: list[Future] = [self.submit(s3_path=s3_path,
+                                             local_path=local_path)
+                                 for s3_path, local_path in s3_and_local_paths]
+
+        return [future.result() for future in futures]
+
+
+def downloader(region: Optional[str] = None,
+               access_key: Optional[str] = None,
+               secret_key: Optional[str] = None) -> Downloader:
+    """Get concurrent S3 downloader (1 per process)."""
+    global _DOWNLOADER   # pylint: disable=global-statement
+
+    if _DOWNLOADER is None:
+        _DOWNLOADER = Downloader(s3_client=client(region=region,
+                                                  access_key=access_key,
+                                                  secret_key=secret_key))
+
+    return _DOWNLOADER
+
+
+def list_files(dir_path: str, *, suffix: str = '') -> list[str]:
+    """List S3 paths of files directly under an S3 directory."""
+    bucket, prefix = _bucket_and_key(f"{dir_path.rstrip('/')}/")
+
+    return [f's3://{bucket}/{obj["Key"]}'
+            for page in (client().get_paginator('list_objects_v2')
+                         .paginate(Bucket=bucket, Prefix=prefix,
+                                   Delimiter='/'))
+            for obj in page.get('Contents', [])
+            if obj['Key'].endswith(suffix)]
+
+
+def upload(local_path: PathType, s3_path: str):
+    """Upload a local file to an S3 path.
+
+    The local file is then stamped with the object's S3 modification time,
+    so that downloading the object back to it is skipped.
+    """
+    bucket, key = _bucket_and_key(s3_path)
+
+    client().upload_file(Filename=str(local_path),
+                         Bucket=bucket,
+                         Key=key,
+                         Config=_TRANSFER_CONFIG)
+
+    mtime: float = (client().head_object(Bucket=bucket, Key=key)
+                    ['LastModified'].timestamp())
+    os.utime(local_path, times=(mtime, mtime))
+
+
+def delete(s3_paths: Collection[str]):
+    """Delete S3 objects, raising upon any failure."""
+    keys_by_bucket: dict[str, list[str]] = {}
+
+    for s3_path in s3_paths:
+        bucket, key = _bucket_and_key(s3_path)
+        keys_by_bucket.setdefault(bucket, []).append(key)
+
+    for bucket, keys in keys_by_bucket.items():
+        for i in range(0, len(keys), _MAX_N_KEYS_PER_DELETE):
+            errors: list[dict] = client().delete_objects(
+                Bucket=bucket,
+                Delete={'Objects': [{'Key': key} for key in
+                                    keys[i:(i + _MAX_N_KEYS_PER_DELETE)]],
+                        'Quiet': True}).get('Errors', [])
+
+            assert not errors, \
+                OSError(f'*** CANNOT DELETE S3 OBJECTS: {errors} ***')
+
+
 def cp(from_path: PathType, to_path: PathType,
        *, is_dir: bool = True,
        quiet: bool = True, verbose: bool = True):
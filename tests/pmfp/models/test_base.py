@@ -0,0 +1,53 @@
+"""Base fault prediction model tests."""
+
+
+from pathlib import Path
+
+from numpy.random import default_rng
+from pandas import DataFrame, Series
+from pandas.testing import assert_series_equal
+
+from aito.pmfp.data_mgmt import EQUIPMENT_INSTANCE_ID_COL, DATE_COL
+from aito.pmfp.models.base import BaseFaultPredictor
+from aito.util.data_proc import ParquetDataset
+
+
+class _HighTemperaturePredictor(BaseFaultPredictor):
+    """Deterministic (hence comparable) rule-based predictor."""
+
+    def predict(self, df_for_1_equipment_unit_for_1_day: DataFrame, /,
+                threshold: float = 0.) -> bool:
+        # pylint: disable=arguments-differ
+        return bool(df_for_1_equipment_unit_for_1_day.temperature.max() >
+                    threshold)
+
+
+def _equipment_dataset(dir_path: Path, /) -> ParquetDataset:
+    """Write date-partitioned data of 5 equipment units, interleaved."""
+    rng = default_rng(seed=0)
+
+    for date in ('2022-01-01', '2022-01-02', '2022-01-03'):
+        (partition_dir_path := dir_path / f'{DATE_COL}={date}').mkdir()
+
+        DataFrame(data={
+            EQUIPMENT_INSTANCE_ID_COL: [f'e{i % 5}' for i in range(20)],
+            'temperature': rng.normal(size=20)}) \
+            .to_parquet(partition_dir_path / 'part.parquet', index=False)
+
+    return ParquetDataset(str(dir_path), verbose=False)
+
+
+def test_parallel_batch_predict_matches_serial(tmp_path: Path):
+    """Process-pool batch predictions keep serial values, index & order."""
+    model: BaseFaultPredictor = _HighTemperaturePredictor(
+        general_type='refrig', unique_type_group='co2_mid_1_compressor')
+    parquet_ds: ParquetDataset = _equipment_dataset(tmp_path)
+
+    serial_preds: Series = model.batch_predict(parquet_ds, threshold=.5)
+    assert len(serial_preds) == 3 * 5
+
+    assert_series_equal(model.batch_predict(parquet_ds,
+                                            n_workers=2,
+                                            n_groups_per_task=2,
+                                            threshold=.5),
+                        serial_preds)
@@ -0,0 +1,64 @@
+"""Batch prediction output tests."""
+
+
+from pathlib import Path
+
+from pandas import DataFrame
+import pytest
+
+from aito.pmfp.data_mgmt import EQUIPMENT_INSTANCE_ID_COL, DATE_COL
+from aito.pmfp.models.batch_output import PartitionedParquetPredictionWriter
+
+
+def _preds(date: str, teacher_faults, student_faults, faults) -> DataFrame:
+    return DataFrame(data={EQUIPMENT_INSTANCE_ID_COL: ['a', 'b', 'c'],
+                           DATE_COL: [date] * 3,
+                           'TEACHER_FAULT': teacher_faults,
+                           'STUDENT_FAULT_PROBA': [.9, .1, .2],
+                           'STUDENT_FAULT': student_faults,
+                           'FAULT': faults}) \
+        .set_index(keys=[EQUIPMENT_INSTANCE_ID_COL, DATE_COL])
+
+
+def test_positives_by_any_component(tmp_path: Path):
+    """Rows with any positive component prediction are positive."""
+    with PartitionedParquetPredictionWriter(tmp_path / 'out') as writer:
+        positives: DataFrame = writer.write(
+            _preds('2022-01-01',
+                   teacher_faults=[True, None, False],
+                   student_faults=[False, True, False],
+                   faults=[False, False, False]))
+
+    assert list(positives.index.get_level_values(
+        EQUIPMENT_INSTANCE_ID_COL)) == ['a', 'b']
+    assert writer.total == {'n_equipment_days': 3, 'n_faults': 2}
+
+
+def test_partitions_swapped_in_only_upon_success(tmp_path: Path):
+    """Failed runs leave previous partitions & no staged parts behind."""
+    out_dir_path: Path = tmp_path / 'out'
+    no_faults: list = [False] * 3
+
+    with PartitionedParquetPredictionWriter(out_dir_path) as writer:
+        writer.write(_preds('2022-01-01', no_faults, no_faults, no_faults))
+
+    previous_parts: list = \
+        sorted(out_dir_path.glob(f'{DATE_COL}=*/*.parquet'))
+    assert len(previous_parts) == 1
+
+    with pytest.raises(RuntimeError):
+        with PartitionedParquetPredictionWriter(out_dir_path) as writer:
+            writer.write(_preds('2022-01-01', no_faults, no_faults, no_faults))
+            writer.write(_preds('2022-01-02', no_faults, no_faults, no_faults))
+            raise RuntimeError
+
+    assert sorted(out_dir_path.glob(f'{DATE_COL}=*/*.parquet')) == \
+        previous_parts
+    assert [path.name for path in tmp_path.iterdir()] == ['out']
+
+    with PartitionedParquetPredictionWriter(out_dir_path) as writer:
+        writer.write(_preds('2022-01-01', no_faults, no_faults, no_faults))
+        writer.write(_preds('2022-01-01', no_faults, no_faults, no_faults))
+
+    assert len(list((out_dir_path / f'{DATE_COL}=2022-01-01').iterdir())) == 2
+    assert [path.name for path in tmp_path.iterdir()] == ['out']
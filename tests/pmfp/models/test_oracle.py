@@ -0,0 +1,128 @@
+"""Fault prediction oracle & student model tests."""
+
+
+from numpy.random import default_rng
+from pandas import DataFrame, Series
+from pandas.testing import assert_series_equal
+import pytest
+from sklearn.neural_network import MLPClassifier
+
+from aito.pmfp.data_mgmt import EQUIPMENT_INSTANCE_ID_COL, DATE_COL
+from aito.pmfp.models.oracle import FaultPredOracle
+from aito.pmfp.models.oracle.student.timeseries_dl import \
+    TimeSeriesDLFaultPredStudent
+from aito.pmfp.models.oracle.teacher.base import BaseFaultPredTeacher
+from aito.util.data_proc import PandasMLPreprocessor
+from aito.util.data_types.spark_sql import _STR_TYPE
+from aito.util.namespace import Namespace
+
+
+_N_ROWS_PER_DAY: int = 4
+
+
+class _HighNumTeacher(BaseFaultPredTeacher):
+    """Deterministic rule-based teacher."""
+
+    def predict(self, df_for_1_equipment_unit_for_1_day: DataFrame, /) \
+            -> bool:
+        return bool(df_for_1_equipment_unit_for_1_day.num.max() > 1)
+
+
+def _student() -> TimeSeriesDLFaultPredStudent:
+    preprocessor: PandasMLPreprocessor = PandasMLPreprocessor(
+        origToPreprocColMap=Namespace(**{
+            'strCat': {'logical-type': 'cat',
+                       'physical-type': _STR_TYPE,
+                       'n-cats': 2,
+                       'sorted-cats': ['a', 'b'],
+                       'transform-to': '__CAT__strCat'},
+            'num': {'logical-type': 'num',
+                    'physical-type': 'double',
+                    'nulls': (None, None),
+                    'null-fill-method': 'mean',
+                    'null-fill-value': 0.0,
+                    'mean': 0.0,
+                    'std': 1.0,
+                    'max-abs': 3.0,
+                    'orig-min': -3.0,
+                    'orig-max': 3.0,
+                    'transform-to': '__STD_SCL__num'},
+            '__CAT_IDX_SCALED__': True,
+            '__NUM_SCALER__': 'standard'}))
+
+    rng = default_rng(seed=0)
+    x = rng.normal(size=(100, 2 * _N_ROWS_PER_DAY))
+
+    return TimeSeriesDLFaultPredStudent(
+        teacher=_HighNumTeacher(general_type='refrig',
+                                unique_type_group='co2_mid_1_compressor'),
+        input_cat_cols=['strCat'],
+        input_num_cols=['num'],
+        input_subsampling_factor=1,
+        input_n_rows_per_day=_N_ROWS_PER_DAY,
+        preprocessor=preprocessor,
+        native_obj=MLPClassifier(hidden_layer_sizes=(4,),
+                                 max_iter=20,
+                                 random_state=0).fit(X=x, y=x[:, -1] > 0),
+        decision_threshold=.5)
+
+
+def _equipment_data() -> DataFrame:
+    """Get 2 days of full-length data of 3 equipment units, interleaved."""
+    rng = default_rng(seed=1)
+    n_rows_per_date: int = 3 * _N_ROWS_PER_DAY
+    n_rows: int = 2 * n_rows_per_date
+
+    return DataFrame(data={
+        EQUIPMENT_INSTANCE_ID_COL: [f'e{i % 3}' for i in range(n_rows)],
+        DATE_COL: (['2022-01-01'] * n_rows_per_date +
+                   ['2022-01-02'] * n_rows_per_date),
+        'strCat': rng.choice(['a', 'b', 'z'], size=n_rows),
+        'num': rng.normal(size=n_rows)})
+
+
+def _per_group(func, df: DataFrame, /) -> Series:
+    return df.groupby(by=[EQUIPMENT_INSTANCE_ID_COL, DATE_COL],
+                      sort=False).apply(func)
+
+
+def test_student_predict_many_matches_per_day_predict():
+    """1 vectorized scoring pass equals scoring day by day, in order."""
+    student: TimeSeriesDLFaultPredStudent = _student()
+    df: DataFrame = _equipment_data()
+
+    assert_series_equal(
+        student.predict_many(df, return_binary=False),
+        _per_group(lambda group_df: student.predict(group_df,
+                                                    return_binary=False),
+                   df),
+        check_names=False)
+
+
+def test_oracle_predictions_match_component_predictions():
+    """Oracle's single-scan predictions combine its components' ones."""
+    student: TimeSeriesDLFaultPredStudent = _student()
+    oracle: FaultPredOracle = FaultPredOracle(teacher=student.teacher,
+                                              student=student)
+    df: DataFrame = _equipment_data()
+
+    preds: DataFrame = oracle.predict_many_detailed(df)
+
+    assert_series_equal(preds.TEACHER_FAULT,
+                        student.teacher.predict_many(df),
+                        check_names=False)
+    assert_series_equal(preds.STUDENT_FAULT_PROBA,
+                        student.predict_many(df, return_binary=False),
+                        check_names=False)
+    assert_series_equal(preds.STUDENT_FAULT,
+                        preds.STUDENT_FAULT_PROBA > student.decision_threshold,
+                        check_names=False)
+    assert_series_equal(preds.FAULT,
+                        preds.TEACHER_FAULT | preds.STUDENT_FAULT,
+                        check_names=False)
+
+    assert list(oracle.predict_many(df)) == list(_per_group(oracle.predict,
+                                                            df))
+
+    with pytest.raises(AssertionError):
+        oracle.predict_many_detailed(df, return_binary=False)
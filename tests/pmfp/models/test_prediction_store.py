@@ -0,0 +1,53 @@
+"""Prediction store tests."""
+
+
+from pathlib import Path
+
+from pandas import Series
+from pandas.testing import assert_series_equal
+
+from aito.pmfp.data_mgmt import EQUIPMENT_INSTANCE_ID_COL, DATE_COL
+from aito.pmfp.models.prediction_store import PredictionStore
+
+
+def _preds(date: str, faults: list) -> Series:
+    return Series(data=faults, name='FAULT', index=[
+        [f'e{i}' for i in range(len(faults))], [date] * len(faults)]) \
+        .rename_axis(index=[EQUIPMENT_INSTANCE_ID_COL, DATE_COL])
+
+
+def test_only_dates_of_stored_versions_are_reused(tmp_path: Path):
+    """Changed or unknown data versions must be re-scored."""
+    store: PredictionStore = PredictionStore(url=str(tmp_path),
+                                             local_dir_path=tmp_path)
+
+    store.save(preds=_preds('2022-01-01', [True, False]),
+               versions={'2022-01-01': 'v1', '2022-01-02': 'v1'})
+
+    assert store.stored_dates(versions={'2022-01-01': 'v1',
+                                        '2022-01-02': 'v2',
+                                        '2022-01-03': None}) == \
+        {'2022-01-01'}
+
+    assert_series_equal(store.load(versions={'2022-01-01': 'v1'}),
+                        _preds('2022-01-01', [True, False]))
+
+    # empty (i.e., scored without predictions) dates are stored too
+    assert store.load(versions={'2022-01-02': 'v1'}).empty
+
+
+def test_saving_new_version_replaces_other_versions(tmp_path: Path):
+    """Only the latest stored version of each date is kept."""
+    store: PredictionStore = PredictionStore(url=str(tmp_path),
+                                             local_dir_path=tmp_path)
+
+    store.save(preds=_preds('2022-01-01', [True]),
+               versions={'2022-01-01': 'v1'})
+    store.save(preds=_preds('2022-01-01', [False]),
+               versions={'2022-01-01': 'v2'})
+
+    assert not store.stored_dates(versions={'2022-01-01': 'v1'})
+    assert [path.name for path in tmp_path.iterdir()] == \
+        [f'{DATE_COL}=2022-01-01--version=v2.parquet']
+    assert_series_equal(store.load(versions={'2022-01-01': 'v2'}),
+                        _preds('2022-01-01', [False]))
@@ -0,0 +1,44 @@
+"""Batch fault prediction CLI tests."""
+
+
+from pathlib import Path
+
+from aito.pmfp.tools.oracle.exec import (_load_checkpoint,
+                                         _new_partition_versions,
+                                         _save_checkpoint)
+
+
+def test_checkpoint_round_trip_with_str_date_keys(tmp_path: Path):
+    """Checkpoints round-trip, incl. YAML-parsed date keys as str."""
+    checkpoint_url: str = str(tmp_path / 'checkpoint' / 'checkpoint.yaml')
+
+    assert _load_checkpoint(checkpoint_url) == {}
+
+    checkpoint: dict = {'group-1': {'2022-01-01': 'v1', '2022-01-02': None},
+                        'group-2': {}}
+    _save_checkpoint(checkpoint, checkpoint_url)
+    assert _load_checkpoint(checkpoint_url) == checkpoint
+
+    # unquoted YAML dates are parsed as dates
+    Path(checkpoint_url).write_text('group-1:\n  2022-01-01: v1\n',
+                                    encoding='utf-8')
+    assert _load_checkpoint(checkpoint_url) == \
+        {'group-1': {'2022-01-01': 'v1'}}
+
+
+def test_new_or_changed_or_unknown_versions_selected():
+    """Unchanged dates are skipped; unknown versions are re-processed."""
+    processed_versions: dict = {'2022-01-01': 'v1',
+                                '2022-01-02': 'v1',
+                                '2022-01-03': None}
+
+    assert _new_partition_versions({'2021-12-31': 'v1',
+                                    '2022-01-01': 'v1',
+                                    '2022-01-02': 'v2',
+                                    '2022-01-03': None,
+                                    '2022-01-04': 'v1',
+                                    '2022-01-05': 'v1'},
+                                   processed_versions,
+                                   date='2022-01-01',
+                                   to_date='2022-01-04') == \
+        {'2022-01-02': 'v2', '2022-01-03': None, '2022-01-04': 'v1'}
@@ -0,0 +1,144 @@
+"""Pandas data processor tests."""
+
+
+from numpy import float32, isnan, nan
+from numpy.testing import assert_allclose
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+import pytest
+
+from aito.util.data_proc.pandas import (PandasFlatteningSubsampler,
+                                        PandasMLPreprocessor)
+from aito.util.data_types.spark_sql import _STR_TYPE
+from aito.util.namespace import Namespace
+
+
+# pylint: disable=invalid-name
+# e.g., camelCase names
+
+
+def _preprocessor(numScaler: str = 'standard') -> PandasMLPreprocessor:
+    return PandasMLPreprocessor(origToPreprocColMap=Namespace(**{
+        'strCat': {'logical-type': 'cat',
+                   'physical-type': _STR_TYPE,
+                   'n-cats': 2,
+                   'sorted-cats': ['a', 'b'],
+                   'transform-to': '__CAT__strCat'},
+        'floatCat': {'logical-type': 'cat',
+                     'physical-type': 'double',
+                     'n-cats': 3,
+                     'sorted-cats': [-3.0, 1.0, 2.5],
+                     'transform-to': '__CAT__floatCat'},
+        'num': {'logical-type': 'num',
+                'physical-type': 'double',
+                'nulls': (-100.0, 100.0),
+                'null-fill-method': 'mean',
+                'null-fill-value': 0.0,
+                'mean': 1.0,
+                'std': 2.0,
+                'max-abs': 50.0,
+                'orig-min': -50.0,
+                'orig-max': 50.0,
+                'transform-to': '__STD_SCL__num'},
+        '__CAT_IDX_SCALED__': True,
+        '__NUM_SCALER__': numScaler}))
+
+
+def _dataFrame() -> DataFrame:
+    return DataFrame(data={'strCat': ['a', 'b', None, 'z', 'a'],
+                           'floatCat': [1.0, nan, 2.5, -3.0 + 1e-12, 7.0],
+                           'num': [3.0, nan, -5.0, 1e3, 0.5]})
+
+
+@pytest.mark.parametrize('numScaler', ['standard', 'maxabs', 'minmax'])
+def test_compiled_transform_matches_call(numScaler: str):
+    """Compiled transform must match the column-by-column ``__call__``."""
+    preprocessor: PandasMLPreprocessor = _preprocessor(numScaler=numScaler)
+    df: DataFrame = _dataFrame()
+
+    assert_allclose(preprocessor.transformToNumPy(df),
+                    preprocessor(df.copy(), returnNumPy=True).astype(float32),
+                    rtol=1e-6, atol=1e-6)
+
+
+def test_null_categoricals_map_to_n_cats():
+    """NULLs of plain & nullable extension types map to the OOV index."""
+    preprocessor: PandasMLPreprocessor = _preprocessor()
+
+    df: DataFrame = _dataFrame()
+    df['strCat'] = df['strCat'].astype('string')
+    df['floatCat'] = df['floatCat'].astype('Float64')
+
+    out = preprocessor.transformToNumPy(df)
+    assert not isnan(out).any()
+
+    # scaled index of NULL / OOV (= n-cats) is 1
+    strCatIdx: int = preprocessor.sortedPreprocCols.index('__CAT__strCat')
+    floatCatIdx: int = preprocessor.sortedPreprocCols.index('__CAT__floatCat')
+    assert out[2, strCatIdx] == out[3, strCatIdx] == 1
+    assert out[1, floatCatIdx] == out[4, floatCatIdx] == 1
+
+
+def test_nullable_dtypes_transform_like_numpy_dtypes():
+    """Nullable extension types (with NA) must preprocess as NumPy dtypes."""
+    preprocessor: PandasMLPreprocessor = _preprocessor()
+
+    df: DataFrame = _dataFrame()
+
+    assert_allclose(
+        preprocessor.transformToNumPy(df.astype({'strCat': 'string',
+                                                 'floatCat': 'Float64',
+                                                 'num': 'Float64'})),
+        preprocessor.transformToNumPy(df),
+        rtol=1e-6, atol=1e-6)
+
+
+def test_update_copies_caps_counts_and_excludes_outliers():
+    """Updates must not mutate (shared) preprocessors, nor count outliers."""
+    # pylint: disable=protected-access
+    preprocessor: PandasMLPreprocessor = _preprocessor(numScaler='minmax')
+    preprocessor.origToPreprocColMap['num'][
+        PandasMLPreprocessor._OUTLIER_RST_RANGE_KEY] = -50.0, 50.0
+
+    updated: PandasMLPreprocessor = preprocessor.update(
+        DataFrame(data={'strCat': list('aaaabbbccd'),
+                        'floatCat': [1.0] * 10,
+                        'num': [-10.0, 10.0, 60.0, 99.0, -1e3, nan,
+                                0.0, 0.0, 0.0, 0.0]}),
+        maxNCats=2)
+
+    assert PandasMLPreprocessor._RUNNING_CAT_COUNTS_KEY not in \
+        preprocessor.origToPreprocColMap['strCat']
+
+    assert dict(updated.origToPreprocColMap['strCat'][
+        PandasMLPreprocessor._RUNNING_CAT_COUNTS_KEY]) == {'a': 4, 'b': 3}
+
+    refitted: PandasMLPreprocessor = updated.refit()
+    assert tuple(refitted.origToPreprocColMap['strCat']['sorted-cats']) == \
+        ('a', 'b')
+    assert refitted.origToPreprocColMap['num']['orig-min'] == -10.0
+    assert refitted.origToPreprocColMap['num']['orig-max'] == 10.0
+    assert preprocessor.origToPreprocColMap['num']['orig-min'] == -50.0
+
+
+@pytest.mark.parametrize('padWithLastRow', [False, True])
+@pytest.mark.parametrize('by', [('id',), ('id', 'date')])
+def test_flatten_groups_matches_grouped_call(padWithLastRow: bool, by: tuple):
+    """Vectorized grouped flattening must match per-group ``__call__``."""
+    subsampler: PandasFlatteningSubsampler = \
+        PandasFlatteningSubsampler(columns=('x', 'y'),
+                                   everyNRows=2, totalNRows=6)
+
+    # unequal, interleaved groups (incl. ones too short & too long),
+    # & rows with NULL group keys
+    df: DataFrame = DataFrame(data={'id': ['b', 'a', 'b', None, 'a', 'b',
+                                           'c', 'b', 'b', 'b', 'b', 'b'],
+                                    'date': ['d1'] * 12,
+                                    'x': [float(i) for i in range(12)],
+                                    'y': [10. * i for i in range(12)]})
+
+    assert_frame_equal(
+        subsampler.flattenGroups(df, by=by, padWithLastRow=padWithLastRow),
+        df.groupby(by=list(by), sort=False, dropna=True)[['x', 'y']]
+        .apply(func=subsampler, padWithLastRow=padWithLastRow),
+        check_dtype=False)
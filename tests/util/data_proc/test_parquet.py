@@ -0,0 +1,156 @@
+"""Parquet data set tests."""
+
+
+from pathlib import Path
+
+from numpy.random import default_rng
+from pandas import DataFrame, Series, concat
+from pandas.testing import assert_frame_equal, assert_series_equal
+import pytest
+
+from aito.util.data_proc.parquet import (ParquetDataset,
+                                         _arrowFiltersFromCondition,
+                                         _QueryFilter)
+
+
+# pylint: disable=invalid-name,protected-access
+# e.g., camelCase names
+
+
+_DATES: tuple[str, ...] = ('2023-01-01', '2023-01-02',
+                           '2023-01-03', '2023-01-04')
+_N_ROWS_PER_DATE: int = 50
+
+
+def _writeDataset(dirPath: Path, /) -> str:
+    """Write tiny date-partitioned local Parquet data set."""
+    rng = default_rng(seed=0)
+
+    for i, date in enumerate(_DATES):
+        x = rng.normal(size=_N_ROWS_PER_DATE)
+        x[rng.random(size=_N_ROWS_PER_DATE) < .1] = float('nan')
+
+        (partitionDirPath := dirPath / f'date={date}').mkdir()
+
+        DataFrame(dict(
+            i=range(i * _N_ROWS_PER_DATE, (i + 1) * _N_ROWS_PER_DATE),
+            x=x,
+            n=rng.integers(low=0, high=100, size=_N_ROWS_PER_DATE),
+            c=rng.choice(['p', 'q', 'r'], size=_N_ROWS_PER_DATE),
+            k=rng.choice(['u', 'v', None], size=_N_ROWS_PER_DATE))
+        ).to_parquet(partitionDirPath / 'part.parquet', index=False)
+
+    return str(dirPath)
+
+
+def _assertProfilesEqual(profile, otherProfile, /):
+    assert set(profile) == set(otherProfile)
+
+    for k in profile:
+        if isinstance(v := profile[k], Series):
+            assert_series_equal(v, otherProfile[k])
+        else:
+            assert v == pytest.approx(otherProfile[k])
+
+
+def test_arrow_filters_exact_for_simple_conjunctions():
+    """Fully translatable conditions are flagged as exact."""
+    assert _arrowFiltersFromCondition(
+        "a == 1 and 'x' <= b and c in ['p', 'q']") == (
+            (('a', '==', 1), ('b', '>=', 'x'), ('c', 'in', ['p', 'q'])),
+            True)
+
+
+def test_arrow_filters_inexact_when_conjuncts_skipped():
+    """Skipped conjuncts (e.g., != or expressions) make filters inexact."""
+    assert _arrowFiltersFromCondition('a == 1 and b != 2') == (
+        (('a', '==', 1),), False)
+    assert _arrowFiltersFromCondition('a + 1 > 2') == ((), False)
+    assert _arrowFiltersFromCondition('`a b` == 1') == ((), False)
+
+    assert not _QueryFilter('a > 0 or b > 0').arrowExact
+
+
+def test_bulk_profile_matches_per_column_profiles(tmp_path: Path):
+    """Profiling many columns in bulk equals profiling them one by one."""
+    path: str = _writeDataset(tmp_path)
+    cols: tuple[str, ...] = ('x', 'n', 'c', 'k')
+
+    # separate data set instances have separate profiling caches
+    bulkProfiles = ParquetDataset(path, seed=0, verbose=False).profile(
+        *cols, verbose=False)
+    ds: ParquetDataset = ParquetDataset(path, seed=0, verbose=False)
+
+    for col in cols:
+        _assertProfilesEqual(bulkProfiles[col],
+                             ds.profile(col, verbose=False))
+
+
+def _doubleX(df: DataFrame) -> DataFrame:
+    """Picklable mapper (for process-pool reduction)."""
+    return df.assign(x2=df.x * 2)
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_parallel_reduce_matches_serial_reduce(tmp_path: Path,
+                                               executor: str):
+    """Parallel executors reduce to the same result, in the same order."""
+    ds: ParquetDataset = ParquetDataset(_writeDataset(tmp_path),
+                                        verbose=False).map(_doubleX)
+
+    assert_frame_equal(ds.reduce(executor=executor, nWorkers=2,
+                                 verbose=False),
+                       ds.reduce(executor='serial', verbose=False))
+
+
+def test_seeded_samples_reproducible(tmp_path: Path):
+    """Data sets with the same seed draw the same samples."""
+    path: str = _writeDataset(tmp_path)
+
+    samples: list[DataFrame] = [
+        ParquetDataset(path, reprSampleMinNFiles=2, seed=0, verbose=False)
+        .sample(n=60, verbose=False)
+        for _ in range(2)]
+
+    assert len(samples[0]) < len(_DATES) * _N_ROWS_PER_DATE
+    assert_frame_equal(*samples)
+
+
+def test_subset_covers_exactly_selected_files(tmp_path: Path):
+    """Subsets read exactly their selected files, never an empty one."""
+    ds: ParquetDataset = ParquetDataset(_writeDataset(tmp_path),
+                                        verbose=False)
+    filePaths: list[str] = sorted(ds.filePaths)[1:3]
+
+    subset: ParquetDataset = ds._subset(*filePaths)
+    assert subset.filePaths == set(filePaths)
+    assert sorted(subset.reduce(cols='i', verbose=False).i) == \
+        list(range(_N_ROWS_PER_DATE, 3 * _N_ROWS_PER_DATE))
+
+    assert ds._subset(*ds.filePaths) is ds
+
+    with pytest.raises(AssertionError):
+        ds._subset()
+
+
+def test_filter_by_partition_keys_cached(tmp_path: Path):
+    """Partition filters select matching files & are cached per data set."""
+    ds: ParquetDataset = ParquetDataset(_writeDataset(tmp_path),
+                                        verbose=False)
+    dates: tuple[str, ...] = _DATES[1:3]
+
+    subset: ParquetDataset = ds.filterByPartitionKeys(('date', dates))
+    assert subset.distinctPartitions('date') == set(dates)
+    assert ds.filterByPartitionKeys(('date', dates)) is subset
+
+
+def test_batches_concatenate_to_reduced_data(tmp_path: Path):
+    """Chunked batches cover all rows of all files, in file order."""
+    ds: ParquetDataset = ParquetDataset(_writeDataset(tmp_path),
+                                        verbose=False)
+
+    assert_frame_equal(
+        concat(ds.iterBatches(cols=('i', 'x'), batchRows=20, verbose=False),
+               ignore_index=True),
+        ds.reduce(cols=('i', 'x'), verbose=False).reset_index(drop=True),
+        check_like=True)
@@ -0,0 +1,45 @@
+"""Quantile sketch tests."""
+
+
+from numpy import array_split, linspace, searchsorted, sort
+from numpy.random import default_rng
+from numpy.testing import assert_allclose
+from pandas import Series
+import pytest
+
+from aito.util.data_proc._sketch import QuantileSketch, nPointsForRankError
+
+
+# pylint: disable=invalid-name
+# e.g., camelCase names
+
+
+@pytest.mark.parametrize('rankError', [.05, .01, .001])
+def test_merged_sketch_rank_error(rankError: float):
+    """Per-chunk sketches merged once stay within the requested rank error."""
+    values = default_rng(seed=0).lognormal(size=100_000)
+    maxNPoints: int = nPointsForRankError(rankError)
+
+    sketch: QuantileSketch = QuantileSketch.merge(
+        [QuantileSketch.fromValues(chunk, maxNPoints=maxNPoints)
+         for chunk in array_split(values, 37)])
+
+    sortedValues = sort(values)
+    qs = linspace(0, 1, 201)
+
+    ranks = searchsorted(sortedValues, sketch.quantile(qs).to_numpy(),
+                         side='right') / len(values)
+
+    assert (abs(ranks - qs) <= rankError + 1 / len(values)).all()
+
+
+def test_small_sketch_quantiles_exact():
+    """Sketches of fewer values than points match pandas' quantiles."""
+    values = Series(default_rng(seed=1).normal(size=50)).astype(float)
+    values.iloc[::7] = None
+
+    qs = [0, .1, .25, .5, .9, 1]
+
+    assert_allclose(QuantileSketch.fromValues(values, maxNPoints=100)
+                    .quantile(qs).to_numpy(),
+                    values.quantile(qs, interpolation='linear').to_numpy())